@@ -1,22 +1,30 @@
 """Solar Window System integration for Home Assistant."""
 
 import logging
+from functools import partial
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
-from homeassistant.helpers.storage import Store
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.typing import ConfigType
 
 from .const import (
     CONF_OVERRIDES,
+    DEFAULT_SUBENTRY_DEBOUNCE,
     DOMAIN,
-    STORAGE_KEY,
-    STORAGE_VERSION,
+    LEVEL_GROUP,
+    LEVEL_WINDOW,
 )
 from .coordinator import SolarCalculationCoordinator
+from .reconcile import EntityReconciler, async_remove_subentry_entities
+from .services import async_setup_services
+from .store import ConfigStore, ResultStore
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,6 +37,14 @@ PLATFORMS = [
     "diagnostic_sensor",
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Solar Window System services."""
+    async_setup_services(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Solar Window System from a config entry."""
@@ -39,8 +55,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     config = dict(entry.data)
 
     # Load overrides from storage (if any)
-    store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
-    stored_data = await store.async_load() or {}
+    store = ConfigStore(hass)
+    stored_data = await store.async_load()
     overrides = stored_data.get(CONF_OVERRIDES, {})
 
     # Build subentries dict from entry.subentries (proper HA 2026.4+ API)
@@ -53,29 +69,42 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 "name": subentry.title,
             }
 
-    # Check if coordinator already exists (reload scenario)
-    existing_coordinator = hass.data.get(DOMAIN, {}).get(entry.entry_id, {}).get("coordinator")
-
     # Create coordinator with subentries and overrides
     coordinator = SolarCalculationCoordinator(hass, config, subentries, overrides, entry)
     coordinator.set_store(store)
+    result_store = ResultStore(hass, entry.entry_id)
+    coordinator.set_result_store(result_store)
 
-    if existing_coordinator:
-        # Reload: use regular refresh instead of first_refresh
-        await coordinator.async_request_refresh()
-    else:
-        # First setup: use first_refresh
-        await coordinator.async_config_entry_first_refresh()
+    # Warm start: entities show the last results until the first calculation is done
+    await coordinator.async_load_snapshot()
 
     # Store coordinator and references
     hass.data[DOMAIN][entry.entry_id]["coordinator"] = coordinator
     hass.data[DOMAIN][entry.entry_id]["config"] = config
     hass.data[DOMAIN][entry.entry_id]["store"] = store
+    hass.data[DOMAIN][entry.entry_id]["result_store"] = result_store
+    hass.data[DOMAIN][entry.entry_id]["reconciler"] = EntityReconciler(coordinator)
+
+    # Coalesce bursts of subentry changes (e.g. onboarding many windows) into one pass
+    reconcile_debouncer = Debouncer(
+        hass,
+        _LOGGER,
+        cooldown=DEFAULT_SUBENTRY_DEBOUNCE,
+        immediate=False,
+        function=partial(_async_reconcile_subentries, hass, entry),
+    )
+    hass.data[DOMAIN][entry.entry_id]["reconcile_debouncer"] = reconcile_debouncer
+    entry.async_on_unload(reconcile_debouncer.async_cancel)
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # Run initial config validation
-    coordinator.validate_configuration()
+    # Calculate and validate once Home Assistant has started, so a slow weather
+    # provider or many windows do not hold up the boot
+    entry.async_on_unload(
+        async_at_started(hass, partial(_async_start_coordinator, entry, coordinator))
+    )
+    entry.async_on_unload(coordinator.async_stop_push_updates)
+    entry.async_on_unload(coordinator.async_stop_sleep)
 
     # Listen for config entry updates (new subentries added)
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
@@ -83,95 +112,106 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+@callback
+def _async_start_coordinator(
+    entry: ConfigEntry, coordinator: SolarCalculationCoordinator, hass: HomeAssistant
+) -> None:
+    """Start the first calculation in the background once Home Assistant has started."""
+    entry.async_create_background_task(
+        hass, _async_first_refresh(coordinator), f"{DOMAIN} first refresh"
+    )
+
+
+async def _async_first_refresh(coordinator: SolarCalculationCoordinator) -> None:
+    """Validate the configuration, run the first calculation and start push updates.
+
+    All sensors of other integrations exist once Home Assistant has started,
+    so the validation does not report sensors that are still being set up.
+    """
+    coordinator.validate_configuration()
+    await coordinator.async_refresh()
+
+    # Push mode: recalculate on input changes instead of polling
+    coordinator.async_start_push_updates()
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        # Write overrides that are still waiting for the delayed save
+        if store := entry_data.get("store"):
+            await store.async_flush()
+        if result_store := entry_data.get("result_store"):
+            await result_store.async_flush()
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the stored results of a removed config entry."""
+    await ResultStore(hass, entry.entry_id).async_remove()
+
+
 async def async_on_subentry_removed(
     hass: HomeAssistant, entry: ConfigEntry, subentry_id: str, subentry_type: str
 ) -> None:
     """Handle subentry removal - clean up entities and coordinator data.
 
     This function is called when a subentry (window or group) is removed.
-    It cleans up the associated entities and removes the subentry from
-    the coordinator's data structures.
+    The removal runs through the same reconciliation as other subentry
+    changes, so the coordinator and the known entities stay in sync.
     """
     _LOGGER.info("async_on_subentry_removed called for %s (type: %s)", subentry_id, subentry_type)
 
-    # Get coordinator
-    domain_data = hass.data.get(DOMAIN, {})
-    entry_data = domain_data.get(entry.entry_id, {})
-    coordinator = entry_data.get("coordinator")
-
-    if not coordinator:
-        _LOGGER.warning("No coordinator found for entry %s", entry.entry_id)
+    if subentry_type not in (LEVEL_GROUP, LEVEL_WINDOW):
+        _LOGGER.warning("Unknown subentry type: %s", subentry_type)
         return
 
-    # Get registries
-    entity_registry = er.async_get(hass)
-    device_registry = dr.async_get(hass)
+    await _async_reconcile_subentries(hass, entry, removed_subentry_id=subentry_id)
 
-    # Determine device_id and data structure based on subentry type
-    if subentry_type == "group":
-        device_id = f"group_{subentry_id}"
-        unique_id_prefix = f"{DOMAIN}_group_{subentry_id}"
-        # Remove from coordinator groups
-        if subentry_id in coordinator.groups:
-            del coordinator.groups[subentry_id]
-            _LOGGER.debug("Removed group %s from coordinator", subentry_id)
-    elif subentry_type == "window":
-        device_id = f"window_{subentry_id}"
-        unique_id_prefix = f"{DOMAIN}_window_{subentry_id}"
-        # Remove from coordinator windows
-        if subentry_id in coordinator.windows:
-            del coordinator.windows[subentry_id]
-            _LOGGER.debug("Removed window %s from coordinator", subentry_id)
-    else:
-        _LOGGER.warning("Unknown subentry type: %s", subentry_type)
+
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Handle config entry updates - reconcile subentries once a burst of changes ends."""
+    debouncer = hass.data.get(DOMAIN, {}).get(entry.entry_id, {}).get("reconcile_debouncer")
+
+    if not debouncer:
+        _LOGGER.warning("No coordinator found, skipping update")
         return
 
-    # Remove entities for this subentry
-    entities_to_remove = [
-        entity.entity_id
-        for entity in er.async_entries_for_config_entry(entity_registry, entry.entry_id)
-        if entity.device_id is not None and entity.unique_id.startswith(unique_id_prefix)
-    ]
-    for entity_id in entities_to_remove:
-        _LOGGER.debug("Removing entity: %s", entity_id)
-        entity_registry.async_remove(entity_id)
+    await debouncer.async_call()
 
-    # Remove device
-    device = device_registry.async_get_device(identifiers={(DOMAIN, device_id)})
-    if device:
-        _LOGGER.debug("Removing device: %s", device_id)
-        device_registry.async_remove_device(device.id)
 
+async def _async_reconcile_subentries(
+    hass: HomeAssistant, entry: ConfigEntry, removed_subentry_id: str | None = None
+) -> None:
+    """Add and remove the entities of changed subentries.
 
-async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Handle config entry updates - reload platforms when subentries change."""
-    _LOGGER.info("Update listener called - reloading platforms for new subentries")
+    Entities of untouched windows and groups are kept alive; only new ones
+    are added through the stored platform callbacks.
 
-    # Get the existing coordinator
-    coordinator = hass.data.get(DOMAIN, {}).get(entry.entry_id, {}).get("coordinator")
+    Args:
+        hass: Home Assistant instance
+        entry: Config entry with the current subentries
+        removed_subentry_id: Subentry being removed that may still be listed
+            in the entry
+    """
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id, {})
+    coordinator = entry_data.get("coordinator")
+    reconciler = entry_data.get("reconciler")
 
-    if not coordinator:
+    if not coordinator or not reconciler:
         _LOGGER.warning("No coordinator found, skipping update")
         return
 
-    # Store old subentry IDs before updating
-    old_groups = set(coordinator.groups.keys())
-    old_windows = set(coordinator.windows.keys())
-
     # Rebuild subentries from the updated entry
     subentries: dict[str, Any] = {}
     if hasattr(entry, "subentries"):
         for subentry_id, subentry in entry.subentries.items():
+            if subentry_id == removed_subentry_id:
+                continue
             subentries[subentry_id] = {
                 **subentry.data,
                 "type": subentry.subentry_type,
@@ -179,70 +219,32 @@ async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> Non
             }
 
     # Update the coordinator with new subentries
-    coordinator._subentries = subentries
-    coordinator.windows = coordinator._extract_windows()
-    coordinator.groups = coordinator._extract_groups()
-
-    # Store new subentry IDs after updating
-    new_groups = set(coordinator.groups.keys())
-    new_windows = set(coordinator.windows.keys())
+    renamed = coordinator.update_subentries(subentries)
+    added, removed = reconciler.async_reconcile()
 
     _LOGGER.info(
-        "Coordinator updated - windows=%d, groups=%d",
+        "Coordinator updated - windows=%d, groups=%d, added=%d, removed=%d",
         len(coordinator.windows),
         len(coordinator.groups),
+        len(added),
+        len(removed),
     )
 
-    # Remove entities for deleted subentries
-    removed_groups = old_groups - new_groups
-    removed_windows = old_windows - new_windows
-
-    if removed_groups or removed_windows:
-        _LOGGER.info(
-            "Removing entities for deleted subentries: groups=%s, windows=%s",
-            removed_groups,
-            removed_windows,
-        )
-        entity_registry = er.async_get(hass)
-        device_registry = dr.async_get(hass)
-
-        # Remove entities and devices for deleted groups
-        for group_id in removed_groups:
-            device_id = f"group_{group_id}"
-            entities_to_remove = [
-                entity.entity_id
-                for entity in er.async_entries_for_config_entry(entity_registry, entry.entry_id)
-                if entity.device_id is not None
-                and entity.unique_id.startswith(f"{DOMAIN}_group_{group_id}")
-            ]
-            for entity_id in entities_to_remove:
-                _LOGGER.debug("Removing entity: %s", entity_id)
-                entity_registry.async_remove(entity_id)
-            device = device_registry.async_get_device(identifiers={(DOMAIN, device_id)})
-            if device:
-                _LOGGER.debug("Removing device: %s", device_id)
-                device_registry.async_remove_device(device.id)
-
-        # Remove entities and devices for deleted windows
-        for window_id in removed_windows:
-            device_id = f"window_{window_id}"
-            entities_to_remove = [
-                entity.entity_id
-                for entity in er.async_entries_for_config_entry(entity_registry, entry.entry_id)
-                if entity.device_id is not None
-                and entity.unique_id.startswith(f"{DOMAIN}_window_{window_id}")
-            ]
-            for entity_id in entities_to_remove:
-                _LOGGER.debug("Removing entity: %s", entity_id)
-                entity_registry.async_remove(entity_id)
-            device = device_registry.async_get_device(identifiers={(DOMAIN, device_id)})
-            if device:
-                _LOGGER.debug("Removing device: %s", device_id)
-                device_registry.async_remove_device(device.id)
-
-    # Reload platforms: unload and setup again to create/remove entities
-    await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # Remove entities and devices for deleted subentries
+    async_remove_subentry_entities(hass, entry.entry_id, removed, reconciler.known)
+
+    # Device infos are only applied when an entity is added, rename existing devices
+    device_registry = dr.async_get(hass)
+    for device_id in renamed:
+        device = device_registry.async_get_device(identifiers={(DOMAIN, device_id)})
+        if device:
+            level, _, subentry_id = device_id.partition("_")
+            device_registry.async_update_device(
+                device.id, name=coordinator.get_device_info(level, subentry_id)["name"]
+            )
+
+    # Calculate the new windows and publish renamed entities
+    await coordinator.async_request_refresh()
 
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
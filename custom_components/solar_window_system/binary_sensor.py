@@ -7,15 +7,17 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.core import HomeAssistant, callback
 
 from .const import DOMAIN, LEVEL_GROUP, LEVEL_WINDOW
+from .entity import PublishOnChangeEntity
 
 if TYPE_CHECKING:
     from .coordinator import SolarCalculationCoordinator
 
+ICON_CLOSED = "mdi:blinds-closed"
+ICON_OPEN = "mdi:blinds-open"
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -23,27 +25,26 @@ async def async_setup_entry(
     async_add_entities,
 ) -> None:
     """Set up binary sensor entities from a config entry."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
-    entities = []
-
-    # Create shading recommendation sensors for each window
-    for window_id in coordinator.windows:
-        entities.append(ShadingRecommendationBinarySensor(coordinator, LEVEL_WINDOW, window_id))
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry_data["coordinator"]
 
-    # Create shading recommendation sensors for each group
-    for group_id in coordinator.groups:
-        entities.append(ShadingRecommendationBinarySensor(coordinator, LEVEL_GROUP, group_id))
+    def create_entities(level: str, entity_id: str) -> list[ShadingRecommendationBinarySensor]:
+        """Create the shading recommendation sensor of a window or group."""
+        return [ShadingRecommendationBinarySensor(coordinator, level, entity_id)]
 
     # Create global shading recommendation sensor
-    entities.append(ShadingRecommendationBinarySensor(coordinator, "global", "global"))
+    async_add_entities(create_entities("global", "global"))
 
-    async_add_entities(entities)
+    # Create sensors for each window and group, and for ones added later
+    entry_data["reconciler"].async_add_platform(async_add_entities, create_entities)
 
 
-class ShadingRecommendationBinarySensor(CoordinatorEntity, BinarySensorEntity):
+class ShadingRecommendationBinarySensor(PublishOnChangeEntity, BinarySensorEntity):
     """Binary sensor indicating if shading is recommended."""
 
     coordinator: SolarCalculationCoordinator
+    _attr_device_class = BinarySensorDeviceClass.WINDOW
+    _attr_icon = ICON_OPEN
 
     def __init__(self, coordinator: SolarCalculationCoordinator, level: str, entity_id: str):
         """Initialize the binary sensor.
@@ -53,84 +54,25 @@ class ShadingRecommendationBinarySensor(CoordinatorEntity, BinarySensorEntity):
             level: One of LEVEL_WINDOW, LEVEL_GROUP, or "global"
             entity_id: Identifier for the entity (window_id, group_id, or "global")
         """
-        super().__init__(coordinator)
-        self._level = level
-        self._entity_id = entity_id
-
-    @property
-    def unique_id(self):
-        """Return a unique ID for this sensor."""
-        return f"{DOMAIN}_{self._level}_{self._entity_id}_shading_recommended"
+        super().__init__(coordinator, level, entity_id)
+        self._attr_unique_id = f"{DOMAIN}_{level}_{entity_id}_shading_recommended"
+        self._data_key = f"group_{entity_id}" if level == LEVEL_GROUP else entity_id
 
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        if self._level == LEVEL_WINDOW:
-            display_name = self.coordinator.windows.get(self._entity_id, {}).get(
-                "name", self._entity_id
-            )
-            return f"{display_name} Verschattung empfohlen"
-        elif self._level == LEVEL_GROUP:
-            display_name = self.coordinator.groups.get(self._entity_id, {}).get(
-                "name", self._entity_id
-            )
-            return f"{display_name} Verschattung empfohlen"
-        else:
-            return "Global Verschattung empfohlen"
+    def _entity_name(self, display_name: str) -> str:
+        """Return the window, group or global name with the sensor label."""
+        return f"{display_name} Verschattung empfohlen"
 
     @property
     def is_on(self):
         """Return True if shading is recommended."""
-        # Get the data key based on level
-        if self._level == LEVEL_GROUP:
-            data_key = f"group_{self._entity_id}"
-        else:
-            data_key = self._entity_id
-
-        # Get the data from coordinator
-        if self.coordinator.data and data_key in self.coordinator.data:
-            return self.coordinator.data[data_key].get("shading_recommended", False)
+        data = self.coordinator.data
+        if data and self._data_key in data:
+            return data[self._data_key].get("shading_recommended", False)
 
         return False
 
-    @property
-    def device_class(self):
-        """Return the device class."""
-        return BinarySensorDeviceClass.WINDOW
-
-    @property
-    def icon(self):
-        """Return the icon based on state."""
-        if self.is_on:
-            return "mdi:blinds-closed"
-        return "mdi:blinds-open"
-
-    @property
-    def device_info(self):
-        """Return device information."""
-        if self._level == "global":
-            return DeviceInfo(
-                identifiers={(DOMAIN, "global")},
-                name="Solar Window System Global",
-                manufacturer="Solar Window System",
-            )
-        elif self._level == LEVEL_GROUP:
-            group_name = self.coordinator.groups.get(self._entity_id, {}).get(
-                "name", self._entity_id
-            )
-            return DeviceInfo(
-                identifiers={(DOMAIN, f"group_{self._entity_id}")},
-                name=f"Gruppe: {group_name}",
-                manufacturer="Solar Window System",
-                via_device=(DOMAIN, "global"),
-            )
-        else:  # window
-            window_name = self.coordinator.windows.get(self._entity_id, {}).get(
-                "name", self._entity_id
-            )
-            return DeviceInfo(
-                identifiers={(DOMAIN, f"window_{self._entity_id}")},
-                name=f"Fenster: {window_name}",
-                manufacturer="Solar Window System",
-                via_device=(DOMAIN, "global"),
-            )
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Update the icon to the state being written."""
+        self._attr_icon = ICON_CLOSED if self.is_on else ICON_OPEN
+        super().async_write_ha_state()
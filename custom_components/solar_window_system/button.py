@@ -6,10 +6,9 @@ from homeassistant.components.button import ButtonEntity, ButtonEntityDescriptio
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, LEVEL_GROUP, LEVEL_WINDOW
+from .entity import SolarWindowEntity
 
 if TYPE_CHECKING:
     from .coordinator import SolarCalculationCoordinator
@@ -27,37 +26,18 @@ async def async_setup_entry(
     async_add_entities,
 ) -> None:
     """Set up button entities from config entry."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
-    entities = []
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry_data["coordinator"]
 
-    # Group reset buttons
-    for group_id in coordinator.groups:
-        entities.append(
-            SolarResetButton(
-                coordinator,
-                entry,
-                LEVEL_GROUP,
-                group_id,
-                RESET_DESCRIPTION,
-            )
-        )
+    def create_entities(level: str, entity_id: str) -> list[SolarResetButton]:
+        """Create the reset button of a window or group."""
+        return [SolarResetButton(coordinator, entry, level, entity_id, RESET_DESCRIPTION)]
 
-    # Window reset buttons
-    for window_id in coordinator.windows:
-        entities.append(
-            SolarResetButton(
-                coordinator,
-                entry,
-                LEVEL_WINDOW,
-                window_id,
-                RESET_DESCRIPTION,
-            )
-        )
+    # Reset buttons for each window and group, and for ones added later
+    entry_data["reconciler"].async_add_platform(async_add_entities, create_entities)
 
-    async_add_entities(entities)
 
-
-class SolarResetButton(CoordinatorEntity, ButtonEntity):
+class SolarResetButton(SolarWindowEntity, ButtonEntity):
     """Button entity to reset overrides for a window or group."""
 
     coordinator: SolarCalculationCoordinator
@@ -71,40 +51,10 @@ class SolarResetButton(CoordinatorEntity, ButtonEntity):
         description: ButtonEntityDescription,
     ):
         """Initialize the reset button."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, level, entity_id)
         self._entry = entry
-        self._level = level
-        self._entity_id = entity_id
         self.entity_description = description
-
-    @property
-    def unique_id(self):
-        """Return unique ID."""
-        return f"{DOMAIN}_{self._level}_{self._entity_id}_reset_overrides"
-
-    @property
-    def device_info(self):
-        """Return device info."""
-        if self._level == LEVEL_GROUP:
-            group_name = self.coordinator.groups.get(self._entity_id, {}).get(
-                "name", self._entity_id
-            )
-            return DeviceInfo(
-                identifiers={(DOMAIN, f"group_{self._entity_id}")},
-                name=f"Gruppe: {group_name}",
-                manufacturer="Solar Window System",
-                via_device=(DOMAIN, "global"),
-            )
-        else:  # window
-            window_name = self.coordinator.windows.get(self._entity_id, {}).get(
-                "name", self._entity_id
-            )
-            return DeviceInfo(
-                identifiers={(DOMAIN, f"window_{self._entity_id}")},
-                name=f"Fenster: {window_name}",
-                manufacturer="Solar Window System",
-                via_device=(DOMAIN, "global"),
-            )
+        self._attr_unique_id = f"{DOMAIN}_{level}_{entity_id}_reset_overrides"
 
     @property
     def available(self):
@@ -0,0 +1,473 @@
+"""Batched solar energy calculation for all windows.
+
+The coordinator compiles every window once when its configuration
+changes and packs the compiled windows into a WindowCalculationEngine,
+which evaluates direct, diffuse and combined energy for all windows in
+a single pass per update cycle.
+NumPy is used when available; otherwise the engine falls back to the
+scalar formulas below, which are also the reference implementation.
+
+Sun visibility by azimuth is precomputed per window as a table over
+integer azimuth bins, so a cycle only indexes the bin of the current sun
+azimuth and runs the exact range check for bins on a range boundary.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy ships with Home Assistant core
+    np = None
+
+HAS_NUMPY = np is not None
+
+# Sun visibility per integer azimuth bin [i, i+1) of a window
+AZIMUTH_BINS = 360
+AZIMUTH_HIDDEN = 0  # Sun not visible anywhere in the bin
+AZIMUTH_VISIBLE = 1  # Sun visible in the whole bin
+AZIMUTH_PARTIAL = 2  # Range boundary inside the bin, needs the exact check
+
+# Windows evaluated per block in time series, bounds the (windows x steps) arrays
+SERIES_CHUNK_SIZE = 512
+
+
+@dataclass(slots=True)
+class WindowParameters:
+    """Static parameters of a single window used by the energy formulas.
+
+    Dimensions are in cm, angles in degrees.
+    """
+
+    width: float = 0.0
+    height: float = 0.0
+    frame_width: float = 0.0
+    g_value: float = 0.6
+    azimuth: float = 180.0
+    tilt: float = 90.0
+    visible_azimuth_start: float = 0.0
+    visible_azimuth_end: float = 360.0
+    shading_depth: float = 0.0
+    window_recess: float = 0.0
+
+
+@dataclass(slots=True, frozen=True)
+class CompiledWindow:
+    """Per-window constants of the energy formulas.
+
+    Everything that only depends on the window configuration is
+    precomputed here, so an update cycle only evaluates the terms that
+    depend on the sun position and the irradiance.
+    """
+
+    area_g: float
+    cos_tilt: float
+    sin_tilt: float
+    diffuse_factor: float
+    azimuth: float
+    visible_azimuth_start: float
+    visible_azimuth_end: float
+    shade_angle: float
+    azimuth_bins: bytes
+
+
+def azimuth_in_range(azimuth: float, start: float, end: float) -> bool:
+    """Check if an azimuth lies in the visible range.
+
+    A range with start > end wraps across north (e.g. 300° to 60°).
+    """
+    if start <= end:
+        return start <= azimuth <= end
+    return azimuth >= start or azimuth <= end
+
+
+def azimuth_bin(azimuth: float) -> int:
+    """Return the bin of an azimuth; 360° belongs to the last bin, not to 0°.
+
+    The range check treats 360° as the upper end of a range, so a range
+    ending at 360° must still contain it.
+    """
+    index = int(azimuth)
+    if index == AZIMUTH_BINS:
+        return AZIMUTH_BINS - 1
+    return index % AZIMUTH_BINS
+
+
+def build_azimuth_bins(start: float, end: float) -> bytes:
+    """Classify every integer azimuth bin [i, i+1) against the visible range.
+
+    Args:
+        start: Visible azimuth range start in degrees
+        end: Visible azimuth range end in degrees (inclusive)
+
+    Returns:
+        One AZIMUTH_HIDDEN/VISIBLE/PARTIAL code per bin
+    """
+    if start <= end:
+        ranges = [(start, end)]
+    else:
+        # Wraps across north: [start, 360) and [0, end]
+        ranges = [(start, AZIMUTH_BINS), (0, end)]
+
+    bins = bytearray(AZIMUTH_BINS)
+    for low, high in ranges:
+        # Bins lying completely inside the range
+        first = max(0, math.ceil(low))
+        last = min(AZIMUTH_BINS, math.floor(high))
+        if first < last:
+            bins[first:last] = bytes([AZIMUTH_VISIBLE]) * (last - first)
+    for low, high in ranges:
+        # Bins containing a range boundary
+        for i in {math.floor(low), math.floor(high)}:
+            if 0 <= i < AZIMUTH_BINS and bins[i] == AZIMUTH_HIDDEN:
+                bins[i] = AZIMUTH_PARTIAL
+    return bytes(bins)
+
+
+def compile_window(params: WindowParameters) -> CompiledWindow:
+    """Precompute the constant terms of the energy formulas for a window.
+
+    Args:
+        params: Resolved window parameters
+
+    Returns:
+        CompiledWindow with effective area, tilt terms and shade angle
+    """
+    # Calculate effective area (subtract frame on all sides)
+    # Area is in cm², convert to m² (divide by 10000)
+    frame_width = params.frame_width
+    effective_area_m2 = (
+        (params.width - 2 * frame_width) * (params.height - 2 * frame_width)
+    ) / 10000
+
+    beta = math.radians(params.tilt)
+    cos_tilt = math.cos(beta)
+
+    # Shade angle: elevation below which overhangs/balconies block the sun
+    # atan2(window_recess, shading_depth) gives elevation angle from horizontal
+    # The +1 prevents division by zero
+    if params.shading_depth > 0:
+        shade_angle = math.degrees(math.atan2(params.window_recess + 1, params.shading_depth))
+    else:
+        shade_angle = -math.inf
+
+    return CompiledWindow(
+        area_g=effective_area_m2 * params.g_value,
+        cos_tilt=cos_tilt,
+        sin_tilt=math.sin(beta),
+        # Horizontal (0°) sees full sky, vertical (90°) sees half
+        # Formula: (1 + cos(β)) / 2 where β = tilt angle
+        diffuse_factor=(1 + cos_tilt) / 2,
+        azimuth=params.azimuth,
+        visible_azimuth_start=params.visible_azimuth_start,
+        visible_azimuth_end=params.visible_azimuth_end,
+        shade_angle=shade_angle,
+        azimuth_bins=build_azimuth_bins(params.visible_azimuth_start, params.visible_azimuth_end),
+    )
+
+
+def sun_is_visible(elevation: float, azimuth: float, window: CompiledWindow) -> bool:
+    """Check if the sun is visible through a window.
+
+    Args:
+        elevation: Sun elevation angle in degrees (0 = horizon, 90 = zenith)
+        azimuth: Sun azimuth angle in degrees (0 = North, 90 = East, 180 = South, 270 = West)
+        window: Compiled window
+
+    Returns:
+        True if sun is visible, False otherwise
+    """
+    # Check if sun is above horizon
+    if elevation <= 0:
+        return False
+
+    # Check azimuth range via the precomputed bin, exact check only at the range boundary
+    azimuth_code = window.azimuth_bins[azimuth_bin(azimuth)]
+    if azimuth_code == AZIMUTH_HIDDEN:
+        return False
+    if azimuth_code == AZIMUTH_PARTIAL and not azimuth_in_range(
+        azimuth, window.visible_azimuth_start, window.visible_azimuth_end
+    ):
+        return False
+
+    # Check shading (roof overhangs, balconies, etc.)
+    return elevation >= window.shade_angle
+
+
+def direct_energy(
+    irradiance_direct: float, elevation: float, azimuth: float, window: CompiledWindow
+) -> float:
+    """Calculate direct solar energy through a window.
+
+    Args:
+        irradiance_direct: Direct solar irradiance in W/m²
+        elevation: Sun elevation angle in degrees
+        azimuth: Sun azimuth angle in degrees
+        window: Compiled window
+
+    Returns:
+        Direct energy in watts
+    """
+    # Calculate incidence factor considering tilt angle
+    # Formula: cos(θ) = sin(α)*cos(β) + cos(α)*sin(β)*cos(γ-δ)
+    # Where: α=elevation, β=tilt, γ=sun_azimuth, δ=window_azimuth
+    alpha = math.radians(elevation)
+    azimuth_diff = math.radians(azimuth - window.azimuth)
+
+    incidence_factor = math.sin(alpha) * window.cos_tilt + math.cos(
+        alpha
+    ) * window.sin_tilt * math.cos(azimuth_diff)
+    incidence_factor = max(0, incidence_factor)  # No negative values
+
+    return irradiance_direct * window.area_g * incidence_factor
+
+
+def diffuse_energy(irradiance_diffuse: float, window: CompiledWindow) -> float:
+    """Calculate diffuse solar energy through a window.
+
+    Args:
+        irradiance_diffuse: Diffuse solar irradiance in W/m²
+        window: Compiled window
+
+    Returns:
+        Diffuse energy in watts
+    """
+    return irradiance_diffuse * window.area_g * window.diffuse_factor
+
+
+class WindowCalculationEngine:
+    """Evaluate the energy formulas for many windows at once."""
+
+    def __init__(self, windows: dict[str, CompiledWindow], use_numpy: bool = HAS_NUMPY) -> None:
+        """Pack compiled windows into contiguous arrays.
+
+        Args:
+            windows: Compiled windows keyed by window ID
+            use_numpy: Use the vectorized NumPy path (requires NumPy)
+        """
+        self.window_ids: list[str] = list(windows)
+        self._windows: list[CompiledWindow] = list(windows.values())
+        self.use_numpy = use_numpy and HAS_NUMPY
+
+        if self.use_numpy:
+            self._pack_arrays()
+
+    def _pack_arrays(self) -> None:
+        """Build the column arrays for the vectorized path."""
+        windows = self._windows
+
+        def column(attribute: str) -> Any:
+            return np.fromiter(
+                (getattr(w, attribute) for w in windows), dtype=np.float64, count=len(windows)
+            )
+
+        self._area_g = column("area_g")
+        self._cos_tilt = column("cos_tilt")
+        self._sin_tilt = column("sin_tilt")
+        self._diffuse_factor = column("diffuse_factor")
+        self._azimuth = column("azimuth")
+        self._az_start = column("visible_azimuth_start")
+        self._az_end = column("visible_azimuth_end")
+        self._shade_angle = column("shade_angle")
+        self._azimuth_bins = np.frombuffer(
+            b"".join(w.azimuth_bins for w in windows), dtype=np.uint8
+        ).reshape(len(windows), AZIMUTH_BINS)
+
+    def __len__(self) -> int:
+        """Return the number of windows in the engine."""
+        return len(self.window_ids)
+
+    def calculate(
+        self,
+        elevation: float,
+        azimuth: float,
+        irradiance_direct: float,
+        irradiance_diffuse: float,
+    ) -> dict[str, dict[str, Any]]:
+        """Calculate energy for all windows.
+
+        Args:
+            elevation: Sun elevation angle in degrees
+            azimuth: Sun azimuth angle in degrees
+            irradiance_direct: Direct solar irradiance in W/m²
+            irradiance_diffuse: Diffuse solar irradiance in W/m²
+
+        Returns:
+            Dictionary keyed by window ID with direct, diffuse, combined
+            energy in watts and the sun visibility flag.
+        """
+        if not self.window_ids:
+            return {}
+        if self.use_numpy:
+            return self._calculate_vectorized(
+                elevation, azimuth, irradiance_direct, irradiance_diffuse
+            )
+        return self._calculate_scalar(elevation, azimuth, irradiance_direct, irradiance_diffuse)
+
+    def _calculate_scalar(
+        self,
+        elevation: float,
+        azimuth: float,
+        irradiance_direct: float,
+        irradiance_diffuse: float,
+    ) -> dict[str, dict[str, Any]]:
+        """Calculate energy window by window with the reference formulas."""
+        results: dict[str, dict[str, Any]] = {}
+        for window_id, window in zip(self.window_ids, self._windows, strict=True):
+            visible = sun_is_visible(elevation, azimuth, window)
+            direct = direct_energy(irradiance_direct, elevation, azimuth, window) if visible else 0
+            diffuse = diffuse_energy(irradiance_diffuse, window)
+            results[window_id] = {
+                "direct": direct,
+                "diffuse": diffuse,
+                "combined": direct + diffuse,
+                "visible": visible,
+            }
+        return results
+
+    def _calculate_vectorized(
+        self,
+        elevation: float,
+        azimuth: float,
+        irradiance_direct: float,
+        irradiance_diffuse: float,
+    ) -> dict[str, dict[str, Any]]:
+        """Calculate energy for all windows in one NumPy pass."""
+        alpha = math.radians(elevation)
+
+        # The sun azimuth is the same for all windows: one column of the bin table
+        azimuth_bins = self._azimuth_bins[:, azimuth_bin(azimuth)]
+        in_range = azimuth_bins == AZIMUTH_VISIBLE
+        partial = np.flatnonzero(azimuth_bins == AZIMUTH_PARTIAL)
+        if partial.size:
+            start = self._az_start[partial]
+            end = self._az_end[partial]
+            in_range[partial] = np.where(
+                start <= end,
+                (start <= azimuth) & (azimuth <= end),
+                (azimuth >= start) | (azimuth <= end),
+            )
+
+        visible = in_range & (elevation > 0) & (elevation >= self._shade_angle)
+
+        incidence = math.sin(alpha) * self._cos_tilt + math.cos(alpha) * self._sin_tilt * np.cos(
+            np.radians(azimuth - self._azimuth)
+        )
+        direct = np.where(visible, irradiance_direct * self._area_g * np.maximum(incidence, 0), 0.0)
+        diffuse = irradiance_diffuse * self._area_g * self._diffuse_factor
+        combined = direct + diffuse
+
+        return {
+            window_id: {
+                "direct": d,
+                "diffuse": f,
+                "combined": c,
+                "visible": v,
+            }
+            for window_id, d, f, c, v in zip(
+                self.window_ids,
+                direct.tolist(),
+                diffuse.tolist(),
+                combined.tolist(),
+                visible.tolist(),
+                strict=True,
+            )
+        }
+
+    def calculate_series(
+        self,
+        elevations: Any,
+        azimuths: Any,
+        irradiance_direct: Any,
+        irradiance_diffuse: Any,
+        decimals: int | None = None,
+    ) -> dict[str, dict[str, list[float]]]:
+        """Calculate energy for all windows over a time series.
+
+        Args:
+            elevations: Sun elevation per time step in degrees
+            azimuths: Sun azimuth per time step in degrees
+            irradiance_direct: Direct irradiance per time step in W/m²
+            irradiance_diffuse: Diffuse irradiance per time step in W/m²
+            decimals: Round the energy values to this many decimals
+
+        Returns:
+            Dictionary keyed by window ID with direct, diffuse and combined
+            energy in watts, one value per time step.
+        """
+        if not self.window_ids:
+            return {}
+        if self.use_numpy:
+            return self._calculate_series_vectorized(
+                elevations, azimuths, irradiance_direct, irradiance_diffuse, decimals
+            )
+
+        series: dict[str, dict[str, list[float]]] = {
+            window_id: {"direct": [], "diffuse": [], "combined": []}
+            for window_id in self.window_ids
+        }
+        for step in zip(elevations, azimuths, irradiance_direct, irradiance_diffuse, strict=True):
+            for window_id, result in self._calculate_scalar(*step).items():
+                window_series = series[window_id]
+                for key in ("direct", "diffuse", "combined"):
+                    value = result[key]
+                    window_series[key].append(value if decimals is None else round(value, decimals))
+        return series
+
+    def _calculate_series_vectorized(
+        self,
+        elevations: Any,
+        azimuths: Any,
+        irradiance_direct: Any,
+        irradiance_diffuse: Any,
+        decimals: int | None,
+    ) -> dict[str, dict[str, list[float]]]:
+        """Calculate a (windows x time steps) energy matrix in NumPy blocks."""
+        elevation = np.asarray(elevations, dtype=np.float64)
+        azimuth = np.asarray(azimuths, dtype=np.float64)
+        direct_in = np.asarray(irradiance_direct, dtype=np.float64)
+        diffuse_in = np.asarray(irradiance_diffuse, dtype=np.float64)
+
+        alpha = np.radians(elevation)
+        sin_alpha = np.sin(alpha)
+        cos_alpha = np.cos(alpha)
+
+        series: dict[str, dict[str, list[float]]] = {}
+        for first in range(0, len(self.window_ids), SERIES_CHUNK_SIZE):
+            block = slice(first, first + SERIES_CHUNK_SIZE)
+            start = self._az_start[block, None]
+            end = self._az_end[block, None]
+
+            # The azimuth changes every step, so the exact range check is
+            # as cheap as a bin lookup here
+            in_range = np.where(
+                start <= end,
+                (start <= azimuth) & (azimuth <= end),
+                (azimuth >= start) | (azimuth <= end),
+            )
+            visible = in_range & (elevation > 0) & (elevation >= self._shade_angle[block, None])
+
+            incidence = sin_alpha * self._cos_tilt[block, None] + cos_alpha * self._sin_tilt[
+                block, None
+            ] * np.cos(np.radians(azimuth - self._azimuth[block, None]))
+            area_g = self._area_g[block, None]
+            direct = np.where(visible, direct_in * area_g * np.maximum(incidence, 0), 0.0)
+            diffuse = diffuse_in * area_g * self._diffuse_factor[block, None]
+            combined = direct + diffuse
+            if decimals is not None:
+                direct, diffuse, combined = (
+                    np.round(values, decimals) for values in (direct, diffuse, combined)
+                )
+
+            for window_id, d, f, c in zip(
+                self.window_ids[block],
+                direct.tolist(),
+                diffuse.tolist(),
+                combined.tolist(),
+                strict=True,
+            ):
+                series[window_id] = {"direct": d, "diffuse": f, "combined": c}
+        return series
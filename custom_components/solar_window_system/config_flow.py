@@ -28,21 +28,29 @@ from homeassistant.helpers.selector import (
 )
 
 from .const import (
+    CONF_ADVANCED,
     CONF_AZIMUTH,
+    CONF_DEADBAND_ABSOLUTE,
+    CONF_DEADBAND_RELATIVE,
+    CONF_DEBOUNCE,
+    CONF_FORECAST_TTL,
     CONF_FRAME_WIDTH,
     CONF_G_VALUE,
     CONF_GEOMETRY,
     CONF_GROUP_ID,
     CONF_GROUP_TYPE,
     CONF_HEIGHT,
+    CONF_INTERNAL_SOLAR_POSITION,
     CONF_IRRADIANCE_DIFFUSE_SENSOR,
     CONF_IRRADIANCE_SENSOR,
+    CONF_PRECISION,
     CONF_PROPERTIES,
     CONF_SENSORS,
     CONF_SHADING_DEPTH,
     CONF_TEMP_INDOOR,
     CONF_TEMP_OUTDOOR,
     CONF_TILT,
+    CONF_UPDATE_MODE,
     CONF_USE_IRRADIANCE_DIFFUSE,
     CONF_USE_TEMP_INDOOR,
     CONF_USE_TEMP_OUTDOOR,
@@ -54,17 +62,26 @@ from .const import (
     CONF_WEATHER_WARNING,
     CONF_WIDTH,
     CONF_WINDOW_RECESS,
+    DEFAULT_DEADBAND_ABSOLUTE,
+    DEFAULT_DEADBAND_RELATIVE,
+    DEFAULT_DEBOUNCE,
     DEFAULT_FORECAST_HIGH,
+    DEFAULT_FORECAST_TTL,
     DEFAULT_FRAME_WIDTH,
     DEFAULT_G_VALUE,
     DEFAULT_INSIDE_TEMP,
+    DEFAULT_INTERNAL_SOLAR_POSITION,
     DEFAULT_OUTSIDE_TEMP,
+    DEFAULT_PRECISION,
     DEFAULT_SHADING_DEPTH,
     DEFAULT_SOLAR_ENERGY,
+    DEFAULT_UPDATE_MODE,
     DEFAULT_WINDOW_RECESS,
     DOMAIN,
     GROUP_TYPE_ORIENTATION,
     GROUP_TYPE_ROOM,
+    UPDATE_MODE_POLLING,
+    UPDATE_MODE_PUSH,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -75,6 +92,22 @@ DEFAULT_NAME = "Solar Window System"
 SUBENTRY_TYPE_WINDOW = "window"
 SUBENTRY_TYPE_GROUP = "group"
 
+# Options of the collapsed "advanced" section and their defaults
+ADVANCED_DEFAULTS: dict[str, Any] = {
+    CONF_FORECAST_TTL: DEFAULT_FORECAST_TTL,
+    CONF_UPDATE_MODE: DEFAULT_UPDATE_MODE,
+    CONF_DEBOUNCE: DEFAULT_DEBOUNCE,
+    CONF_INTERNAL_SOLAR_POSITION: DEFAULT_INTERNAL_SOLAR_POSITION,
+    CONF_PRECISION: DEFAULT_PRECISION,
+    CONF_DEADBAND_ABSOLUTE: DEFAULT_DEADBAND_ABSOLUTE,
+    CONF_DEADBAND_RELATIVE: DEFAULT_DEADBAND_RELATIVE,
+}
+
+
+def _advanced_defaults(advanced: dict[str, Any]) -> dict[str, Any]:
+    """Return the advanced options, with defaults for the missing ones."""
+    return {key: advanced.get(key, default) for key, default in ADVANCED_DEFAULTS.items()}
+
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect."""
@@ -304,6 +337,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         CONF_SHADING_DEPTH, DEFAULT_SHADING_DEPTH
                     ),
                 },
+                CONF_ADVANCED: _advanced_defaults(user_input.get(CONF_ADVANCED, {})),
             }
             return self.async_update_reload_and_abort(entry, data_updates=data_updates)
 
@@ -339,6 +373,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             ),
             CONF_WEATHER_CONDITION: sensors.get(CONF_WEATHER_CONDITION),
             CONF_PROPERTIES: properties,
+            CONF_ADVANCED: entry.data.get(CONF_ADVANCED, {}),
         }
 
         return self.async_show_form(
@@ -353,6 +388,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         properties: dict[str, Any],
     ) -> vol.Schema:
         """Build the schema for reconfigure with checkboxes for optional sensors."""
+        advanced = _advanced_defaults(entry.data.get(CONF_ADVANCED, {}))
         return vol.Schema(
             {
                 vol.Required("name", default=entry.data.get("name", DEFAULT_NAME)): TextSelector(),
@@ -445,6 +481,64 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     ),
                     {"collapsed": True},
                 ),
+                vol.Optional(
+                    CONF_ADVANCED,
+                    default=advanced,
+                ): section(  # type: ignore[no-untyped-call]
+                    vol.Schema(
+                        {
+                            vol.Optional(
+                                CONF_FORECAST_TTL,
+                                default=advanced[CONF_FORECAST_TTL],
+                            ): NumberSelector(
+                                NumberSelectorConfig(
+                                    min=1, max=360, step=1, unit_of_measurement="min"
+                                )
+                            ),
+                            vol.Optional(
+                                CONF_UPDATE_MODE,
+                                default=advanced[CONF_UPDATE_MODE],
+                            ): SelectSelector(
+                                SelectSelectorConfig(
+                                    options=[UPDATE_MODE_POLLING, UPDATE_MODE_PUSH],
+                                    mode=SelectSelectorMode.DROPDOWN,
+                                    translation_key=CONF_UPDATE_MODE,
+                                )
+                            ),
+                            vol.Optional(
+                                CONF_DEBOUNCE,
+                                default=advanced[CONF_DEBOUNCE],
+                            ): NumberSelector(
+                                NumberSelectorConfig(min=0, max=60, step=1, unit_of_measurement="s")
+                            ),
+                            vol.Optional(
+                                CONF_INTERNAL_SOLAR_POSITION,
+                                default=advanced[CONF_INTERNAL_SOLAR_POSITION],
+                            ): BooleanSelector(),
+                            vol.Optional(
+                                CONF_PRECISION,
+                                default=advanced[CONF_PRECISION],
+                            ): NumberSelector(NumberSelectorConfig(min=0, max=3, step=1)),
+                            vol.Optional(
+                                CONF_DEADBAND_ABSOLUTE,
+                                default=advanced[CONF_DEADBAND_ABSOLUTE],
+                            ): NumberSelector(
+                                NumberSelectorConfig(
+                                    min=0, max=100, step=0.5, unit_of_measurement="W"
+                                )
+                            ),
+                            vol.Optional(
+                                CONF_DEADBAND_RELATIVE,
+                                default=advanced[CONF_DEADBAND_RELATIVE],
+                            ): NumberSelector(
+                                NumberSelectorConfig(
+                                    min=0, max=50, step=0.5, unit_of_measurement="%"
+                                )
+                            ),
+                        }
+                    ),
+                    {"collapsed": True},
+                ),
             }
         )
 
@@ -682,7 +776,8 @@ class WindowSubentryFlowHandler(ConfigSubentryFlow):
                         CONF_SHADING_DEPTH
                     ]
 
-            return self.async_update_reload_and_abort(
+            # No reload: the update listener adds, removes and renames entities
+            return self.async_update_and_abort(
                 entry, subentry, title=window_data["name"], data=window_data
             )
 
@@ -917,7 +1012,8 @@ class GroupSubentryFlowHandler(ConfigSubentryFlow):
                         CONF_SHADING_DEPTH
                     ]
 
-            return self.async_update_reload_and_abort(
+            # No reload: the update listener adds, removes and renames entities
+            return self.async_update_and_abort(
                 self._get_entry(), subentry, title=group_data["name"], data=group_data
             )
 
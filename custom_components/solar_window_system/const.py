@@ -65,6 +65,20 @@ CONF_USE_TEMP_INDOOR = "use_temp_indoor"
 CONF_USE_WEATHER_WARNING = "use_weather_warning"
 CONF_USE_WEATHER_CONDITION = "use_weather_condition"
 
+# Advanced (performance tuning) config keys
+CONF_ADVANCED = "advanced"
+CONF_FORECAST_TTL = "forecast_ttl"  # Minutes a cached weather forecast stays valid
+CONF_UPDATE_MODE = "update_mode"
+CONF_DEBOUNCE = "debounce"  # Seconds to coalesce input changes in push mode
+CONF_INTERNAL_SOLAR_POSITION = "internal_solar_position"  # Compute sun position, skip sun.sun
+CONF_PRECISION = "precision"  # Decimals of published power values
+CONF_DEADBAND_ABSOLUTE = "deadband_absolute"  # W a power value must change to be published
+CONF_DEADBAND_RELATIVE = "deadband_relative"  # % a power value must change to be published
+
+# Update modes
+UPDATE_MODE_POLLING = "polling"
+UPDATE_MODE_PUSH = "push"
+
 # Threshold defaults
 DEFAULT_OUTSIDE_TEMP = 25.0
 DEFAULT_INSIDE_TEMP = 24.0
@@ -84,6 +98,30 @@ DEFAULT_SHADING_END = "16:00"
 
 # Update interval
 DEFAULT_UPDATE_INTERVAL = 120
+DEFAULT_MAX_SLEEP = 12  # hours to sleep at night when no sunrise is found (polar night)
+DEFAULT_UPDATE_MODE = UPDATE_MODE_POLLING
+DEFAULT_DEBOUNCE = 5  # seconds
+DEFAULT_INTERNAL_SOLAR_POSITION = False
+DEFAULT_SUBENTRY_DEBOUNCE = 2  # seconds to coalesce bursts of subentry changes
+
+# Forecast cache
+DEFAULT_FORECAST_TTL = 30  # minutes
+
+# State publishing
+DEFAULT_PRECISION = 1  # decimals
+DEFAULT_DEADBAND_ABSOLUTE = 0.0  # W
+DEFAULT_DEADBAND_RELATIVE = 0.0  # %
+
+# Day-ahead heat gain profile
+DEFAULT_PROFILE_INTERVAL = 5  # minutes
+
+# Services
+SERVICE_GET_HEAT_GAIN_PROFILE = "get_heat_gain_profile"
+SERVICE_IMPORT_WINDOWS = "import_windows"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_DATE = "date"
+ATTR_TABLE = "table"
+ATTR_FORMAT = "format"
 
 # Entity types
 ENERGY_TYPE_DIRECT = "direct"
@@ -110,6 +148,13 @@ SUN_STATE_BELOW_HORIZON = "below_horizon"
 # Storage
 STORAGE_VERSION = 1
 STORAGE_KEY = "solar_window_system"
+DEFAULT_SAVE_DELAY = 10  # seconds to coalesce override changes
+
+# Last-result snapshot for a warm start
+RESULTS_STORAGE_VERSION = 1
+RESULTS_STORAGE_KEY = "solar_window_system.results"
+DEFAULT_RESULTS_SAVE_DELAY = 300  # seconds between snapshot writes
+DEFAULT_RESULTS_MAX_AGE = 60  # minutes a snapshot is used after a restart
 
 # Debug entity types
 DEBUG_TYPE_CONFIG = "config"
@@ -1,25 +1,52 @@
 """Coordinator for solar energy calculations."""
 
+import asyncio
 import logging
-import math
-from datetime import timedelta
+from collections.abc import Iterable
+from datetime import date, datetime, timedelta
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.storage import Store
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    callback,
+)
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.event import (
+    async_track_point_in_utc_time,
+    async_track_state_change_event,
+)
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-
+from homeassistant.util import dt as dt_util
+
+from .calculation import (
+    CompiledWindow,
+    WindowCalculationEngine,
+    WindowParameters,
+    compile_window,
+    sun_is_visible,
+)
 from .const import (
+    CONF_ADVANCED,
     CONF_AZIMUTH,
+    CONF_DEADBAND_ABSOLUTE,
+    CONF_DEADBAND_RELATIVE,
+    CONF_DEBOUNCE,
+    CONF_FORECAST_TTL,
     CONF_FRAME_WIDTH,
     CONF_G_VALUE,
     CONF_GEOMETRY,
     CONF_GROUP_ID,
     CONF_GROUPS,
     CONF_HEIGHT,
+    CONF_INTERNAL_SOLAR_POSITION,
     CONF_IRRADIANCE_SENSOR,
     CONF_OVERRIDES,
+    CONF_PRECISION,
     CONF_PROPERTIES,
     CONF_SCENARIO_FORECAST,
     CONF_SCENARIO_INDOOR,
@@ -32,30 +59,64 @@ from .const import (
     CONF_THRESHOLD_INDOOR,
     CONF_THRESHOLD_OUTDOOR,
     CONF_THRESHOLD_RADIATION,
+    CONF_TILT,
+    CONF_UPDATE_MODE,
     CONF_USE_IRRADIANCE_DIFFUSE,
     CONF_USE_TEMP_INDOOR,
     CONF_USE_TEMP_OUTDOOR,
     CONF_USE_WEATHER_CONDITION,
     CONF_USE_WEATHER_WARNING,
+    CONF_VISIBLE_AZIMUTH_END,
+    CONF_VISIBLE_AZIMUTH_START,
     CONF_WEATHER_CONDITION,
     CONF_WEATHER_WARNING,
     CONF_WIDTH,
     CONF_WINDOW_RECESS,
     CONF_WINDOWS,
+    DEFAULT_DEADBAND_ABSOLUTE,
+    DEFAULT_DEADBAND_RELATIVE,
+    DEFAULT_DEBOUNCE,
     DEFAULT_FORECAST_HIGH,
+    DEFAULT_FORECAST_TTL,
     DEFAULT_FRAME_WIDTH,
     DEFAULT_G_VALUE,
     DEFAULT_INSIDE_TEMP,
+    DEFAULT_INTERNAL_SOLAR_POSITION,
+    DEFAULT_MAX_SLEEP,
     DEFAULT_OUTSIDE_TEMP,
+    DEFAULT_PRECISION,
+    DEFAULT_PROFILE_INTERVAL,
     DEFAULT_SHADING_DEPTH,
     DEFAULT_SOLAR_ENERGY,
     DEFAULT_UPDATE_INTERVAL,
+    DEFAULT_UPDATE_MODE,
     DEFAULT_WINDOW_RECESS,
     DOMAIN,
     LEVEL_GLOBAL,
     LEVEL_GROUP,
     LEVEL_WINDOW,
+    UPDATE_MODE_PUSH,
 )
+from .dependencies import DependencyIndex
+from .entity import GLOBAL_DEVICE_INFO, PublishPolicy, build_device_info
+from .errors import RuntimeErrorCode, RuntimeErrorCollector, RuntimeErrorMessages
+from .forecast import ForecastCache
+from .inheritance import EffectiveValueTable
+from .performance import (
+    COUNTER_SERVICE_CALLS,
+    COUNTER_STATE_LOOKUPS,
+    PHASE_AGGREGATION,
+    PHASE_ENERGY,
+    PHASE_FORECAST,
+    PHASE_LISTENERS,
+    PHASE_SENSOR_READS,
+    PHASE_SHADING,
+    PerformanceMonitor,
+)
+from .profile import DayProfile, compute_day_profile
+from .snapshot import SensorSnapshot
+from .solar_position import next_sunrise, solar_position
+from .store import ConfigStore, ResultStore
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -101,11 +162,27 @@ class SolarCalculationCoordinator(DataUpdateCoordinator):
             overrides: Override values stored in persistent storage
             config_entry: The config entry this coordinator belongs to
         """
+        advanced = config.get(CONF_ADVANCED, {})
+
+        # Push mode recalculates on input changes instead of polling
+        self.push_mode = advanced.get(CONF_UPDATE_MODE, DEFAULT_UPDATE_MODE) == UPDATE_MODE_PUSH
+        # Compute the sun position ourselves instead of reading sun.sun
+        self.internal_solar_position = advanced.get(
+            CONF_INTERNAL_SOLAR_POSITION, DEFAULT_INTERNAL_SOLAR_POSITION
+        )
+
+        # Rounding and deadband of published power values
+        self.publish_policy = PublishPolicy(
+            precision=int(advanced.get(CONF_PRECISION, DEFAULT_PRECISION)),
+            absolute=advanced.get(CONF_DEADBAND_ABSOLUTE, DEFAULT_DEADBAND_ABSOLUTE),
+            relative=advanced.get(CONF_DEADBAND_RELATIVE, DEFAULT_DEADBAND_RELATIVE),
+        )
+
         super().__init__(
             hass,
             _LOGGER,
             name="Solar Window System",
-            update_interval=timedelta(seconds=DEFAULT_UPDATE_INTERVAL),
+            update_interval=None if self.push_mode else timedelta(seconds=DEFAULT_UPDATE_INTERVAL),
             config_entry=config_entry,
         )
 
@@ -122,12 +199,72 @@ class SolarCalculationCoordinator(DataUpdateCoordinator):
         self.windows = self._extract_windows()
         self.groups = self._extract_groups()
 
+        # Compiled window models and the batched calculation engine
+        self.window_models: dict[str, CompiledWindow] = {}
+        self._engine = WindowCalculationEngine({})
+
+        # Materialized thresholds/scenarios per window, group and global
+        self._effective_values = EffectiveValueTable(
+            self._resolve_effective_value,
+            [*DEFAULT_THRESHOLDS, *DEFAULT_SCENARIOS],
+        )
+        self._group_windows: dict[str, list[str]] = {}
+
+        # Group membership for aggregation: group -> windows, window -> groups
+        self._group_members: dict[str, list[str]] = {}
+        self._window_groups: dict[str, list[str]] = {}
+
+        # Sensor states read once per update cycle
+        self._snapshot = SensorSnapshot(hass)
+        self._sensor_entity_ids: set[str] = set()
+
+        # Weather forecasts shared by all windows
+        self._forecast_cache = ForecastCache(
+            hass, timedelta(minutes=advanced.get(CONF_FORECAST_TTL, DEFAULT_FORECAST_TTL))
+        )
+
+        # Phase timings of the update cycle for the runtime debug sensor
+        self.performance = PerformanceMonitor()
+
+        # Day-ahead profiles per day, recomputed when the forecast changes
+        self._day_profiles: dict[date, DayProfile] = {}
+
+        # Windows to recompute on the next cycle; None means all
+        self._dependencies = DependencyIndex()
+        self._dirty_windows: set[str] | None = None
+        self._shading_count = 0
+
+        # Update cycles and override patches must not interleave, or a cycle
+        # suspended mid-way publishes results from before the override
+        self._update_lock = asyncio.Lock()
+
+        # Shared device infos of windows and groups; the version is bumped on renames
+        self._device_infos: dict[str, DeviceInfo] = {}
+        self._display_names: dict[str, str] = {}
+        self.naming_version = 0
+
+        # State change subscription and debouncer for push mode
+        self._unsub_state_changes: CALLBACK_TYPE | None = None
+        self._push_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=advanced.get(CONF_DEBOUNCE, DEFAULT_DEBOUNCE),
+            immediate=True,
+            function=self.async_refresh,
+        )
+
+        # Wake-up timer while polling is suspended between sunset and sunrise
+        self._unsub_wake_up: CALLBACK_TYPE | None = None
+
+        self._rebuild_models()
+
         # Store reference to storage (set during async_setup_entry)
-        self._store: Store | None = None
+        self._store: ConfigStore | None = None
+        self._result_store: ResultStore | None = None
 
         # Error tracking for debug entities
         self._config_errors: list[str] = []
-        self._runtime_errors: list[str] = []
+        self._runtime_errors = RuntimeErrorCollector()
 
     def _extract_windows(self) -> dict:
         """Extract windows from subentries data."""
@@ -147,13 +284,432 @@ class SolarCalculationCoordinator(DataUpdateCoordinator):
                     groups[key] = data
         return groups
 
-    def set_store(self, store: Store) -> None:
+    def update_subentries(self, subentries: dict) -> list[str]:
+        """Replace windows and groups and rebuild the derived models.
+
+        Args:
+            subentries: Subentries data (windows and groups)
+
+        Returns:
+            Device keys (e.g. "window_<id>") of renamed windows and groups
+        """
+        self._subentries = subentries
+        self.windows = self._extract_windows()
+        self.groups = self._extract_groups()
+        return self._rebuild_models()
+
+    def _rebuild_models(self) -> list[str]:
+        """Rebuild all derived models after windows or groups changed.
+
+        Returns:
+            Device keys of renamed windows and groups
+        """
+        self._compile_windows()
+        self._rebuild_group_membership()
+        self._rebuild_effective_values()
+        self._collect_sensor_entity_ids()
+        self._rebuild_dependencies()
+        return self._rebuild_naming()
+
+    def _rebuild_naming(self) -> list[str]:
+        """Drop device infos of renamed or removed windows and groups.
+
+        Returns:
+            Device keys of renamed windows and groups
+        """
+        names = {
+            **{
+                f"{LEVEL_WINDOW}_{window_id}": window.get("name", window_id)
+                for window_id, window in self.windows.items()
+            },
+            **{
+                f"{LEVEL_GROUP}_{group_id}": group.get("name", group_id)
+                for group_id, group in self.groups.items()
+            },
+        }
+        renamed = [key for key, name in self._display_names.items() if names.get(key, name) != name]
+        for key in self._display_names.keys() - names.keys():
+            self._device_infos.pop(key, None)
+        for key in renamed:
+            self._device_infos.pop(key, None)
+        if renamed:
+            self.naming_version += 1
+        self._display_names = names
+        return renamed
+
+    def get_display_name(self, level: str, entity_id: str) -> str:
+        """Return the name of a window or group, "Global" for the global level."""
+        if level == LEVEL_WINDOW:
+            return self.windows.get(entity_id, {}).get("name", entity_id)
+        if level == LEVEL_GROUP:
+            return self.groups.get(entity_id, {}).get("name", entity_id)
+        return "Global"
+
+    def get_device_info(self, level: str, entity_id: str) -> DeviceInfo:
+        """Return the device info shared by all entities of a window or group.
+
+        Args:
+            level: One of LEVEL_WINDOW, LEVEL_GROUP, LEVEL_GLOBAL
+            entity_id: ID of the window, group, or "global"
+
+        Returns:
+            Cached DeviceInfo, rebuilt after the window or group was renamed
+        """
+        if level not in (LEVEL_WINDOW, LEVEL_GROUP):
+            return GLOBAL_DEVICE_INFO
+        key = f"{level}_{entity_id}"
+        device_info = self._device_infos.get(key)
+        if device_info is None:
+            device_info = self._device_infos[key] = build_device_info(
+                level, entity_id, self.get_display_name(level, entity_id)
+            )
+        return device_info
+
+    def _rebuild_dependencies(self) -> None:
+        """Rebuild the input -> window index and schedule a full recalculation."""
+        global_inputs = {"sun.sun"}
+        global_inputs.update(
+            entity_id
+            for key, entity_id in self.global_sensors.items()
+            if key != CONF_TEMP_INDOOR and isinstance(entity_id, str)
+        )
+        self._dependencies.rebuild(
+            global_inputs,
+            {window_id: [self._indoor_temp_sensor(window_id)] for window_id in self.windows},
+        )
+        self._dirty_windows = None
+
+    def _mark_entity_changed(self, entity_id: str) -> bool:
+        """Mark the windows depending on an input entity for recalculation.
+
+        Returns:
+            False if no window depends on the entity
+        """
+        window_ids = self._dependencies.windows_for_entity(entity_id)
+        if window_ids is None:
+            self._dirty_windows = None
+            return True
+        self._mark_windows_dirty(window_ids)
+        return bool(window_ids)
+
+    def _mark_windows_dirty(self, window_ids: Iterable[str]) -> None:
+        """Add windows to the next incremental recalculation."""
+        if self._dirty_windows is not None:
+            self._dirty_windows.update(window_ids)
+
+    async def _async_apply_override(self, level: str, entity_id: str) -> None:
+        """Recalculate the windows inheriting a changed override right away.
+
+        Global overrides are not inherited by windows or groups. Without
+        previous results the change is picked up by the next full cycle.
+        Either way the listeners are updated, so entities showing inherited
+        values publish the new effective values, also while sleeping. A
+        running update cycle is finished first and then patched.
+        """
+        if level == LEVEL_WINDOW:
+            window_ids = {entity_id}
+        elif level == LEVEL_GROUP:
+            window_ids = set(self._group_windows.get(entity_id, []))
+        else:
+            window_ids = set()
+
+        async with self._update_lock:
+            if not window_ids or not self._can_update_incrementally():
+                self.async_update_listeners()
+                return
+
+            self._snapshot.capture(())
+            try:
+                results = await self._update_windows(window_ids)
+            finally:
+                self._snapshot.release()
+            self.async_set_updated_data(results)
+
+    def _collect_sensor_entity_ids(self) -> None:
+        """Collect the distinct sensors referenced by global config, groups and windows."""
+        entity_ids = {value for value in self.global_sensors.values() if isinstance(value, str)}
+        for entry in (*self.groups.values(), *self.windows.values()):
+            sensors = entry.get(CONF_SENSORS, {})
+            entity_ids.update(value for value in sensors.values() if isinstance(value, str))
+
+        changed = entity_ids != self._sensor_entity_ids
+        self._sensor_entity_ids = entity_ids
+        if changed and self._unsub_state_changes is not None:
+            # Follow sensors added or removed by a reconfiguration
+            self._subscribe_state_changes()
+
+    @callback
+    def async_start_push_updates(self) -> None:
+        """Start recalculating on input changes if push mode is enabled."""
+        if self.push_mode and self._unsub_state_changes is None:
+            self._subscribe_state_changes()
+
+    @callback
+    def async_stop_push_updates(self) -> None:
+        """Stop listening for input changes and cancel pending recalculations."""
+        if self._unsub_state_changes is not None:
+            self._unsub_state_changes()
+            self._unsub_state_changes = None
+        self._push_debouncer.async_cancel()
+
+    def _subscribe_state_changes(self) -> None:
+        """(Re)subscribe to sun.sun and all referenced sensors."""
+        if self._unsub_state_changes is not None:
+            self._unsub_state_changes()
+        self._unsub_state_changes = async_track_state_change_event(
+            self.hass,
+            ["sun.sun", *sorted(self._sensor_entity_ids)],
+            self._async_handle_input_change,
+        )
+
+    @callback
+    def _async_handle_input_change(self, event: Event[EventStateChangedData]) -> None:
+        """Schedule a debounced recalculation after an input changed."""
+        # Results stay zero until sunrise, the wake-up recalculates everything
+        if self.sleeping:
+            return
+        if self._mark_entity_changed(event.data["entity_id"]):
+            self._push_debouncer.async_schedule_call()
+
+    @property
+    def sleeping(self) -> bool:
+        """Return True while updates are suspended until sunrise."""
+        return self._unsub_wake_up is not None
+
+    def _next_sunrise(self, now: datetime) -> datetime | None:
+        """Return the next sunrise from sun.sun or the internal solar position."""
+        if not self.internal_solar_position:
+            sun_state = self.hass.states.get("sun.sun")
+            next_rising = sun_state.attributes.get("next_rising") if sun_state else None
+            if isinstance(next_rising, str):
+                next_rising = dt_util.parse_datetime(next_rising)
+            if isinstance(next_rising, datetime):
+                return next_rising
+        return next_sunrise(now, self.hass.config.latitude, self.hass.config.longitude)
+
+    @callback
+    def _async_enter_sleep(self) -> None:
+        """Suspend polling after the zero results of the night were published.
+
+        The wake-up is scheduled at the next sunrise, at least one update
+        interval ahead, so a sun.sun state that lags behind its next_rising
+        attribute falls back to the regular polling rhythm.
+        """
+        if self.sleeping:
+            return
+        now = dt_util.utcnow()
+        wake_up = max(
+            self._next_sunrise(now) or now + timedelta(hours=DEFAULT_MAX_SLEEP),
+            now + timedelta(seconds=DEFAULT_UPDATE_INTERVAL),
+        )
+        _LOGGER.debug("Sun is down, sleeping until %s", wake_up)
+        self.update_interval = None
+        self._unsub_wake_up = async_track_point_in_utc_time(self.hass, self._async_wake_up, wake_up)
+
+    @callback
+    def _async_leave_sleep(self) -> None:
+        """Cancel the wake-up timer and resume polling."""
+        self.async_stop_sleep()
+        if not self.push_mode:
+            self.update_interval = timedelta(seconds=DEFAULT_UPDATE_INTERVAL)
+
+    @callback
+    def async_stop_sleep(self) -> None:
+        """Cancel a scheduled wake-up."""
+        if self._unsub_wake_up is not None:
+            self._unsub_wake_up()
+            self._unsub_wake_up = None
+
+    async def _async_wake_up(self, _now: datetime) -> None:
+        """Recalculate at sunrise; a calculation still at night sleeps again."""
+        self._unsub_wake_up = None
+        await self.async_refresh()
+
+    async def async_shutdown(self) -> None:
+        """Cancel push updates and the wake-up and shut down the coordinator."""
+        self.async_stop_push_updates()
+        self.async_stop_sleep()
+        self._push_debouncer.async_shutdown()
+        await super().async_shutdown()
+
+    def _compile_windows(self) -> None:
+        """Compile all windows and rebuild the calculation engine.
+
+        Must be called whenever windows or groups change, since compiled
+        windows contain values inherited from groups and global config.
+        """
+        self.window_models = {
+            window_id: compile_window(self._window_parameters(window_id))
+            for window_id in self.windows
+        }
+        self._engine = WindowCalculationEngine(self.window_models)
+        self._day_profiles = {}
+
+    def _window_parameters(self, window_id: str) -> WindowParameters:
+        """Resolve the calculation parameters of a window.
+
+        Geometry comes from the window itself, properties go through the
+        inheritance chain Window -> Group -> Global.
+
+        Args:
+            window_id: Window identifier string
+
+        Returns:
+            WindowParameters for the energy formulas
+        """
+        window = self.windows.get(window_id, {})
+        geometry = window.get(CONF_GEOMETRY, {})
+        azimuth = self._get_azimuth(window_id)
+        return WindowParameters(
+            width=geometry.get(CONF_WIDTH, 0),
+            height=geometry.get(CONF_HEIGHT, 0),
+            frame_width=self._get_window_property(window_id, CONF_FRAME_WIDTH),
+            g_value=self._get_window_property(window_id, CONF_G_VALUE),
+            azimuth=azimuth if azimuth is not None else 180,
+            tilt=geometry.get(CONF_TILT, 90),  # Default 90° = vertical
+            visible_azimuth_start=geometry.get(CONF_VISIBLE_AZIMUTH_START, 0),
+            visible_azimuth_end=geometry.get(CONF_VISIBLE_AZIMUTH_END, 360),
+            shading_depth=self._get_window_property(window_id, CONF_SHADING_DEPTH),
+            window_recess=self._get_window_property(window_id, CONF_WINDOW_RECESS),
+        )
+
+    def set_store(self, store: ConfigStore) -> None:
         """Set the storage reference for saving overrides."""
         self._store = store
 
+    def _overrides_data(self) -> dict:
+        """Return the override data written to storage."""
+        return {CONF_OVERRIDES: self._overrides}
+
+    def set_result_store(self, store: ResultStore) -> None:
+        """Set the storage reference for the last-result snapshot."""
+        self._result_store = store
+
+    def _results_data(self) -> dict:
+        """Return the results written to the snapshot."""
+        return self.data or {}
+
+    async def async_load_snapshot(self) -> bool:
+        """Seed the data with the stored results of the last run.
+
+        Entities start with the last known power and shading states while
+        the first calculation is still running. Windows and groups missing
+        from the snapshot start at zero.
+
+        Returns:
+            True if a recent snapshot was loaded
+        """
+        if self._result_store is None:
+            return False
+        snapshot = await self._result_store.async_load()
+        if not snapshot:
+            return False
+        data = {
+            key: {**values, "shading_recommended": False}
+            for key, values in self._get_zero_results().items()
+        }
+        data.update({key: values for key, values in snapshot.items() if key in data})
+        self.data = data
+        # Incremental updates patch the global shading through this counter
+        self._shading_count = sum(
+            bool(data[window_id]["shading_recommended"]) for window_id in self.windows
+        )
+        return True
+
+    def _rebuild_group_membership(self) -> None:
+        """Index which windows belong to which group.
+
+        Windows record their group via CONF_GROUP_ID, which is also what
+        they inherit from. Groups may additionally list windows in a
+        legacy "windows" list; those windows are aggregated as well.
+        """
+        self._group_windows = {}
+        for window_id, window in self.windows.items():
+            group_id = window.get(CONF_GROUP_ID)
+            if group_id and group_id in self.groups:
+                self._group_windows.setdefault(group_id, []).append(window_id)
+
+        self._group_members = {}
+        self._window_groups = {}
+        for group_id, group in self.groups.items():
+            # dict keeps the order and drops legacy entries already in the group
+            members = dict.fromkeys(self._group_windows.get(group_id, []))
+            members.update(
+                dict.fromkeys(
+                    window_id
+                    for window_id in group.get(CONF_WINDOWS, [])
+                    if window_id in self.windows
+                )
+            )
+            self._group_members[group_id] = list(members)
+            for window_id in members:
+                self._window_groups.setdefault(window_id, []).append(group_id)
+
+    def _rebuild_effective_values(self) -> None:
+        """Resolve thresholds and scenarios for every window, group and global."""
+        self._effective_values.rebuild(
+            [
+                (LEVEL_GLOBAL, LEVEL_GLOBAL),
+                *((LEVEL_GROUP, group_id) for group_id in self.groups),
+                *((LEVEL_WINDOW, window_id) for window_id in self.windows),
+            ]
+        )
+
+    def _refresh_effective_values(
+        self, level: str, entity_id: str, property_name: str | None = None
+    ) -> None:
+        """Refresh the table rows affected by an override change.
+
+        Group overrides are inherited by the group's windows, window and
+        global overrides only affect their own row.
+        """
+        if property_name is not None and property_name not in self._effective_values.properties:
+            return
+        keys = [(level, entity_id)]
+        if level == LEVEL_GROUP:
+            keys.extend(
+                (LEVEL_WINDOW, window_id) for window_id in self._group_windows.get(entity_id, [])
+            )
+        self._effective_values.refresh(keys, property_name)
+
     def get_effective_value(self, level: str, entity_id: str, property_name: str) -> Any:
         """Get effective value with inheritance: Window -> Group -> Global.
 
+        Thresholds and scenarios are served from the materialized table,
+        everything else is resolved on demand.
+
+        Args:
+            level: One of LEVEL_WINDOW, LEVEL_GROUP, LEVEL_GLOBAL
+            entity_id: ID of the window, group, or "global"
+            property_name: Name of the property to retrieve
+
+        Returns:
+            The effective value considering overrides and inheritance
+        """
+        row = self._effective_values.row(level, entity_id)
+        if row is not None and property_name in row:
+            return row[property_name]
+        return self._resolve_effective_value(level, entity_id, property_name)
+
+    def get_effective_values(self, level: str, entity_id: str) -> dict[str, Any]:
+        """Get all effective thresholds and scenarios of an entity.
+
+        Args:
+            level: One of LEVEL_WINDOW, LEVEL_GROUP, LEVEL_GLOBAL
+            entity_id: ID of the window, group, or "global"
+
+        Returns:
+            Dictionary of threshold and scenario values
+        """
+        row = self._effective_values.row(level, entity_id)
+        if row is None:
+            self._effective_values.refresh([(level, entity_id)])
+            row = self._effective_values.row(level, entity_id) or {}
+        return row
+
+    def _resolve_effective_value(self, level: str, entity_id: str, property_name: str) -> Any:
+        """Walk the inheritance chain for a single value.
+
         Args:
             level: One of LEVEL_WINDOW, LEVEL_GROUP, LEVEL_GLOBAL
             entity_id: ID of the window, group, or "global"
@@ -221,10 +777,13 @@ class SolarCalculationCoordinator(DataUpdateCoordinator):
             self._overrides[level][entity_id] = {}
 
         self._overrides[level][entity_id][property_name] = value
+        self._refresh_effective_values(level, entity_id, property_name)
 
-        # Persist to storage
+        # Persist to storage (coalesced, written behind)
         if self._store:
-            await self._store.async_save({CONF_OVERRIDES: self._overrides})
+            self._store.async_schedule_save(self._overrides_data)
+
+        await self._async_apply_override(level, entity_id)
 
     async def clear_overrides(self, level: str, entity_id: str) -> None:
         """Clear all overrides for a specific entity.
@@ -235,9 +794,11 @@ class SolarCalculationCoordinator(DataUpdateCoordinator):
         """
         if level in self._overrides and entity_id in self._overrides[level]:
             del self._overrides[level][entity_id]
-            # Persist to storage
+            self._refresh_effective_values(level, entity_id)
+            # Persist to storage (coalesced, written behind)
             if self._store:
-                await self._store.async_save({CONF_OVERRIDES: self._overrides})
+                self._store.async_schedule_save(self._overrides_data)
+            await self._async_apply_override(level, entity_id)
 
     def _get_window_property(self, window_id: str, property_name: str) -> Any:
         """Get window property with full inheritance chain."""
@@ -273,36 +834,10 @@ class SolarCalculationCoordinator(DataUpdateCoordinator):
         Returns:
             True if sun is visible, False otherwise
         """
-        # Check if sun is above horizon
-        if elevation <= 0:
-            return False
-
-        # Get window configuration
-        window = self.windows.get(window_id, {})
-
-        # Extract geometry and properties from window dict
-        geometry = window.get(CONF_GEOMETRY, {})
-        _ = window.get(CONF_PROPERTIES, {})  # Properties used by _get_window_property
-
-        # Check azimuth range
-        az_start = geometry.get("visible_azimuth_start", 0)
-        az_end = geometry.get("visible_azimuth_end", 360)
-
-        if not (az_start <= azimuth <= az_end):
-            return False
-
-        # Check shading (roof overhangs, balconies, etc.) using inherited properties
-        shading_depth = self._get_window_property(window_id, CONF_SHADING_DEPTH)
-        if shading_depth > 0:
-            window_recess = self._get_window_property(window_id, CONF_WINDOW_RECESS)
-            # Calculate shade angle: angle at which shading blocks the sun
-            # atan2(window_recess, shading_depth) gives elevation angle from horizontal
-            # The +1 prevents division by zero
-            shade_angle = math.degrees(math.atan2(window_recess + 1, shading_depth))
-            if elevation < shade_angle:
-                return False
-
-        return True
+        window = self.window_models.get(window_id)
+        if window is None:
+            window = compile_window(self._window_parameters(window_id))
+        return sun_is_visible(elevation, azimuth, window)
 
     async def _safe_get_sensor(
         self, entity_id: str, default=None, error_context: str | None = None
@@ -321,33 +856,42 @@ class SolarCalculationCoordinator(DataUpdateCoordinator):
         if entity_id is None:
             return default
 
-        # Get the state from Home Assistant
-        state = self.hass.states.get(entity_id)
+        # Served from the cycle snapshot, or read live outside a cycle
+        reading = self._snapshot.get(entity_id)
 
         # Check if state exists and is not in a special state
-        if state is None:
-            context = f" ({error_context})" if error_context else ""
-            self.add_runtime_error(f"Sensor '{entity_id}' nicht gefunden{context}")
+        if reading.state is None:
+            self._runtime_errors.add(
+                RuntimeErrorCode.SENSOR_NOT_FOUND, entity_id, context=error_context
+            )
             return default
 
-        if state.state in ["unknown", "unavailable", None]:
-            context = f" ({error_context})" if error_context else ""
-            self.add_runtime_error(f"Sensor '{entity_id}': Status '{state.state}'{context}")
+        if reading.state in ["unknown", "unavailable"]:
+            self._runtime_errors.add(
+                RuntimeErrorCode.SENSOR_STATE, entity_id, reading.state, error_context
+            )
             return default
 
-        # Try to convert to float
-        try:
-            return float(state.state)
-        except ValueError:
-            context = f" ({error_context})" if error_context else ""
-            self.add_runtime_error(
-                f"Sensor '{entity_id}': Ungültiger Wert '{state.state}'{context}"
+        if reading.value is None:
+            self._runtime_errors.add(
+                RuntimeErrorCode.SENSOR_INVALID_VALUE, entity_id, reading.state, error_context
             )
             return default
-        except AttributeError:
-            return default
-        except KeyError:
-            return default
+
+        return reading.value
+
+    def _get_sensor_state(self, entity_id: str | None) -> str | None:
+        """Get the raw state of a non-numeric sensor (e.g., a binary sensor).
+
+        Args:
+            entity_id: Home Assistant entity ID
+
+        Returns:
+            Raw state string, or None if not configured or not found
+        """
+        if entity_id is None:
+            return None
+        return self._snapshot.get(entity_id).state
 
     def _estimate_diffuse(
         self,
@@ -422,139 +966,197 @@ class SolarCalculationCoordinator(DataUpdateCoordinator):
         }
         return results
 
-    def _calculate_direct_energy(
-        self, irradiance_direct: float, elevation: float, azimuth: float, window: dict
-    ) -> float:
-        """Calculate direct solar energy through a window.
+    def _aggregate(self, results: dict) -> None:
+        """Add group and global aggregations to the window results.
+
+        Accumulates energy and shading into group buckets and the global
+        total in a single pass over the window results. Group and global
+        shading is ON if any of their windows recommends shading.
 
         Args:
-            irradiance_direct: Direct solar irradiance in W/m²
-            elevation: Sun elevation angle in degrees
-            azimuth: Sun azimuth angle in degrees
-            window: Window configuration dictionary
+            results: Window results with direct, diffuse, combined energy and
+                shading recommendation; group_* and global entries are added
+        """
+        buckets = {
+            group_id: {"direct": 0, "diffuse": 0, "combined": 0, "shading_recommended": False}
+            for group_id in self.groups
+        }
+        total = {"direct": 0, "diffuse": 0, "combined": 0, "shading_recommended": False}
+        shading_count = 0
+
+        for window_id in self.windows:
+            window_data = results.get(window_id)
+            if window_data is None:
+                continue
+            direct = window_data["direct"]
+            diffuse = window_data["diffuse"]
+            combined = window_data["combined"]
+            shading = window_data["shading_recommended"]
+            shading_count += shading
+
+            for bucket in (total, *(buckets[g] for g in self._window_groups.get(window_id, ()))):
+                bucket["direct"] += direct
+                bucket["diffuse"] += diffuse
+                bucket["combined"] += combined
+                bucket["shading_recommended"] = bucket["shading_recommended"] or shading
+
+        for group_id, bucket in buckets.items():
+            results[f"group_{group_id}"] = bucket
+        results["global"] = total
+        self._shading_count = shading_count
+
+    async def _async_update_data(self) -> dict:
+        """Update solar energy calculations.
 
         Returns:
-            Direct energy in watts
+            Dictionary with calculation results for each window
         """
-        geometry = window.get("geometry", {})
-        properties = window.get("properties", {})
+        self.performance.start_cycle()
+        lookups = self._snapshot.lookups
+        try:
+            async with self._update_lock:
+                results = await self._async_update_cycle()
+        finally:
+            self.performance.count(COUNTER_STATE_LOOKUPS, self._snapshot.lookups - lookups)
+            self.performance.finish_cycle()
+
+        # Keep the snapshot for the next start reasonably fresh
+        if self._result_store is not None:
+            self._result_store.async_schedule_save(self._results_data)
+        return results
+
+    async def _async_update_cycle(self) -> dict:
+        """Run one update cycle, incrementally or as a full calculation."""
+        dirty_windows, self._dirty_windows = self._dirty_windows, set()
 
-        # Get dimensions and properties
-        width = geometry.get("width", 0)
-        height = geometry.get("height", 0)
-        frame_width = properties.get("frame_width", 0)
-        g_value = properties.get("g_value", DEFAULT_G_VALUE)
-        window_azimuth = geometry.get("azimuth", 180)
-        window_tilt = geometry.get("tilt", 90)  # Default 90° = vertical
+        # Push mode: only the windows affected by the changed inputs. Polling
+        # cycles and refreshes without tracked changes recalculate everything.
+        if self.push_mode and dirty_windows and self._can_update_incrementally():
+            # Sensors are read on demand, only for the affected windows
+            self._snapshot.capture(())
+            try:
+                return await self._update_windows(dirty_windows)
+            finally:
+                self._snapshot.release()
+
+        # Clear runtime errors from previous cycle
+        self.clear_runtime_errors()
 
-        # Calculate effective area (subtract frame on all sides)
-        # Area is in cm², convert to m² (divide by 10000)
-        effective_area_m2 = ((width - 2 * frame_width) * (height - 2 * frame_width)) / 10000
+        # Read every referenced sensor once for this cycle
+        with self.performance.phase(PHASE_SENSOR_READS):
+            self._snapshot.capture(self._sensor_entity_ids)
+        try:
+            return await self._calculate_results()
+        finally:
+            self._snapshot.release()
 
-        # Calculate incidence factor considering tilt angle
-        # Formula: cos(θ) = sin(α)*cos(β) + cos(α)*sin(β)*cos(γ-δ)
-        # Where: α=elevation, β=tilt, γ=sun_azimuth, δ=window_azimuth
-        alpha = math.radians(elevation)
-        beta = math.radians(window_tilt)
-        azimuth_diff = math.radians(azimuth - window_azimuth)
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all registered listeners and time the fan-out."""
+        with self.performance.phase(PHASE_LISTENERS):
+            super().async_update_listeners()
 
-        incidence_factor = math.sin(alpha) * math.cos(beta) + math.cos(alpha) * math.sin(
-            beta
-        ) * math.cos(azimuth_diff)
-        incidence_factor = max(0, incidence_factor)  # No negative values
+    def _can_update_incrementally(self) -> bool:
+        """Check if the last results are a full daytime calculation to patch."""
+        return bool(self.data) and "shading_recommended" in self.data.get("global", {})
 
-        # Calculate direct energy
-        return irradiance_direct * effective_area_m2 * incidence_factor * g_value
+    async def _update_windows(self, window_ids: set[str]) -> dict:
+        """Recalculate shading for some windows and patch groups and global.
 
-    def _calculate_diffuse_energy(self, irradiance_diffuse: float, window: dict) -> float:
-        """Calculate diffuse solar energy through a window.
+        Energy only depends on the sun and irradiance, which are global
+        inputs and always trigger a full calculation, so only the shading
+        recommendations of the affected windows change here.
 
         Args:
-            irradiance_diffuse: Diffuse solar irradiance in W/m²
-            window: Window configuration dictionary
+            window_ids: IDs of the windows to recalculate
 
         Returns:
-            Diffuse energy in watts
+            Copy of the previous results with the affected entries replaced
         """
-        geometry = window.get("geometry", {})
-        properties = window.get("properties", {})
-
-        # Get dimensions and properties
-        width = geometry.get("width", 0)
-        height = geometry.get("height", 0)
-        frame_width = properties.get("frame_width", 0)
-        g_value = properties.get("g_value", DEFAULT_G_VALUE)
-        window_tilt = geometry.get("tilt", 90)  # Default 90° = vertical
-
-        # Calculate effective area (subtract frame on all sides)
-        # Area is in cm², convert to m² (divide by 10000)
-        effective_area_m2 = ((width - 2 * frame_width) * (height - 2 * frame_width)) / 10000
+        results = dict(self.data)
 
-        # Calculate diffuse incidence factor based on tilt
-        # Horizontal (0°) sees full sky, vertical (90°) sees half
-        # Formula: (1 + cos(β)) / 2 where β = tilt angle
-        incidence_factor = (1 + math.cos(math.radians(window_tilt))) / 2
+        # Errors of the re-read indoor sensors are recorded again if they persist
+        self._runtime_errors.discard_entities(
+            {self._indoor_temp_sensor(window_id) for window_id in window_ids} - {None}
+        )
 
-        # Calculate diffuse energy
-        return irradiance_diffuse * effective_area_m2 * incidence_factor * g_value
+        changed = []
+        with self.performance.phase(PHASE_SHADING):
+            for window_id in window_ids:
+                previous = results.get(window_id)
+                if previous is None:
+                    continue
+                shading = await self._should_shade(window_id, previous["combined"])
+                if shading != previous["shading_recommended"]:
+                    results[window_id] = {**previous, "shading_recommended": shading}
+                    self._shading_count += 1 if shading else -1
+                    changed.append(window_id)
+
+        if not changed:
+            return results
+
+        with self.performance.phase(PHASE_AGGREGATION):
+            # Group shading is ON if any window recommends shading
+            affected_groups = {
+                group_id
+                for window_id in changed
+                for group_id in self._window_groups.get(window_id, ())
+            }
+            for group_id in affected_groups:
+                key = f"group_{group_id}"
+                results[key] = {
+                    **results[key],
+                    "shading_recommended": any(
+                        results[wid]["shading_recommended"] for wid in self._group_members[group_id]
+                    ),
+                }
+
+            results["global"] = {
+                **results["global"],
+                "shading_recommended": self._shading_count > 0,
+            }
+        return results
 
-    def _aggregate_group(self, window_ids: list, results: dict) -> dict:
-        """Aggregate energy values for a group of windows.
+    def _get_sun_position(self) -> tuple[float, float] | None:
+        """Get the current sun elevation and azimuth.
 
-        Args:
-            window_ids: List of window IDs to aggregate
-            results: Dictionary containing calculation results for each window
+        Uses the internal solar position calculation if enabled, otherwise
+        the attributes of sun.sun.
 
         Returns:
-            Dictionary with aggregated direct, diffuse, and combined energy
+            Tuple of (elevation, azimuth) in degrees, or None at night
         """
-        aggregated = {"direct": 0, "diffuse": 0, "combined": 0}
-        for window_id in window_ids:
-            if window_id in results:
-                window_data = results[window_id]
-                aggregated["direct"] += window_data.get("direct", 0)
-                aggregated["diffuse"] += window_data.get("diffuse", 0)
-                aggregated["combined"] += window_data.get("combined", 0)
-        return aggregated
-
-    def _aggregate_all(self, results: dict) -> dict:
-        """Aggregate energy values for all windows (global aggregation).
+        if self.internal_solar_position:
+            elevation, azimuth = solar_position(
+                dt_util.utcnow(), self.hass.config.latitude, self.hass.config.longitude
+            )
+            if elevation <= 0:
+                return None
+            return elevation, azimuth
 
-        Args:
-            results: Dictionary containing calculation results for windows and groups
+        sun_state = self.hass.states.get("sun.sun")
+        self.performance.count(COUNTER_STATE_LOOKUPS)
+        if sun_state is None or sun_state.state == "below_horizon":
+            return None
 
-        Returns:
-            Dictionary with aggregated direct, diffuse, and combined energy
-        """
-        aggregated = {"direct": 0, "diffuse": 0, "combined": 0}
-        for key, value in results.items():
-            # Skip group_* and global keys (only sum actual windows)
-            if not key.startswith("group_") and key != "global":
-                aggregated["direct"] += value.get("direct", 0)
-                aggregated["diffuse"] += value.get("diffuse", 0)
-                aggregated["combined"] += value.get("combined", 0)
-        return aggregated
+        sun_attrs = sun_state.attributes
+        return sun_attrs.get("elevation", 0), sun_attrs.get("azimuth", 180)
 
-    async def _async_update_data(self) -> dict:
-        """Update solar energy calculations.
+    async def _calculate_results(self) -> dict:
+        """Calculate energy and shading results from the current snapshot.
 
         Returns:
-            Dictionary with calculation results for each window
+            Dictionary with calculation results for each window, group and global
         """
-        # Clear runtime errors from previous cycle
-        self.clear_runtime_errors()
-
-        # Get sun state
-        sun_state = self.hass.states.get("sun.sun")
+        sun_position = self._get_sun_position()
 
-        # Check if it's night
-        if sun_state is None or sun_state.state == "below_horizon":
+        # Check if it's night: publish zeros once and sleep until sunrise
+        if sun_position is None:
+            self._async_enter_sleep()
             return self._get_zero_results()
+        self._async_leave_sleep()
 
-        # Get sun position from attributes
-        sun_attrs = sun_state.attributes
-        elevation = sun_attrs.get("elevation", 0)
-        azimuth = sun_attrs.get("azimuth", 180)
+        elevation, azimuth = sun_position
 
         # Get total irradiance from sensor
         irradiance_total = await self._safe_get_sensor(
@@ -584,53 +1186,25 @@ class SolarCalculationCoordinator(DataUpdateCoordinator):
         irradiance_direct = max(0, irradiance_direct)
         irradiance_diffuse = max(0, irradiance_diffuse)
 
-        # Calculate energy for each window
-        results = {}
-        shading_results = {}
-        for window_id, window in self.windows.items():
-            # Check if sun is visible through this window
-            if self._sun_is_visible(elevation, azimuth, window_id):
-                # Calculate both direct and diffuse energy
-                direct = self._calculate_direct_energy(
-                    irradiance_direct, elevation, azimuth, window
-                )
-                diffuse = self._calculate_diffuse_energy(irradiance_diffuse, window)
-            else:
-                # Sun not visible, only diffuse energy
-                direct = 0
-                diffuse = self._calculate_diffuse_energy(irradiance_diffuse, window)
-
-            # Calculate combined energy
-            combined = direct + diffuse
-
-            # Store results
-            results[window_id] = {
-                "direct": direct,
-                "diffuse": diffuse,
-                "combined": combined,
-            }
-
-            # Calculate shading recommendation
-            shading_results[window_id] = await self._should_shade(window_id, combined)
-
-        # Calculate group aggregations
-        for group_id, group in self.groups.items():
-            group_result = self._aggregate_group(group.get("windows", []), results)
-            results[f"group_{group_id}"] = group_result
-            # Group shading is ON if any window recommends shading
-            shading_results[f"group_{group_id}"] = any(
-                shading_results.get(wid, False) for wid in group.get("windows", [])
+        # Calculate energy for all windows in one batched pass
+        with self.performance.phase(PHASE_ENERGY):
+            results = self._engine.calculate(
+                elevation, azimuth, irradiance_direct, irradiance_diffuse
             )
 
-        # Calculate global aggregation
-        global_result = self._aggregate_all(results)
-        results["global"] = global_result
-        # Global shading is ON if any window recommends shading
-        shading_results["global"] = any(shading_results.get(wid, False) for wid in self.windows)
+        with self.performance.phase(PHASE_SHADING):
+            for window_id, window_result in results.items():
+                # Visibility is only needed inside the engine
+                del window_result["visible"]
+
+                # Calculate shading recommendation
+                window_result["shading_recommended"] = await self._should_shade(
+                    window_id, window_result["combined"]
+                )
 
-        # Merge energy results with shading results
-        for key in results:
-            results[key]["shading_recommended"] = shading_results.get(key, False)
+        # Calculate group and global aggregations
+        with self.performance.phase(PHASE_AGGREGATION):
+            self._aggregate(results)
 
         return results
 
@@ -647,41 +1221,44 @@ class SolarCalculationCoordinator(DataUpdateCoordinator):
         # 1. Check weather warning (master override - disables all recommendations)
         weather_warning = self.global_sensors.get("weather_warning")
         if self.config.get(CONF_USE_WEATHER_WARNING) and weather_warning:
-            warning_state = await self._safe_get_sensor(weather_warning, default="off")
-            if warning_state == "on":
+            if self._get_sensor_state(weather_warning) == "on":
                 return False
 
+        effective = self.get_effective_values(LEVEL_WINDOW, window_id)
         triggers = []
 
-        # 2. Szenario Indoor
-        if self.get_effective_value(LEVEL_WINDOW, window_id, CONF_SCENARIO_INDOOR):
+        # Indoor temperature is shared by the indoor and forecast scenarios
+        indoor_temp = None
+        if effective[CONF_SCENARIO_INDOOR] or effective[CONF_SCENARIO_FORECAST]:
             indoor_temp = await self._get_indoor_temp(window_id)
-            threshold = self.get_effective_value(LEVEL_WINDOW, window_id, CONF_THRESHOLD_INDOOR)
+
+        # 2. Szenario Indoor
+        if effective[CONF_SCENARIO_INDOOR]:
+            threshold = effective[CONF_THRESHOLD_INDOOR]
             if indoor_temp and indoor_temp > threshold:
                 triggers.append("indoor_temp")
 
         # 3. Szenario Outdoor
-        if self.get_effective_value(LEVEL_WINDOW, window_id, CONF_SCENARIO_OUTDOOR):
+        if effective[CONF_SCENARIO_OUTDOOR]:
             outdoor_temp = None
             if self.config.get(CONF_USE_TEMP_OUTDOOR):
                 outdoor_temp = await self._safe_get_sensor(
                     self.global_sensors.get("temp_outdoor"), default=None
                 )
-            threshold = self.get_effective_value(LEVEL_WINDOW, window_id, CONF_THRESHOLD_OUTDOOR)
+            threshold = effective[CONF_THRESHOLD_OUTDOOR]
             if outdoor_temp and outdoor_temp > threshold:
                 triggers.append("outdoor_temp")
 
         # 4. Szenario Forecast
-        if self.get_effective_value(LEVEL_WINDOW, window_id, CONF_SCENARIO_FORECAST):
+        if effective[CONF_SCENARIO_FORECAST]:
             forecast_high = await self._get_forecast_high()
-            threshold = self.get_effective_value(LEVEL_WINDOW, window_id, CONF_THRESHOLD_FORECAST)
-            indoor_temp = await self._get_indoor_temp(window_id)
+            threshold = effective[CONF_THRESHOLD_FORECAST]
             if forecast_high and indoor_temp:
                 if forecast_high > threshold and indoor_temp > threshold - 2:
                     triggers.append("forecast")
 
         # 5. Solarenergie-Check (zusätzlich zu Temp-Triggers)
-        rad_threshold = self.get_effective_value(LEVEL_WINDOW, window_id, CONF_THRESHOLD_RADIATION)
+        rad_threshold = effective[CONF_THRESHOLD_RADIATION]
         if combined_energy > rad_threshold and triggers:
             return True
 
@@ -715,29 +1292,30 @@ class SolarCalculationCoordinator(DataUpdateCoordinator):
         _LOGGER.debug("Window '%s' has neither direct nor inherited orientation", window_id)
         return None
 
-    async def _get_indoor_temp(self, window_id: str) -> float | None:
-        """Get indoor temperature for window with inheritance: Window -> Group -> Global."""
+    def _indoor_temp_sensor(self, window_id: str) -> str | None:
+        """Resolve the indoor temperature sensor of a window: Window -> Group -> Global."""
         window = self.windows.get(window_id, {})
 
         # Priority 1: Window direct sensor
         window_sensors = window.get(CONF_SENSORS, {})
         if CONF_TEMP_INDOOR in window_sensors:
-            return await self._safe_get_sensor(window_sensors[CONF_TEMP_INDOOR], default=None)
+            return window_sensors[CONF_TEMP_INDOOR]
 
         # Priority 2: Group sensor
         group_id = window.get(CONF_GROUP_ID)
-
-        # Try group sensor first if window belongs to a group
         if group_id and group_id in self.groups:
-            group = self.groups[group_id]
-            group_sensor = group.get(CONF_SENSORS, {}).get(CONF_TEMP_INDOOR)
+            group_sensor = self.groups[group_id].get(CONF_SENSORS, {}).get(CONF_TEMP_INDOOR)
             if group_sensor:
-                return await self._safe_get_sensor(group_sensor, default=None)
+                return group_sensor
 
         # Priority 3: Global sensor (if configured)
-        global_sensor = self.global_sensors.get(CONF_TEMP_INDOOR)
-        if global_sensor:
-            return await self._safe_get_sensor(global_sensor, default=None)
+        return self.global_sensors.get(CONF_TEMP_INDOOR) or None
+
+    async def _get_indoor_temp(self, window_id: str) -> float | None:
+        """Get indoor temperature for window with inheritance: Window -> Group -> Global."""
+        sensor = self._indoor_temp_sensor(window_id)
+        if sensor is not None:
+            return await self._safe_get_sensor(sensor, default=None)
 
         # Priority 4: None - log debug error
         _LOGGER.debug(
@@ -746,36 +1324,84 @@ class SolarCalculationCoordinator(DataUpdateCoordinator):
         )
         return None
 
+    async def async_get_day_profile(self, day: date | None = None) -> DayProfile:
+        """Get the heat gain profile of all windows for a day.
+
+        The profile is computed in the executor once per day and again
+        when the forecast cloud coverage for that day changes.
+
+        Args:
+            day: Local date, defaults to today
+
+        Returns:
+            DayProfile with direct, diffuse and combined energy per window
+        """
+        today = dt_util.now().date()
+        day = day or today
+        cloud_coverage = await self._get_forecast_cloud_coverage(day)
+
+        profile = self._day_profiles.get(day)
+        if profile is not None and profile.cloud_coverage == cloud_coverage:
+            return profile
+
+        profile = await self.hass.async_add_executor_job(
+            compute_day_profile,
+            self._engine,
+            self.hass.config.latitude,
+            self.hass.config.longitude,
+            dt_util.start_of_local_day(day),
+            timedelta(minutes=DEFAULT_PROFILE_INTERVAL),
+            cloud_coverage,
+        )
+        # Profiles of past days are not needed anymore
+        self._day_profiles = {
+            cached_day: cached
+            for cached_day, cached in self._day_profiles.items()
+            if cached_day >= today
+        }
+        self._day_profiles[day] = profile
+        return profile
+
+    async def _get_forecast_cloud_coverage(self, day: date) -> float | None:
+        """Get the forecast cloud coverage in percent for a local date."""
+        weather_entity = self.global_sensors.get(CONF_WEATHER_CONDITION)
+        if not self.config.get(CONF_USE_WEATHER_CONDITION) or not weather_entity:
+            return None
+
+        for forecast in await self._forecast_cache.async_get(weather_entity) or []:
+            if not isinstance(forecast, dict):
+                continue
+            forecast_time = dt_util.parse_datetime(str(forecast.get("datetime", "")))
+            if forecast_time is None or dt_util.as_local(forecast_time).date() != day:
+                continue
+            cloud_coverage = forecast.get("cloud_coverage")
+            if isinstance(cloud_coverage, (int, float)):
+                return float(cloud_coverage)
+            return None
+        return None
+
     async def _get_forecast_high(self) -> float | None:
         """Get forecasted high temperature for today."""
         # Check if weather condition sensor is enabled
         if not self.config.get(CONF_USE_WEATHER_CONDITION):
             return None
 
-        # Try to get forecast from weather entity
-        try:
-            # Call weather service to get forecast
-            response = await self.hass.services.async_call(
-                "weather",
-                "get_forecasts",
-                {
-                    "entity_id": self.global_sensors.get(CONF_WEATHER_CONDITION),
-                    "type": "daily",
-                },
-                blocking=True,
-                return_response=True,
-            )
-            if response:
-                # Extract high temperature from forecast
-                forecast_data = response.get("forecast", [])
-                if isinstance(forecast_data, list) and forecast_data:
-                    first_forecast = forecast_data[0]
-                    if isinstance(first_forecast, dict):
-                        temp = first_forecast.get("temperature")
-                        if isinstance(temp, (int, float)):
-                            return float(temp)
-        except Exception:
-            pass
+        weather_entity = self.global_sensors.get(CONF_WEATHER_CONDITION)
+        if not weather_entity:
+            return None
+
+        # Served from the forecast cache, refreshed after TTL or weather update
+        fetches = self._forecast_cache.misses
+        with self.performance.phase(PHASE_FORECAST):
+            forecast_data = await self._forecast_cache.async_get(weather_entity)
+        self.performance.count(COUNTER_SERVICE_CALLS, self._forecast_cache.misses - fetches)
+        if forecast_data:
+            # Extract high temperature from forecast
+            first_forecast = forecast_data[0]
+            if isinstance(first_forecast, dict):
+                temp = first_forecast.get("temperature")
+                if isinstance(temp, (int, float)):
+                    return float(temp)
 
         return None
 
@@ -844,15 +1470,39 @@ class SolarCalculationCoordinator(DataUpdateCoordinator):
         """Return cached configuration errors."""
         return self._config_errors
 
-    def get_runtime_errors(self) -> list[str]:
-        """Return cached runtime errors from last update cycle."""
-        return self._runtime_errors
+    def get_runtime_errors(self) -> RuntimeErrorMessages:
+        """Return runtime errors from last update cycle, rendered on access."""
+        return self._runtime_errors.messages()
+
+    def get_runtime_error_counts(self) -> dict[str, int]:
+        """Return how often each kind of runtime error occurred in the last cycle."""
+        return dict(self._runtime_errors.counts)
+
+    def get_cache_statistics(self) -> dict[str, dict[str, int]]:
+        """Return hit and miss counters of the forecast, sensor and inheritance caches."""
+        return {
+            "forecast": {
+                "hits": self._forecast_cache.hits,
+                "misses": self._forecast_cache.misses,
+            },
+            "sensor_snapshot": {
+                "hits": self._snapshot.hits,
+                "misses": self._snapshot.misses,
+                "state_reads": self._snapshot.lookups,
+                "tracked_entities": len(self._sensor_entity_ids),
+            },
+            "inheritance_table": {
+                "hits": self._effective_values.hits,
+                "misses": self._effective_values.misses,
+                "rows": len(self._effective_values),
+            },
+            "day_profile": {"cached_days": len(self._day_profiles)},
+        }
 
     def add_runtime_error(self, error: str) -> None:
-        """Add a runtime error to the tracking list."""
-        if error not in self._runtime_errors:
-            self._runtime_errors.append(error)
+        """Add a free-text runtime error to the tracking list."""
+        self._runtime_errors.add(RuntimeErrorCode.MESSAGE, detail=error)
 
     def clear_runtime_errors(self) -> None:
         """Clear runtime errors before new update cycle."""
-        self._runtime_errors = []
+        self._runtime_errors.clear()
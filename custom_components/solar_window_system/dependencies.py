@@ -0,0 +1,50 @@
+"""Dependency index between inputs and the windows they affect.
+
+Sun position, irradiance and the other global inputs affect every
+window. Indoor temperature sensors only affect the windows that resolve
+to them, so a change there only requires recomputing those windows and
+patching their groups and the global result.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+
+
+class DependencyIndex:
+    """Map input entities to the windows that have to be recomputed."""
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._global_inputs: set[str] = set()
+        self._entity_windows: dict[str, set[str]] = {}
+
+    def rebuild(
+        self,
+        global_inputs: Iterable[str],
+        window_inputs: Mapping[str, Iterable[str | None]],
+    ) -> None:
+        """Rebuild the index after the configuration changed.
+
+        Args:
+            global_inputs: Entities every window depends on
+            window_inputs: Input entities per window ID
+        """
+        self._global_inputs = set(global_inputs)
+
+        self._entity_windows = {}
+        for window_id, entity_ids in window_inputs.items():
+            for entity_id in entity_ids:
+                if entity_id:
+                    self._entity_windows.setdefault(entity_id, set()).add(window_id)
+
+    def windows_for_entity(self, entity_id: str) -> set[str] | None:
+        """Return the windows affected by an input entity.
+
+        Returns:
+            Set of window IDs (empty if unrelated), or None if the entity
+            is a global input and all windows are affected
+        """
+        if entity_id in self._global_inputs:
+            return None
+        return self._entity_windows.get(entity_id, set())
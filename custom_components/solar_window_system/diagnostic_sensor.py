@@ -9,10 +9,11 @@ from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DEBUG_TYPE_CONFIG, DEBUG_TYPE_RUNTIME, DOMAIN
+from .entity import GLOBAL_DEVICE_INFO
+from .performance import COUNTER_SERVICE_CALLS, COUNTER_STATE_LOOKUPS
 
 if TYPE_CHECKING:
     from .coordinator import SolarCalculationCoordinator
@@ -39,6 +40,8 @@ class DebugSensorBase(CoordinatorEntity, SensorEntity):
     """Base class for debug sensors."""
 
     coordinator: SolarCalculationCoordinator
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_info = GLOBAL_DEVICE_INFO
     _debug_type: str
 
     def __init__(
@@ -54,25 +57,7 @@ class DebugSensorBase(CoordinatorEntity, SensorEntity):
         """
         super().__init__(coordinator)
         self._debug_type = debug_type
-
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID for this sensor."""
-        return f"{DOMAIN}_debug_{self._debug_type}"
-
-    @property
-    def entity_category(self):
-        """Return the entity category."""
-        return EntityCategory.DIAGNOSTIC
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, "global")},
-            name="Solar Window System Global",
-            manufacturer="Solar Window System",
-        )
+        self._attr_unique_id = f"{DOMAIN}_debug_{debug_type}"
 
     def _get_error_count_text(self, count: int) -> str:
         """Return formatted error count text."""
@@ -87,15 +72,12 @@ class DebugSensorBase(CoordinatorEntity, SensorEntity):
 class ConfigDebugSensor(DebugSensorBase):
     """Sensor showing configuration errors."""
 
+    _attr_name = "Solar Window System Debug Config"
+
     def __init__(self, coordinator: SolarCalculationCoordinator) -> None:
         """Initialize the config debug sensor."""
         super().__init__(coordinator, DEBUG_TYPE_CONFIG)
 
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return "Solar Window System Debug Config"
-
     @property
     def native_value(self) -> str:
         """Return the state of the sensor."""
@@ -121,15 +103,12 @@ class ConfigDebugSensor(DebugSensorBase):
 class RuntimeDebugSensor(DebugSensorBase):
     """Sensor showing runtime errors from last update cycle."""
 
+    _attr_name = "Solar Window System Debug Runtime"
+
     def __init__(self, coordinator: SolarCalculationCoordinator) -> None:
         """Initialize the runtime debug sensor."""
         super().__init__(coordinator, DEBUG_TYPE_RUNTIME)
 
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return "Solar Window System Debug Runtime"
-
     @property
     def native_value(self) -> str:
         """Return the state of the sensor."""
@@ -147,6 +126,13 @@ class RuntimeDebugSensor(DebugSensorBase):
         }
 
         if errors:
-            attributes["errors"] = errors
+            # Messages are only rendered here, when the attributes are read
+            attributes["errors"] = list(errors)
+
+        # Phase durations in ms (last, mean, p95, max) and counts of the last cycle
+        performance = self.coordinator.performance
+        attributes["timings"] = performance.statistics()
+        attributes["service_calls"] = performance.last_counts.get(COUNTER_SERVICE_CALLS, 0)
+        attributes["state_lookups"] = performance.last_counts.get(COUNTER_STATE_LOOKUPS, 0)
 
         return attributes
@@ -0,0 +1,84 @@
+"""Diagnostics support for Solar Window System."""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from .calculation import HAS_NUMPY
+from .const import DOMAIN
+
+# Free-text names may contain personal information (e.g. "Anna's bedroom")
+TO_REDACT = {"name", "title", "latitude", "longitude"}
+
+
+def _with_hit_rate(stats: dict[str, int]) -> dict[str, Any]:
+    """Add the hit rate to hit/miss counters."""
+    if "hits" not in stats:
+        return stats
+    total = stats["hits"] + stats["misses"]
+    return {**stats, "hit_rate": round(stats["hits"] / total, 3) if total else None}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry_data["coordinator"]
+    store = entry_data.get("store")
+    result_store = entry_data.get("result_store")
+
+    entity_registry = er.async_get(hass)
+    entities_per_platform = Counter(
+        entity.domain
+        for entity in er.async_entries_for_config_entry(entity_registry, entry.entry_id)
+    )
+
+    return {
+        "config": async_redact_data(dict(entry.data), TO_REDACT),
+        "subentries": async_redact_data(
+            [
+                {"type": subentry.subentry_type, **subentry.data}
+                for subentry in getattr(entry, "subentries", {}).values()
+            ],
+            TO_REDACT,
+        ),
+        "counts": {
+            "windows": len(coordinator.windows),
+            "groups": len(coordinator.groups),
+            "entities": dict(entities_per_platform),
+        },
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "update_interval": (
+                coordinator.update_interval.total_seconds() if coordinator.update_interval else None
+            ),
+            "push_mode": coordinator.push_mode,
+            "sleeping": coordinator.sleeping,
+            "internal_solar_position": coordinator.internal_solar_position,
+            "numpy": HAS_NUMPY,
+            "cycles": coordinator.performance.cycles,
+            "last_cycle_counts": coordinator.performance.last_counts,
+        },
+        "timings": coordinator.performance.statistics(),
+        "caches": {
+            name: _with_hit_rate(stats)
+            for name, stats in coordinator.get_cache_statistics().items()
+        },
+        "storage": {
+            "pending_write": store.pending_write if store else False,
+            "writes": store.writes if store else 0,
+            "snapshot_pending_write": result_store.pending_write if result_store else False,
+            "snapshot_writes": result_store.writes if result_store else 0,
+        },
+        "errors": {
+            "config": len(coordinator.get_config_errors()),
+            "runtime": coordinator.get_runtime_error_counts(),
+        },
+    }
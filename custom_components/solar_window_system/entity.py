@@ -0,0 +1,171 @@
+"""Base entities with static naming and change-only state publishing.
+
+CoordinatorEntity writes the state of every entity on every coordinator
+refresh, even if nothing visible changed. PublishOnChangeEntity compares
+the visible state with the last written one and skips the write (and the
+recorder row) when it is unchanged. Power values are additionally
+rounded to a fixed precision and filtered through an absolute/relative
+deadband.
+
+Names and device infos are stored as _attr_* values at construction and
+only recomputed when the coordinator reports a renamed window or group,
+so state writes do not rebuild them in property getters.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import (
+    DEFAULT_DEADBAND_ABSOLUTE,
+    DEFAULT_DEADBAND_RELATIVE,
+    DEFAULT_PRECISION,
+    DOMAIN,
+    LEVEL_GLOBAL,
+    LEVEL_WINDOW,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import SolarCalculationCoordinator
+
+_UNPUBLISHED = object()
+
+MANUFACTURER = "Solar Window System"
+
+# Device of the global entities, parent of all window and group devices
+GLOBAL_DEVICE_INFO = DeviceInfo(
+    identifiers={(DOMAIN, LEVEL_GLOBAL)},
+    name="Solar Window System Global",
+    manufacturer=MANUFACTURER,
+)
+
+
+def build_device_info(level: str, entity_id: str, display_name: str) -> DeviceInfo:
+    """Build the device info of a window or group.
+
+    Args:
+        level: LEVEL_WINDOW or LEVEL_GROUP
+        entity_id: ID of the window or group
+        display_name: Name of the window or group
+
+    Returns:
+        DeviceInfo attached to the global device
+    """
+    prefix = "Fenster" if level == LEVEL_WINDOW else "Gruppe"
+    return DeviceInfo(
+        identifiers={(DOMAIN, f"{level}_{entity_id}")},
+        name=f"{prefix}: {display_name}",
+        manufacturer=MANUFACTURER,
+        via_device=(DOMAIN, LEVEL_GLOBAL),
+    )
+
+
+@dataclass(slots=True, frozen=True)
+class PublishPolicy:
+    """Rounding and deadband applied to published power values.
+
+    A change is published if it exceeds both the absolute deadband (W) and
+    the relative deadband (% of the last published value). Changes from or
+    to zero are always published, so night and sunrise are exact.
+    """
+
+    precision: int | None = DEFAULT_PRECISION
+    absolute: float = DEFAULT_DEADBAND_ABSOLUTE
+    relative: float = DEFAULT_DEADBAND_RELATIVE
+
+    def round(self, value: float | None) -> float | None:
+        """Round a value to the configured precision."""
+        if value is None or self.precision is None:
+            return value
+        return round(value, self.precision)
+
+    def exceeds(self, previous: float | None, value: float | None) -> bool:
+        """Check if a new value differs enough from the published one."""
+        if previous is None or value is None or previous == 0 or value == 0:
+            return previous != value
+        band = max(self.absolute, abs(previous) * self.relative / 100)
+        return abs(value - previous) > band
+
+
+class SolarWindowEntity(CoordinatorEntity):
+    """Coordinator entity of a window, a group or the global device."""
+
+    coordinator: SolarCalculationCoordinator
+    _naming_version: int = -1
+
+    def __init__(self, coordinator: SolarCalculationCoordinator, level: str, entity_id: str):
+        """Initialize the entity and its static name and device info.
+
+        Args:
+            coordinator: DataUpdateCoordinator instance
+            level: One of LEVEL_WINDOW, LEVEL_GROUP, or LEVEL_GLOBAL
+            entity_id: Identifier for the entity (window_id, group_id, or "global")
+        """
+        super().__init__(coordinator)
+        self._level = level
+        self._entity_id = entity_id
+        self._update_naming()
+
+    def _entity_name(self, display_name: str) -> str | None:
+        """Return the entity name, None to use the entity description."""
+        return None
+
+    def _device_info(self) -> DeviceInfo:
+        """Return the shared device info of the entity."""
+        return self.coordinator.get_device_info(self._level, self._entity_id)
+
+    def _update_naming(self) -> None:
+        """Store name and device info as static attributes."""
+        self._naming_version = self.coordinator.naming_version
+        self._attr_device_info = self._device_info()
+        name = self._entity_name(self.coordinator.get_display_name(self._level, self._entity_id))
+        if name is not None:
+            self._attr_name = name
+
+    @property
+    def _naming_outdated(self) -> bool:
+        """Check if a window or group was renamed since the last update."""
+        return self._naming_version != self.coordinator.naming_version
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the naming after a rename, then write the state."""
+        if self._naming_outdated:
+            self._update_naming()
+        super()._handle_coordinator_update()
+
+
+class PublishOnChangeEntity(SolarWindowEntity):
+    """Coordinator entity that only writes its state when it visibly changed."""
+
+    _published_state: Any = _UNPUBLISHED
+
+    def _visible_state(self) -> Any:
+        """Return the values shown in the state machine."""
+        return (self.available, self.state)
+
+    def _state_changed(self, previous: Any, current: Any) -> bool:
+        """Check if the visible state changed since the last write."""
+        return previous != current
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only if the visible state or the naming changed."""
+        if (
+            self._published_state is not _UNPUBLISHED
+            and not self._naming_outdated
+            and not self._state_changed(self._published_state, self._visible_state())
+        ):
+            return
+        super()._handle_coordinator_update()
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state and remember what was published."""
+        self._published_state = self._visible_state()
+        super().async_write_ha_state()
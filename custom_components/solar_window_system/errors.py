@@ -0,0 +1,128 @@
+"""Runtime error collection for the debug sensor.
+
+Errors are recorded as small structured entries during the update cycle
+and only rendered to (German) messages when the runtime debug sensor
+reads them. Duplicates are dropped in O(1), so an unavailable sensor
+shared by many windows is recorded once.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Collection, Iterator, Sequence
+from enum import StrEnum
+from typing import NamedTuple, overload
+
+
+class RuntimeErrorCode(StrEnum):
+    """Kinds of runtime errors."""
+
+    SENSOR_NOT_FOUND = "sensor_not_found"
+    SENSOR_STATE = "sensor_state"
+    SENSOR_INVALID_VALUE = "sensor_invalid_value"
+    MESSAGE = "message"
+
+
+class RuntimeIssue(NamedTuple):
+    """A single runtime error.
+
+    detail holds the offending state (or the text of a plain message),
+    context the optional location such as a window name.
+    """
+
+    code: RuntimeErrorCode
+    entity_id: str | None = None
+    detail: str | None = None
+    context: str | None = None
+
+    def render(self) -> str:
+        """Return the human readable message."""
+        context = f" ({self.context})" if self.context else ""
+        if self.code is RuntimeErrorCode.SENSOR_NOT_FOUND:
+            return f"Sensor '{self.entity_id}' nicht gefunden{context}"
+        if self.code is RuntimeErrorCode.SENSOR_STATE:
+            return f"Sensor '{self.entity_id}': Status '{self.detail}'{context}"
+        if self.code is RuntimeErrorCode.SENSOR_INVALID_VALUE:
+            return f"Sensor '{self.entity_id}': Ungültiger Wert '{self.detail}'{context}"
+        return f"{self.detail}{context}"
+
+
+class RuntimeErrorMessages(Sequence[str]):
+    """Read-only list of messages, rendered on access."""
+
+    def __init__(self, issues: tuple[RuntimeIssue, ...]) -> None:
+        """Initialize the view over the recorded issues."""
+        self._issues = issues
+
+    def __len__(self) -> int:
+        """Return the number of errors."""
+        return len(self._issues)
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        """Render the message(s) at index."""
+        if isinstance(index, slice):
+            return [issue.render() for issue in self._issues[index]]
+        return self._issues[index].render()
+
+    def __iter__(self) -> Iterator[str]:
+        """Render all messages in insertion order."""
+        return (issue.render() for issue in self._issues)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare with another sequence of messages."""
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        """Return the rendered messages."""
+        return repr(list(self))
+
+
+class RuntimeErrorCollector:
+    """Set-backed store of runtime errors with per-code counters."""
+
+    def __init__(self) -> None:
+        """Initialize an empty collector."""
+        # dict keeps insertion order and gives O(1) duplicate checks;
+        # values are the occurrences of each error
+        self._issues: dict[RuntimeIssue, int] = {}
+        self.counts: Counter[RuntimeErrorCode] = Counter()
+
+    def __len__(self) -> int:
+        """Return the number of distinct errors."""
+        return len(self._issues)
+
+    def add(
+        self,
+        code: RuntimeErrorCode,
+        entity_id: str | None = None,
+        detail: str | None = None,
+        context: str | None = None,
+    ) -> None:
+        """Record an error; every occurrence is counted, duplicates stored once."""
+        self.counts[code] += 1
+        issue = RuntimeIssue(code, entity_id, detail, context)
+        self._issues[issue] = self._issues.get(issue, 0) + 1
+
+    def discard_entities(self, entity_ids: Collection[str]) -> None:
+        """Drop the errors of some entities, e.g. before they are read again."""
+        for issue in [issue for issue in self._issues if issue.entity_id in entity_ids]:
+            self.counts[issue.code] -= self._issues.pop(issue)
+            if self.counts[issue.code] <= 0:
+                del self.counts[issue.code]
+
+    def clear(self) -> None:
+        """Drop all errors and counters."""
+        self._issues = {}
+        self.counts.clear()
+
+    def messages(self) -> RuntimeErrorMessages:
+        """Return the recorded errors as lazily rendered messages."""
+        return RuntimeErrorMessages(tuple(self._issues))
@@ -0,0 +1,115 @@
+"""Cache for weather forecasts shared by all windows.
+
+weather.get_forecasts is a service call per request. The cache keeps the
+response per (weather entity, forecast type) and only calls the service
+again when the TTL expired or the weather entity reported a new state.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import timedelta
+from time import monotonic
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+FORECAST_TYPE_DAILY = "daily"
+
+
+@dataclass(slots=True)
+class _CachedForecast:
+    """Forecast response together with its freshness markers."""
+
+    forecast: list[dict[str, Any]] | None
+    fetched_at: float
+    fingerprint: tuple[Any, Any]
+
+
+class ForecastCache:
+    """TTL cache for weather.get_forecasts responses."""
+
+    def __init__(self, hass: HomeAssistant, ttl: timedelta) -> None:
+        """Initialize the cache.
+
+        Args:
+            hass: Home Assistant instance
+            ttl: Maximum age of a cached forecast
+        """
+        self._hass = hass
+        self.ttl = ttl
+        self._entries: dict[tuple[str, str], _CachedForecast] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def invalidate(self, entity_id: str | None = None) -> None:
+        """Drop cached forecasts of one weather entity, or all if None."""
+        if entity_id is None:
+            self._entries.clear()
+            return
+        for key in [key for key in self._entries if key[0] == entity_id]:
+            del self._entries[key]
+
+    def _fingerprint(self, entity_id: str) -> tuple[Any, Any]:
+        """Return a marker that changes whenever the weather entity updates."""
+        state = self._hass.states.get(entity_id)
+        if state is None:
+            return (None, None)
+        return (state.state, getattr(state, "last_updated", None))
+
+    async def async_get(
+        self, entity_id: str, forecast_type: str = FORECAST_TYPE_DAILY
+    ) -> list[dict[str, Any]] | None:
+        """Return the forecast of a weather entity, calling the service if stale.
+
+        Args:
+            entity_id: Weather entity ID
+            forecast_type: Forecast type ("daily", "hourly", "twice_daily")
+
+        Returns:
+            List of forecast entries, or None if no forecast is available
+        """
+        key = (entity_id, forecast_type)
+        fingerprint = self._fingerprint(entity_id)
+        cached = self._entries.get(key)
+        if (
+            cached is not None
+            and cached.fingerprint == fingerprint
+            and monotonic() - cached.fetched_at < self.ttl.total_seconds()
+        ):
+            self.hits += 1
+            return cached.forecast
+
+        self.misses += 1
+        forecast = await self._async_fetch(entity_id, forecast_type)
+        # Failures are cached as well, so a broken weather entity is not
+        # queried again until the TTL expires or its state changes
+        self._entries[key] = _CachedForecast(forecast, monotonic(), fingerprint)
+        return forecast
+
+    async def _async_fetch(self, entity_id: str, forecast_type: str) -> list[dict[str, Any]] | None:
+        """Call weather.get_forecasts and extract the forecast list."""
+        try:
+            response = await self._hass.services.async_call(
+                "weather",
+                "get_forecasts",
+                {"entity_id": entity_id, "type": forecast_type},
+                blocking=True,
+                return_response=True,
+            )
+        except Exception as err:
+            _LOGGER.debug("Forecast for '%s' not available: %s", entity_id, err)
+            return None
+
+        if not isinstance(response, dict):
+            return None
+
+        # The response is keyed by entity ID: {entity_id: {"forecast": [...]}}
+        data = response.get(entity_id, response)
+        forecast = data.get("forecast") if isinstance(data, dict) else None
+        if isinstance(forecast, list):
+            return forecast
+        return None
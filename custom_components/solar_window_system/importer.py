@@ -0,0 +1,198 @@
+"""Bulk import of windows from a CSV or YAML table.
+
+All rows are parsed and validated in one pass before anything is
+created, so an import either creates every window or reports every
+error at once. Columns (CSV header or YAML keys) use the same names as
+the window form: name, group, width, height, azimuth, tilt,
+visible_azimuth_start, visible_azimuth_end, g_value, frame_width,
+window_recess and shading_depth.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+from collections.abc import Collection, Mapping
+from typing import Any
+
+import voluptuous as vol
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util.yaml import parse_yaml
+from voluptuous.humanize import humanize_error
+
+from .const import (
+    CONF_AZIMUTH,
+    CONF_FRAME_WIDTH,
+    CONF_G_VALUE,
+    CONF_GEOMETRY,
+    CONF_GROUP_ID,
+    CONF_HEIGHT,
+    CONF_PROPERTIES,
+    CONF_SHADING_DEPTH,
+    CONF_TILT,
+    CONF_VISIBLE_AZIMUTH_END,
+    CONF_VISIBLE_AZIMUTH_START,
+    CONF_WIDTH,
+    CONF_WINDOW_RECESS,
+)
+
+IMPORT_FORMAT_CSV = "csv"
+IMPORT_FORMAT_YAML = "yaml"
+
+COLUMN_NAME = "name"
+COLUMN_GROUP = "group"
+
+
+def _to_float(value: Any) -> float:
+    """Convert a cell to float, accepting a decimal comma ("0,6")."""
+    if isinstance(value, str):
+        value = value.replace(",", ".")
+    return float(value)
+
+
+def _number(minimum: float, maximum: float) -> vol.All:
+    """Validate a number within the limits of the window form."""
+    return vol.All(vol.Coerce(_to_float), vol.Range(min=minimum, max=maximum))
+
+
+# Limits and defaults as in the window subentry form
+GEOMETRY_SCHEMA = {
+    vol.Required(CONF_WIDTH): _number(10, 500),
+    vol.Required(CONF_HEIGHT): _number(10, 500),
+    vol.Optional(CONF_AZIMUTH): _number(0, 360),
+    vol.Optional(CONF_TILT, default=90): _number(0, 90),
+    vol.Optional(CONF_VISIBLE_AZIMUTH_START, default=150): _number(0, 360),
+    vol.Optional(CONF_VISIBLE_AZIMUTH_END, default=210): _number(0, 360),
+}
+PROPERTIES_SCHEMA = {
+    vol.Optional(CONF_G_VALUE): _number(0.1, 1.0),
+    vol.Optional(CONF_FRAME_WIDTH): _number(0, 20),
+    vol.Optional(CONF_WINDOW_RECESS): _number(0, 100),
+    vol.Optional(CONF_SHADING_DEPTH): _number(0, 200),
+}
+GEOMETRY_FIELDS = [str(key) for key in GEOMETRY_SCHEMA]
+PROPERTIES_FIELDS = [str(key) for key in PROPERTIES_SCHEMA]
+ROW_SCHEMA = vol.Schema(
+    {
+        vol.Required(COLUMN_NAME): vol.All(vol.Coerce(str), vol.Strip, vol.Length(min=1)),
+        vol.Optional(COLUMN_GROUP): vol.Any(None, vol.All(vol.Coerce(str), vol.Strip)),
+        **GEOMETRY_SCHEMA,
+        **PROPERTIES_SCHEMA,
+    }
+)
+
+
+class WindowImportError(HomeAssistantError):
+    """Raised when the import table cannot be parsed or has invalid rows."""
+
+    def __init__(self, errors: list[str]) -> None:
+        """Initialize with all errors found in the table."""
+        super().__init__("; ".join(errors))
+        self.errors = errors
+
+
+def parse_table(text: str, fmt: str) -> list[dict[str, Any]]:
+    """Parse a CSV or YAML window table into one dict per row.
+
+    CSV may be separated by commas, semicolons or tabs. Empty cells are
+    treated as missing values.
+
+    Args:
+        text: Table content
+        fmt: IMPORT_FORMAT_CSV or IMPORT_FORMAT_YAML
+
+    Returns:
+        List of rows
+
+    Raises:
+        WindowImportError: The table cannot be parsed
+    """
+    if fmt == IMPORT_FORMAT_YAML:
+        try:
+            rows = parse_yaml(text)
+        except HomeAssistantError as err:
+            raise WindowImportError([f"Ungültiges YAML: {err}"]) from err
+        if not isinstance(rows, list) or not all(isinstance(row, Mapping) for row in rows):
+            raise WindowImportError(["YAML muss eine Liste von Fenstern sein"])
+        return [dict(row) for row in rows]
+
+    try:
+        dialect: Any = csv.Sniffer().sniff(text.split("\n", 1)[0], delimiters=",;\t")
+    except csv.Error:
+        dialect = csv.excel
+    reader = csv.DictReader(io.StringIO(text.strip()), dialect=dialect)
+    return [
+        {
+            key.strip(): value.strip()
+            for key, value in row.items()
+            if key and isinstance(value, str) and value.strip()
+        }
+        for row in reader
+    ]
+
+
+def build_windows(
+    rows: list[dict[str, Any]],
+    groups: Mapping[str, str],
+    existing_names: set[str],
+    ambiguous_groups: Collection[str] = (),
+) -> list[dict[str, Any]]:
+    """Validate all rows and build the subentry data of each window.
+
+    Args:
+        rows: Parsed table rows
+        groups: Group name or group ID -> group ID
+        existing_names: Names and unique IDs of the windows that already
+            exist; new windows use their name as unique ID
+        ambiguous_groups: Group names shared by several groups, which
+            must be referenced by their group ID
+
+    Returns:
+        Window subentry data in the format of the window form
+
+    Raises:
+        WindowImportError: With one message per invalid row
+    """
+    errors: list[str] = []
+    windows: list[dict[str, Any]] = []
+    names = set(existing_names)
+
+    if not rows:
+        raise WindowImportError(["Keine Fenster gefunden"])
+
+    # Rows are numbered from 1, without the CSV header
+    for number, row in enumerate(rows, start=1):
+        try:
+            values = ROW_SCHEMA(row)
+        except vol.Invalid as err:
+            errors.append(f"Zeile {number}: {humanize_error(row, err)}")
+            continue
+
+        name = values[COLUMN_NAME]
+        if name in names:
+            errors.append(f"Zeile {number}: Fenster '{name}' existiert bereits")
+            continue
+        names.add(name)
+
+        window: dict[str, Any] = {
+            "name": name,
+            CONF_GEOMETRY: {key: values[key] for key in GEOMETRY_FIELDS if key in values},
+        }
+        if group := values.get(COLUMN_GROUP):
+            if group in ambiguous_groups:
+                errors.append(
+                    f"Zeile {number}: Gruppe '{group}' ist mehrdeutig, bitte Gruppen-ID angeben"
+                )
+                continue
+            if group not in groups:
+                errors.append(f"Zeile {number}: Gruppe '{group}' nicht gefunden")
+                continue
+            window[CONF_GROUP_ID] = groups[group]
+        properties = {key: values[key] for key in PROPERTIES_FIELDS if key in values}
+        if properties:
+            window[CONF_PROPERTIES] = properties
+        windows.append(window)
+
+    if errors:
+        raise WindowImportError(errors)
+    return windows
@@ -0,0 +1,78 @@
+"""Materialized inheritance table for thresholds and scenarios.
+
+Resolving a threshold or scenario walks the chain
+Window override -> Group override -> Group config -> Defaults.
+The table stores the resolved values per (level, entity) so lookups
+from the update cycle and from number/switch entities are a plain
+dict access. Rows are refreshed only when a level they inherit from
+changes.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from typing import Any
+
+EntryKey = tuple[str, str]
+
+
+class EffectiveValueTable:
+    """Resolved threshold and scenario values per window, group and global."""
+
+    def __init__(
+        self,
+        resolve: Callable[[str, str, str], Any],
+        properties: Iterable[str],
+    ) -> None:
+        """Initialize the table.
+
+        Args:
+            resolve: Function walking the inheritance chain for
+                (level, entity_id, property_name)
+            properties: Property names materialized for every row
+        """
+        self._resolve = resolve
+        self._properties = tuple(properties)
+        self._rows: dict[EntryKey, dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def properties(self) -> tuple[str, ...]:
+        """Return the property names materialized for every row."""
+        return self._properties
+
+    def __contains__(self, key: object) -> bool:
+        """Return True if a row exists for (level, entity_id)."""
+        return key in self._rows
+
+    def __len__(self) -> int:
+        """Return the number of materialized rows."""
+        return len(self._rows)
+
+    def rebuild(self, keys: Iterable[EntryKey]) -> None:
+        """Drop all rows and resolve the given (level, entity_id) keys."""
+        self._rows = {}
+        self.refresh(keys)
+
+    def refresh(self, keys: Iterable[EntryKey], property_name: str | None = None) -> None:
+        """Re-resolve rows after a level they depend on changed.
+
+        Args:
+            keys: (level, entity_id) rows to refresh
+            property_name: Only refresh this property; all if None
+        """
+        properties = self._properties if property_name is None else (property_name,)
+        for level, entity_id in keys:
+            row = self._rows.setdefault((level, entity_id), {})
+            for name in properties:
+                row[name] = self._resolve(level, entity_id, name)
+
+    def row(self, level: str, entity_id: str) -> dict[str, Any] | None:
+        """Return all resolved values of an entity, or None if not materialized."""
+        row = self._rows.get((level, entity_id))
+        if row is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return row
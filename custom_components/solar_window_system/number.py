@@ -6,8 +6,6 @@ from homeassistant.components.number import NumberEntity, NumberEntityDescriptio
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory, UnitOfTemperature
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     CONF_THRESHOLD_FORECAST,
@@ -23,6 +21,7 @@ from .const import (
     LEVEL_WINDOW,
 )
 from .coordinator import SolarCalculationCoordinator
+from .entity import PublishOnChangeEntity
 
 THRESHOLD_DESCRIPTIONS = {
     CONF_THRESHOLD_INDOOR: NumberEntityDescription(
@@ -77,54 +76,24 @@ async def async_setup_entry(
     async_add_entities,
 ) -> None:
     """Set up number entities from config entry."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
-    entities = []
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry_data["coordinator"]
+
+    def create_entities(level: str, entity_id: str) -> list[SolarThresholdNumber]:
+        """Create the threshold entities of a window, group or global."""
+        return [
+            SolarThresholdNumber(coordinator, entry, level, entity_id, key, description)
+            for key, description in THRESHOLD_DESCRIPTIONS.items()
+        ]
 
     # Global threshold entities
-    for key, description in THRESHOLD_DESCRIPTIONS.items():
-        entities.append(
-            SolarThresholdNumber(
-                coordinator,
-                entry,
-                "global",
-                "global",
-                key,
-                description,
-            )
-        )
+    async_add_entities(create_entities("global", "global"))
+
+    # Window and group threshold entities, also for ones added later
+    entry_data["reconciler"].async_add_platform(async_add_entities, create_entities)
+
 
-    # Group threshold entities
-    for group_id in coordinator.groups:
-        for key, description in THRESHOLD_DESCRIPTIONS.items():
-            entities.append(
-                SolarThresholdNumber(
-                    coordinator,
-                    entry,
-                    LEVEL_GROUP,
-                    group_id,
-                    key,
-                    description,
-                )
-            )
-
-    # Window threshold entities
-    for window_id in coordinator.windows:
-        for key, description in THRESHOLD_DESCRIPTIONS.items():
-            entities.append(
-                SolarThresholdNumber(
-                    coordinator,
-                    entry,
-                    LEVEL_WINDOW,
-                    window_id,
-                    key,
-                    description,
-                )
-            )
-
-    async_add_entities(entities)
-
-
-class SolarThresholdNumber(CoordinatorEntity, NumberEntity):
+class SolarThresholdNumber(PublishOnChangeEntity, NumberEntity):
     """Number entity for threshold configuration with inheritance."""
 
     coordinator: SolarCalculationCoordinator
@@ -139,47 +108,11 @@ class SolarThresholdNumber(CoordinatorEntity, NumberEntity):
         description: NumberEntityDescription,
     ) -> None:
         """Initialize the threshold number."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, level, entity_id)
         self._entry = entry
-        self._level = level
-        self._entity_id = entity_id
         self._threshold_key = threshold_key
         self.entity_description = description
-
-    @property
-    def unique_id(self):
-        """Return unique ID."""
-        return f"{DOMAIN}_{self._level}_{self._entity_id}_{self._threshold_key}"
-
-    @property
-    def device_info(self):
-        """Return device info."""
-        if self._level == "global":
-            return DeviceInfo(
-                identifiers={(DOMAIN, "global")},
-                name="Solar Window System Global",
-                manufacturer="Solar Window System",
-            )
-        elif self._level == LEVEL_GROUP:
-            group_name = self.coordinator.groups.get(self._entity_id, {}).get(
-                "name", self._entity_id
-            )
-            return DeviceInfo(
-                identifiers={(DOMAIN, f"group_{self._entity_id}")},
-                name=f"Gruppe: {group_name}",
-                manufacturer="Solar Window System",
-                via_device=(DOMAIN, "global"),
-            )
-        else:  # window
-            window_name = self.coordinator.windows.get(self._entity_id, {}).get(
-                "name", self._entity_id
-            )
-            return DeviceInfo(
-                identifiers={(DOMAIN, f"window_{self._entity_id}")},
-                name=f"Fenster: {window_name}",
-                manufacturer="Solar Window System",
-                via_device=(DOMAIN, "global"),
-            )
+        self._attr_unique_id = f"{DOMAIN}_{level}_{entity_id}_{threshold_key}"
 
     @property
     def native_value(self):
@@ -0,0 +1,140 @@
+"""Timing instrumentation for the coordinator update cycle.
+
+Every update cycle is split into phases (sensor reads, forecast fetch,
+energy math, shading decisions, aggregation). Phase durations are kept
+in fixed-size ring buffers, so the runtime debug sensor can report last,
+mean, p95 and max values without the memory growing over time. Nested
+phases are exclusive: a forecast fetch inside the shading decisions is
+only counted as forecast time. The running cycle and the nesting are
+tracked per task, so phases and counters of an override recalculation
+are not added to an update cycle running at the same time.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import Counter, deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Any
+
+PHASE_SENSOR_READS = "sensor_reads"
+PHASE_FORECAST = "forecast"
+PHASE_ENERGY = "energy"
+PHASE_SHADING = "shading"
+PHASE_AGGREGATION = "aggregation"
+PHASE_LISTENERS = "listeners"
+PHASE_CYCLE = "cycle"  # Whole _async_update_data call
+
+COUNTER_SERVICE_CALLS = "service_calls"
+COUNTER_STATE_LOOKUPS = "state_lookups"
+
+DEFAULT_TIMING_SAMPLES = 100
+
+
+class _Cycle:
+    """Exclusive phase durations and counters of one running cycle."""
+
+    __slots__ = ("counters", "phases", "start")
+
+    def __init__(self) -> None:
+        """Start the cycle now."""
+        self.start = perf_counter()
+        self.phases: dict[str, float] = {}
+        self.counters: Counter[str] = Counter()
+
+
+class PerformanceMonitor:
+    """Ring buffers of phase durations and per-cycle counters."""
+
+    def __init__(self, samples: int = DEFAULT_TIMING_SAMPLES) -> None:
+        """Initialize empty buffers.
+
+        Args:
+            samples: Number of durations kept per phase
+        """
+        self._samples = samples
+        self._timings: dict[str, deque[float]] = {}
+        self.cycles = 0
+
+        # Cycle running in the current task
+        self._cycle: ContextVar[_Cycle | None] = ContextVar(f"{__name__}.cycle", default=None)
+        # Time spent in nested phases of the innermost running phase of each task
+        self._nested: ContextVar[list[float] | None] = ContextVar(
+            f"{__name__}.nested", default=None
+        )
+        self.last_counts: dict[str, int] = {}
+
+    def start_cycle(self) -> None:
+        """Start collecting phases and counters of the current task for a new cycle."""
+        self._cycle.set(_Cycle())
+
+    def finish_cycle(self) -> None:
+        """Store the phase durations and counters of the running cycle."""
+        cycle = self._cycle.get()
+        if cycle is None:
+            return
+        self.record(PHASE_CYCLE, perf_counter() - cycle.start)
+        for name, duration in cycle.phases.items():
+            self.record(name, duration)
+        self.last_counts = dict(cycle.counters)
+        self.cycles += 1
+        self._cycle.set(None)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a phase.
+
+        Inside a cycle the exclusive duration is added to the cycle, phases
+        outside a cycle (e.g. listener fan-out, override recalculations) are
+        recorded directly.
+        """
+        start = perf_counter()
+        parent = self._nested.get()
+        # Time spent in nested phases, subtracted from this phase
+        nested = [0.0]
+        token = self._nested.set(nested)
+        try:
+            yield
+        finally:
+            elapsed = perf_counter() - start
+            self._nested.reset(token)
+            if parent is not None:
+                parent[0] += elapsed
+            cycle = self._cycle.get()
+            if cycle is None:
+                self.record(name, elapsed - nested[0])
+            else:
+                cycle.phases[name] = cycle.phases.get(name, 0.0) + elapsed - nested[0]
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Increase a counter of the running cycle; outside a cycle it is dropped."""
+        cycle = self._cycle.get()
+        if amount and cycle is not None:
+            cycle.counters[name] += amount
+
+    def record(self, name: str, duration: float) -> None:
+        """Append a duration in seconds to the ring buffer of a phase."""
+        buffer = self._timings.get(name)
+        if buffer is None:
+            buffer = self._timings[name] = deque(maxlen=self._samples)
+        buffer.append(duration)
+
+    def statistics(self) -> dict[str, dict[str, Any]]:
+        """Return last, mean, p95 and max duration per phase in milliseconds."""
+        stats: dict[str, dict[str, Any]] = {}
+        for name, buffer in self._timings.items():
+            if not buffer:
+                continue
+            ordered = sorted(buffer)
+            p95 = ordered[math.ceil(0.95 * len(ordered)) - 1]
+            stats[name] = {
+                "last": round(buffer[-1] * 1000, 3),
+                "mean": round(sum(ordered) / len(ordered) * 1000, 3),
+                "p95": round(p95 * 1000, 3),
+                "max": round(ordered[-1] * 1000, 3),
+                "samples": len(ordered),
+            }
+        return stats
@@ -0,0 +1,108 @@
+"""Day-ahead heat gain profile per window.
+
+Evaluates the energy formulas of the calculation engine for a whole day
+at a fixed resolution. The sun path comes from the internal solar
+position calculation, the irradiance from a clear-sky model that is
+dimmed by the forecast cloud coverage. The computation is pure NumPy and
+is meant to run in the executor.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from .calculation import WindowCalculationEngine, np
+from .solar_position import solar_position_array
+
+# Haurwitz clear-sky model: GHI = 1098 * sin(e) * exp(-0.057 / sin(e))
+_HAURWITZ_SCALE = 1098.0
+_HAURWITZ_EXTINCTION = 0.057
+
+# Diffuse fraction under full overcast, as for "cloudy" in the live estimate
+_OVERCAST_DIFFUSE_RATIO = 0.8
+
+
+@dataclass(slots=True, frozen=True)
+class DayProfile:
+    """Energy per window and time step for one day."""
+
+    start: datetime
+    interval: timedelta
+    cloud_coverage: float | None
+    windows: dict[str, dict[str, list[float]]]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the profile as a JSON serializable service response."""
+        return {
+            "start": self.start.isoformat(),
+            "interval": int(self.interval.total_seconds()),
+            "cloud_coverage": self.cloud_coverage,
+            "windows": self.windows,
+        }
+
+
+def clear_sky_irradiance(elevation: Any, cloud_coverage: float | None = None) -> tuple[Any, Any]:
+    """Estimate direct and diffuse irradiance from the sun elevation.
+
+    Args:
+        elevation: Array of sun elevations in degrees
+        cloud_coverage: Forecast cloud coverage in percent, None for clear sky
+
+    Returns:
+        Tuple of arrays (direct, diffuse) in W/m²
+    """
+    sin_e = np.sin(np.radians(np.maximum(elevation, 0.0)))
+    above = sin_e > 0
+    total = np.where(
+        above,
+        _HAURWITZ_SCALE * sin_e * np.exp(-_HAURWITZ_EXTINCTION / np.where(above, sin_e, 1.0)),
+        0.0,
+    )
+
+    # Same elevation model as the live diffuse estimate: 20% at zenith, 50% at horizon
+    diffuse_ratio = 0.2 + 0.3 * (1 - np.clip(elevation, 0.0, 90.0) / 90)
+
+    if cloud_coverage is not None:
+        cloud = min(max(cloud_coverage, 0.0), 100.0) / 100
+        # Kasten-Czeplak: clouds reduce global irradiance by up to 75%
+        total = total * (1 - 0.75 * cloud**3.4)
+        diffuse_ratio = diffuse_ratio + (_OVERCAST_DIFFUSE_RATIO - diffuse_ratio) * cloud
+
+    diffuse_ratio = np.clip(diffuse_ratio, 0.1, 0.9)
+    diffuse = total * diffuse_ratio
+    return total - diffuse, diffuse
+
+
+def compute_day_profile(
+    engine: WindowCalculationEngine,
+    latitude: float,
+    longitude: float,
+    start: datetime,
+    interval: timedelta,
+    cloud_coverage: float | None = None,
+) -> DayProfile:
+    """Compute the energy profile of all windows for one day.
+
+    Blocking: call via hass.async_add_executor_job.
+
+    Args:
+        engine: Calculation engine with the compiled windows
+        latitude: Latitude in degrees
+        longitude: Longitude in degrees
+        start: Start of the day (timezone-aware)
+        interval: Resolution of the profile
+        cloud_coverage: Forecast cloud coverage in percent, None for clear sky
+
+    Returns:
+        DayProfile with direct, diffuse and combined energy in watts
+    """
+    step = interval.total_seconds()
+    end = start + timedelta(days=1)
+    timestamps = np.arange(start.timestamp(), end.timestamp(), step)
+
+    elevation, azimuth = solar_position_array(timestamps, latitude, longitude)
+    direct, diffuse = clear_sky_irradiance(elevation, cloud_coverage)
+    windows = engine.calculate_series(elevation, azimuth, direct, diffuse, decimals=1)
+    return DayProfile(start, interval, cloud_coverage, windows)
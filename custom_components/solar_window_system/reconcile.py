@@ -0,0 +1,166 @@
+"""Differential entity setup for windows and groups.
+
+Each platform registers its async_add_entities callback and a factory
+that creates the entities of one window or group. When subentries change,
+only the entities of new windows and groups are created; entities of
+untouched windows and groups stay alive, so their history has no gaps.
+Entities of removed windows and groups disappear with their entity
+registry entries, which are collected in a single pass over the registry.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN, LEVEL_GROUP, LEVEL_WINDOW
+
+if TYPE_CHECKING:
+    from .coordinator import SolarCalculationCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# (level, window or group ID)
+SubentryKey = tuple[str, str]
+EntityFactory = Callable[[str, str], Iterable[Entity]]
+
+
+class EntityReconciler:
+    """Add entities of new windows and groups through the stored platform callbacks."""
+
+    def __init__(self, coordinator: SolarCalculationCoordinator) -> None:
+        """Initialize with the windows and groups the platforms are set up with.
+
+        Args:
+            coordinator: Coordinator holding the current windows and groups
+        """
+        self._coordinator = coordinator
+        self._platforms: list[tuple[AddEntitiesCallback, EntityFactory]] = []
+        self._known = self._current_keys()
+
+    @property
+    def known(self) -> set[SubentryKey]:
+        """Return the windows and groups the platforms have entities for."""
+        return self._known
+
+    def _current_keys(self) -> set[SubentryKey]:
+        """Return the keys of the coordinator's windows and groups."""
+        return {
+            *((LEVEL_WINDOW, window_id) for window_id in self._coordinator.windows),
+            *((LEVEL_GROUP, group_id) for group_id in self._coordinator.groups),
+        }
+
+    @callback
+    def async_add_platform(
+        self, async_add_entities: AddEntitiesCallback, factory: EntityFactory
+    ) -> None:
+        """Register a platform and add the entities of all known windows and groups.
+
+        Args:
+            async_add_entities: Callback of the platform's async_setup_entry
+            factory: Creates the entities of a (level, ID) pair
+        """
+        self._platforms.append((async_add_entities, factory))
+        async_add_entities(self._create(factory, self._known))
+
+    @staticmethod
+    def _create(factory: EntityFactory, keys: Iterable[SubentryKey]) -> list[Entity]:
+        """Create the entities of some windows and groups, windows first."""
+        return [
+            entity
+            for level, entity_id in sorted(keys, key=lambda key: (key[0] != LEVEL_WINDOW, key))
+            for entity in factory(level, entity_id)
+        ]
+
+    @callback
+    def async_reconcile(self) -> tuple[set[SubentryKey], set[SubentryKey]]:
+        """Add entities of windows and groups that are new since the last call.
+
+        Returns:
+            Tuple of (added, removed) keys; removed entities are cleaned up
+            through the entity registry by the caller
+        """
+        current = self._current_keys()
+        added = current - self._known
+        removed = self._known - current
+        self._known = current
+
+        if added:
+            for async_add_entities, factory in self._platforms:
+                async_add_entities(self._create(factory, added))
+        return added, removed
+
+
+def _device_of(unique_id: str, devices: dict[str, bool]) -> str | None:
+    """Return the longest known device key that prefixes a unique ID.
+
+    Unique IDs are "<domain>_<level>_<id>_<suffix>" and IDs may contain
+    underscores, so the device key must end at an underscore and the
+    longest match wins ("window_a_b" over "window_a").
+    """
+    prefix = f"{DOMAIN}_"
+    if not unique_id.startswith(prefix):
+        return None
+    rest = unique_id[len(prefix) :]
+    end = rest.rfind("_")
+    while end > 0:
+        if rest[:end] in devices:
+            return rest[:end]
+        end = rest.rfind("_", 0, end)
+    return None
+
+
+@callback
+def async_remove_subentry_entities(
+    hass: HomeAssistant,
+    entry_id: str,
+    removed: Iterable[SubentryKey],
+    kept: Iterable[SubentryKey] = (),
+) -> int:
+    """Remove the entities and devices of removed windows and groups.
+
+    The entity registry is scanned once for all removed subentries.
+
+    Args:
+        hass: Home Assistant instance
+        entry_id: ID of the config entry
+        removed: Keys of the removed windows and groups
+        kept: Keys of the remaining windows and groups, so entities of a
+            kept "window_a_b" are not matched by a removed "window_a"
+
+    Returns:
+        Number of removed entities
+    """
+    # Device key -> True if the device is removed
+    devices = {f"{level}_{subentry_id}": False for level, subentry_id in kept}
+    devices.update({f"{level}_{subentry_id}": True for level, subentry_id in removed})
+    if not any(devices.values()):
+        return 0
+
+    entity_registry = er.async_get(hass)
+    stale = [
+        entity.entity_id
+        for entity in er.async_entries_for_config_entry(entity_registry, entry_id)
+        if entity.device_id is not None and devices.get(_device_of(entity.unique_id, devices))
+    ]
+    for entity_id in stale:
+        _LOGGER.debug("Removing entity: %s", entity_id)
+        entity_registry.async_remove(entity_id)
+
+    device_registry = dr.async_get(hass)
+    for device_id, is_removed in devices.items():
+        if not is_removed:
+            continue
+        device = device_registry.async_get_device(identifiers={(DOMAIN, device_id)})
+        if device:
+            _LOGGER.debug("Removing device: %s", device_id)
+            device_registry.async_remove_device(device.id)
+
+    return len(stale)
@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfPower
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
@@ -18,6 +17,20 @@ from .const import (
     LEVEL_WINDOW,
 )
 from .coordinator import SolarCalculationCoordinator
+from .entity import MANUFACTURER, PublishOnChangeEntity
+
+ENERGY_LABELS = {
+    ENERGY_TYPE_DIRECT: "Direkte Energie",
+    ENERGY_TYPE_DIFFUSE: "Diffuse Energie",
+    ENERGY_TYPE_COMBINED: "Kombinierte Energie",
+}
+
+# The global energy sensors live on their own device
+GLOBAL_SENSOR_DEVICE_INFO = DeviceInfo(
+    identifiers={(DOMAIN, DOMAIN)},
+    name="Solar Window System",
+    manufacturer=MANUFACTURER,
+)
 
 
 async def async_setup_entry(
@@ -26,38 +39,30 @@ async def async_setup_entry(
     async_add_entities,
 ) -> None:
     """Set up sensor entities from a config entry."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
-    entities = []
-
-    # Create entities for each window
-    for window_id in coordinator.windows:
-        for energy_type in [
-            ENERGY_TYPE_DIRECT,
-            ENERGY_TYPE_DIFFUSE,
-            ENERGY_TYPE_COMBINED,
-        ]:
-            entities.append(SolarEnergySensor(coordinator, LEVEL_WINDOW, window_id, energy_type))
-
-    # Create entities for each group
-    for group_id in coordinator.groups:
-        for energy_type in [
-            ENERGY_TYPE_DIRECT,
-            ENERGY_TYPE_DIFFUSE,
-            ENERGY_TYPE_COMBINED,
-        ]:
-            entities.append(SolarEnergySensor(coordinator, LEVEL_GROUP, group_id, energy_type))
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry_data["coordinator"]
+
+    def create_entities(level: str, name_id: str) -> list[SolarEnergySensor]:
+        """Create the sensors of a window or group."""
+        return [
+            SolarEnergySensor(coordinator, level, name_id, energy_type)
+            for energy_type in ENERGY_LABELS
+        ]
 
     # Create entities for global
-    for energy_type in [ENERGY_TYPE_DIRECT, ENERGY_TYPE_DIFFUSE, ENERGY_TYPE_COMBINED]:
-        entities.append(SolarEnergySensor(coordinator, "global", "global", energy_type))
+    async_add_entities(create_entities("global", "global"))
 
-    async_add_entities(entities)
+    # Create entities for each window and group, and for ones added later
+    entry_data["reconciler"].async_add_platform(async_add_entities, create_entities)
 
 
-class SolarEnergySensor(CoordinatorEntity, SensorEntity):
+class SolarEnergySensor(PublishOnChangeEntity, SensorEntity):
     """Sensor for solar energy measurements."""
 
     coordinator: SolarCalculationCoordinator
+    _attr_native_unit_of_measurement = UnitOfPower.WATT
+    _attr_device_class = SensorDeviceClass.POWER
+    _attr_state_class = SensorStateClass.MEASUREMENT
 
     def __init__(
         self,
@@ -74,87 +79,38 @@ class SolarEnergySensor(CoordinatorEntity, SensorEntity):
             name_id: Identifier for the entity (window_id, group_id, or "global")
             energy_type: One of ENERGY_TYPE_DIRECT, ENERGY_TYPE_DIFFUSE, ENERGY_TYPE_COMBINED
         """
-        super().__init__(coordinator)
-        self._level = level
-        self._name_id = name_id
         self._energy_type = energy_type
+        super().__init__(coordinator, level, name_id)
+        self._attr_unique_id = f"{DOMAIN}_{level}_{name_id}_{energy_type}"
+        self._data_key = f"group_{name_id}" if level == LEVEL_GROUP else name_id
 
-    @property
-    def unique_id(self):
-        """Return a unique ID for this sensor."""
-        return f"{DOMAIN}_{self._level}_{self._name_id}_{self._energy_type}"
-
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        if self._level == LEVEL_WINDOW:
-            display_name = self.coordinator.windows.get(self._name_id, {}).get(
-                "name", self._name_id
-            )
-        elif self._level == LEVEL_GROUP:
-            display_name = self.coordinator.groups.get(self._name_id, {}).get("name", self._name_id)
-        else:
-            display_name = "Global"
-
-        energy_labels = {
-            ENERGY_TYPE_DIRECT: "Direkte Energie",
-            ENERGY_TYPE_DIFFUSE: "Diffuse Energie",
-            ENERGY_TYPE_COMBINED: "Kombinierte Energie",
-        }
-        return f"{display_name} {energy_labels.get(self._energy_type, self._energy_type)}"
-
-    @property
-    def native_unit_of_measurement(self):
-        """Return the unit of measurement."""
-        return UnitOfPower.WATT
-
-    @property
-    def device_class(self):
-        """Return the device class."""
-        return SensorDeviceClass.POWER
+    def _entity_name(self, display_name: str) -> str:
+        """Return the window, group or global name with the energy label."""
+        return f"{display_name} {ENERGY_LABELS.get(self._energy_type, self._energy_type)}"
 
-    @property
-    def state_class(self):
-        """Return the state class for statistics."""
-        return "measurement"
+    def _device_info(self) -> DeviceInfo:
+        """Return the device info; global sensors have their own device."""
+        if self._level == "global":
+            return GLOBAL_SENSOR_DEVICE_INFO
+        return super()._device_info()
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        # Get the data key based on level
-        if self._level == LEVEL_GROUP:
-            data_key = f"group_{self._name_id}"
-        else:
-            data_key = self._name_id
-
-        # Get the data from coordinator
-        if self.coordinator.data and data_key in self.coordinator.data:
-            return self.coordinator.data[data_key].get(self._energy_type)
+        data = self.coordinator.data
+        if data and self._data_key in data:
+            return self.coordinator.publish_policy.round(
+                data[self._data_key].get(self._energy_type)
+            )
 
         return None
 
-    @property
-    def device_info(self):
-        """Return device information."""
-        if self._level == "global":
-            return DeviceInfo(
-                identifiers={(DOMAIN, DOMAIN)},
-                name="Solar Window System",
-                manufacturer="Solar Window System",
-            )
-        elif self._level == LEVEL_GROUP:
-            group_name = self.coordinator.groups.get(self._name_id, {}).get("name", self._name_id)
-            return DeviceInfo(
-                identifiers={(DOMAIN, f"group_{self._name_id}")},
-                name=f"Gruppe: {group_name}",
-                manufacturer="Solar Window System",
-                via_device=(DOMAIN, "global"),
-            )
-        else:  # window
-            window_name = self.coordinator.windows.get(self._name_id, {}).get("name", self._name_id)
-            return DeviceInfo(
-                identifiers={(DOMAIN, f"window_{self._name_id}")},
-                name=f"Fenster: {window_name}",
-                manufacturer="Solar Window System",
-                via_device=(DOMAIN, "global"),
-            )
+    def _visible_state(self) -> tuple:
+        """Return availability and the rounded power value."""
+        return (self.available, self.native_value)
+
+    def _state_changed(self, previous: tuple, current: tuple) -> bool:
+        """Publish availability changes and power changes outside the deadband."""
+        if previous[0] != current[0]:
+            return True
+        return self.coordinator.publish_policy.exceeds(previous[1], current[1])
@@ -0,0 +1,147 @@
+"""Services for the Solar Window System integration."""
+
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
+from homeassistant.config_entries import ConfigSubentry
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .config_flow import SUBENTRY_TYPE_GROUP, SUBENTRY_TYPE_WINDOW
+from .const import (
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_DATE,
+    ATTR_FORMAT,
+    ATTR_TABLE,
+    DOMAIN,
+    SERVICE_GET_HEAT_GAIN_PROFILE,
+    SERVICE_IMPORT_WINDOWS,
+)
+from .importer import (
+    IMPORT_FORMAT_CSV,
+    IMPORT_FORMAT_YAML,
+    WindowImportError,
+    build_windows,
+    parse_table,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import SolarCalculationCoordinator
+
+GET_HEAT_GAIN_PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_DATE): cv.date,
+    }
+)
+
+IMPORT_WINDOWS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_TABLE): cv.string,
+        vol.Optional(ATTR_FORMAT, default=IMPORT_FORMAT_CSV): vol.In(
+            [IMPORT_FORMAT_CSV, IMPORT_FORMAT_YAML]
+        ),
+    }
+)
+
+
+def _get_coordinator(hass: HomeAssistant, entry_id: str | None) -> SolarCalculationCoordinator:
+    """Return the coordinator of a config entry, or of the only loaded entry."""
+    coordinators = {
+        loaded_id: data["coordinator"]
+        for loaded_id, data in hass.data.get(DOMAIN, {}).items()
+        if "coordinator" in data
+    }
+    if entry_id is not None:
+        if entry_id not in coordinators:
+            raise ServiceValidationError(f"Konfigurationseintrag '{entry_id}' nicht geladen")
+        return coordinators[entry_id]
+    if len(coordinators) != 1:
+        raise ServiceValidationError(
+            f"{len(coordinators)} Konfigurationseinträge geladen, bitte config_entry_id angeben"
+        )
+    return next(iter(coordinators.values()))
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+
+    async def async_get_heat_gain_profile(call: ServiceCall) -> ServiceResponse:
+        """Return the day-ahead heat gain profile of all windows."""
+        coordinator = _get_coordinator(hass, call.data.get(ATTR_CONFIG_ENTRY_ID))
+        profile = await coordinator.async_get_day_profile(call.data.get(ATTR_DATE))
+        return profile.as_dict()
+
+    async def async_import_windows(call: ServiceCall) -> ServiceResponse:
+        """Create windows from a CSV or YAML table.
+
+        All rows are validated before the first window is created. The
+        subentries are added in one go; their update listener calls are
+        coalesced into a single entity reconciliation.
+        """
+        coordinator = _get_coordinator(hass, call.data.get(ATTR_CONFIG_ENTRY_ID))
+        entry = coordinator.config_entry
+        subentries = entry.subentries.values()
+        # Groups are referenced by name or ID; IDs win over names, and names
+        # shared by several groups only resolve through the ID
+        group_ids = {
+            subentry.subentry_id
+            for subentry in subentries
+            if subentry.subentry_type == SUBENTRY_TYPE_GROUP
+        }
+        groups: dict[str, str] = {}
+        ambiguous_groups: set[str] = set()
+        for subentry in subentries:
+            if subentry.subentry_type == SUBENTRY_TYPE_GROUP:
+                if subentry.title in groups:
+                    ambiguous_groups.add(subentry.title)
+                groups[subentry.title] = subentry.subentry_id
+        groups.update({group_id: group_id for group_id in group_ids})
+        ambiguous_groups -= group_ids
+        # New windows use their name as unique ID, which must not collide with
+        # the title or the unique ID of an existing window
+        existing_names: set[str] = set()
+        for subentry in subentries:
+            if subentry.subentry_type == SUBENTRY_TYPE_WINDOW:
+                existing_names.add(subentry.title)
+                if subentry.unique_id is not None:
+                    existing_names.add(subentry.unique_id)
+
+        try:
+            rows = parse_table(call.data[ATTR_TABLE], call.data[ATTR_FORMAT])
+            windows = build_windows(rows, groups, existing_names, ambiguous_groups)
+        except WindowImportError as err:
+            raise ServiceValidationError(f"Import fehlgeschlagen: {err}") from err
+
+        for window in windows:
+            hass.config_entries.async_add_subentry(
+                entry,
+                ConfigSubentry(
+                    data=MappingProxyType(window),
+                    subentry_type=SUBENTRY_TYPE_WINDOW,
+                    title=window["name"],
+                    unique_id=window["name"],
+                ),
+            )
+        return {"created": [window["name"] for window in windows]}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_HEAT_GAIN_PROFILE,
+        async_get_heat_gain_profile,
+        schema=GET_HEAT_GAIN_PROFILE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_IMPORT_WINDOWS,
+        async_import_windows,
+        schema=IMPORT_WINDOWS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,110 @@
+"""Cycle-scoped snapshot of the sensor states used by the coordinator.
+
+At the start of an update cycle the coordinator captures every distinct
+sensor referenced by windows, groups and the global configuration.
+Each state is read from the state machine and converted exactly once;
+all lookups during the cycle are then served from the snapshot.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from homeassistant.core import HomeAssistant
+
+
+@dataclass(slots=True, frozen=True)
+class SensorReading:
+    """Raw state and numeric value of a sensor.
+
+    state is None if the entity does not exist, value is None if the
+    state cannot be converted to a float.
+    """
+
+    state: str | None
+    value: float | None = None
+
+
+def read_sensor(hass: HomeAssistant, entity_id: str) -> SensorReading:
+    """Read and convert the current state of an entity.
+
+    Args:
+        hass: Home Assistant instance
+        entity_id: Home Assistant entity ID (e.g., "sensor.temperature")
+
+    Returns:
+        SensorReading with raw state and float value if numeric
+    """
+    state = hass.states.get(entity_id)
+    if state is None:
+        return SensorReading(None)
+
+    try:
+        raw_state = state.state
+    except AttributeError:
+        return SensorReading(None)
+    except KeyError:
+        return SensorReading(None)
+
+    try:
+        return SensorReading(raw_state, float(raw_state))
+    except ValueError:
+        return SensorReading(raw_state)
+    except TypeError:
+        return SensorReading(raw_state)
+
+
+class SensorSnapshot:
+    """Sensor readings captured once per update cycle."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize an empty snapshot.
+
+        Args:
+            hass: Home Assistant instance
+        """
+        self._hass = hass
+        self._readings: dict[str, SensorReading] = {}
+        self._active = False
+        # Total reads from the state machine; lookups served from / missing in the snapshot
+        self.lookups = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def active(self) -> bool:
+        """Return True while a cycle snapshot is captured."""
+        return self._active
+
+    def __len__(self) -> int:
+        """Return the number of captured entities."""
+        return len(self._readings)
+
+    def capture(self, entity_ids: Iterable[str]) -> None:
+        """Read all given entities once and activate the snapshot."""
+        self._readings = {entity_id: read_sensor(self._hass, entity_id) for entity_id in entity_ids}
+        self._active = True
+        self.lookups += len(self._readings)
+
+    def release(self) -> None:
+        """Drop the captured readings at the end of a cycle."""
+        self._readings = {}
+        self._active = False
+
+    def get(self, entity_id: str) -> SensorReading:
+        """Return the reading of an entity.
+
+        Entities that were not captured (or lookups outside a cycle) are
+        read from the state machine and added to the snapshot.
+        """
+        reading = self._readings.get(entity_id)
+        if reading is not None:
+            self.hits += 1
+            return reading
+        reading = read_sensor(self._hass, entity_id)
+        self.lookups += 1
+        self.misses += 1
+        if self._active:
+            self._readings[entity_id] = reading
+        return reading
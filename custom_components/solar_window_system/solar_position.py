@@ -0,0 +1,231 @@
+"""Solar position after the NOAA solar calculator.
+
+Computes the apparent sun elevation (including atmospheric refraction)
+and azimuth for a location at arbitrary times, without going through the
+sun.sun entity. solar_position() evaluates a single time,
+solar_position_array() a whole array of timestamps in one NumPy pass and
+next_sunrise() searches the next time the sun rises above the horizon.
+
+Reference: NOAA Global Monitoring Laboratory, "General Solar Position
+Calculations" / NOAA solar calculator spreadsheet. Accuracy is better
+than 0.1° for dates between 1900 and 2100.
+"""
+
+from __future__ import annotations
+
+import math
+from datetime import datetime, timedelta
+from typing import Any
+
+from .calculation import np
+
+_SUNRISE_SEARCH_STEP = timedelta(minutes=10)
+_SUNRISE_PRECISION = timedelta(seconds=1)
+
+_UNIX_EPOCH_JD = 2440587.5
+_J2000_JD = 2451545.0
+
+
+def _refraction(elevation: float) -> float:
+    """Return the atmospheric refraction correction in degrees."""
+    if elevation > 85:
+        return 0.0
+    if elevation > 5:
+        tan_e = math.tan(math.radians(elevation))
+        correction = 58.1 / tan_e - 0.07 / tan_e**3 + 0.000086 / tan_e**5
+    elif elevation > -0.575:
+        correction = 1735 + elevation * (
+            -518.2 + elevation * (103.4 + elevation * (-12.79 + elevation * 0.711))
+        )
+    else:
+        correction = -20.772 / math.tan(math.radians(elevation))
+    return correction / 3600
+
+
+def solar_position(when: datetime, latitude: float, longitude: float) -> tuple[float, float]:
+    """Calculate sun elevation and azimuth.
+
+    Args:
+        when: Timezone-aware point in time
+        latitude: Latitude in degrees (north positive)
+        longitude: Longitude in degrees (east positive)
+
+    Returns:
+        Tuple of (elevation, azimuth) in degrees; azimuth 0 = North, 180 = South
+    """
+    timestamp = when.timestamp()
+    jc = (timestamp / 86400 + _UNIX_EPOCH_JD - _J2000_JD) / 36525
+
+    mean_long = (280.46646 + jc * (36000.76983 + jc * 0.0003032)) % 360
+    mean_anom = 357.52911 + jc * (35999.05029 - 0.0001537 * jc)
+    eccentricity = 0.016708634 - jc * (0.000042037 + 0.0000001267 * jc)
+    m = math.radians(mean_anom)
+    center = (
+        math.sin(m) * (1.914602 - jc * (0.004817 + 0.000014 * jc))
+        + math.sin(2 * m) * (0.019993 - 0.000101 * jc)
+        + math.sin(3 * m) * 0.000289
+    )
+    omega = math.radians(125.04 - 1934.136 * jc)
+    apparent_long = mean_long + center - 0.00569 - 0.00478 * math.sin(omega)
+    mean_obliquity = 23 + (26 + (21.448 - jc * (46.815 + jc * (0.00059 - jc * 0.001813))) / 60) / 60
+    obliquity = math.radians(mean_obliquity + 0.00256 * math.cos(omega))
+    declination = math.asin(math.sin(obliquity) * math.sin(math.radians(apparent_long)))
+
+    var_y = math.tan(obliquity / 2) ** 2
+    l0 = math.radians(mean_long)
+    eq_of_time = 4 * math.degrees(
+        var_y * math.sin(2 * l0)
+        - 2 * eccentricity * math.sin(m)
+        + 4 * eccentricity * var_y * math.sin(m) * math.cos(2 * l0)
+        - 0.5 * var_y**2 * math.sin(4 * l0)
+        - 1.25 * eccentricity**2 * math.sin(2 * m)
+    )
+
+    # True solar time in minutes, hour angle in degrees (0 at solar noon)
+    true_solar_time = ((timestamp % 86400) / 60 + eq_of_time + 4 * longitude) % 1440
+    hour_angle = math.radians(true_solar_time / 4 - 180)
+
+    lat = math.radians(latitude)
+    cos_zenith = math.sin(lat) * math.sin(declination) + math.cos(lat) * math.cos(
+        declination
+    ) * math.cos(hour_angle)
+    zenith = math.acos(max(-1.0, min(1.0, cos_zenith)))
+
+    denominator = math.cos(lat) * math.sin(zenith)
+    if abs(denominator) < 1e-12:
+        # Sun at zenith/nadir or observer at a pole: azimuth undefined
+        azimuth = 180.0
+    else:
+        cos_azimuth = (math.sin(lat) * math.cos(zenith) - math.sin(declination)) / denominator
+        angle = math.degrees(math.acos(max(-1.0, min(1.0, cos_azimuth))))
+        azimuth = (angle + 180) % 360 if hour_angle > 0 else (540 - angle) % 360
+
+    elevation = 90 - math.degrees(zenith)
+    return elevation + _refraction(elevation), azimuth
+
+
+def next_sunrise(
+    when: datetime,
+    latitude: float,
+    longitude: float,
+    within: timedelta = timedelta(days=1),
+) -> datetime | None:
+    """Find the next time the apparent sun elevation rises above zero.
+
+    Scans in 10 minute steps and refines the crossing by bisection.
+
+    Args:
+        when: Timezone-aware start of the search
+        latitude: Latitude in degrees (north positive)
+        longitude: Longitude in degrees (east positive)
+        within: Length of the search window
+
+    Returns:
+        Time of the next sunrise (when itself if the sun is up), or None if
+        the sun stays below the horizon within the search window
+    """
+    if solar_position(when, latitude, longitude)[0] > 0:
+        return when
+
+    end = when + within
+    low = when
+    while low < end:
+        high = min(low + _SUNRISE_SEARCH_STEP, end)
+        if solar_position(high, latitude, longitude)[0] > 0:
+            while high - low > _SUNRISE_PRECISION:
+                middle = low + (high - low) / 2
+                if solar_position(middle, latitude, longitude)[0] > 0:
+                    high = middle
+                else:
+                    low = middle
+            return high
+        low = high
+    return None
+
+
+def solar_position_array(timestamps: Any, latitude: float, longitude: float) -> tuple[Any, Any]:
+    """Calculate sun elevation and azimuth for many points in time at once.
+
+    Args:
+        timestamps: Array-like of Unix timestamps in seconds (UTC)
+        latitude: Latitude in degrees (north positive)
+        longitude: Longitude in degrees (east positive)
+
+    Returns:
+        Tuple of NumPy arrays (elevation, azimuth) in degrees
+
+    Raises:
+        RuntimeError: If NumPy is not available
+    """
+    if np is None:
+        raise RuntimeError("solar_position_array requires NumPy")
+
+    timestamp = np.asarray(timestamps, dtype=np.float64)
+    jc = (timestamp / 86400 + _UNIX_EPOCH_JD - _J2000_JD) / 36525
+
+    mean_long = np.mod(280.46646 + jc * (36000.76983 + jc * 0.0003032), 360)
+    mean_anom = 357.52911 + jc * (35999.05029 - 0.0001537 * jc)
+    eccentricity = 0.016708634 - jc * (0.000042037 + 0.0000001267 * jc)
+    m = np.radians(mean_anom)
+    center = (
+        np.sin(m) * (1.914602 - jc * (0.004817 + 0.000014 * jc))
+        + np.sin(2 * m) * (0.019993 - 0.000101 * jc)
+        + np.sin(3 * m) * 0.000289
+    )
+    omega = np.radians(125.04 - 1934.136 * jc)
+    apparent_long = mean_long + center - 0.00569 - 0.00478 * np.sin(omega)
+    mean_obliquity = 23 + (26 + (21.448 - jc * (46.815 + jc * (0.00059 - jc * 0.001813))) / 60) / 60
+    obliquity = np.radians(mean_obliquity + 0.00256 * np.cos(omega))
+    declination = np.arcsin(np.sin(obliquity) * np.sin(np.radians(apparent_long)))
+
+    var_y = np.tan(obliquity / 2) ** 2
+    l0 = np.radians(mean_long)
+    eq_of_time = 4 * np.degrees(
+        var_y * np.sin(2 * l0)
+        - 2 * eccentricity * np.sin(m)
+        + 4 * eccentricity * var_y * np.sin(m) * np.cos(2 * l0)
+        - 0.5 * var_y**2 * np.sin(4 * l0)
+        - 1.25 * eccentricity**2 * np.sin(2 * m)
+    )
+
+    true_solar_time = np.mod(np.mod(timestamp, 86400) / 60 + eq_of_time + 4 * longitude, 1440)
+    hour_angle = np.radians(true_solar_time / 4 - 180)
+
+    lat = math.radians(latitude)
+    cos_zenith = math.sin(lat) * np.sin(declination) + math.cos(lat) * np.cos(declination) * np.cos(
+        hour_angle
+    )
+    zenith = np.arccos(np.clip(cos_zenith, -1.0, 1.0))
+
+    denominator = math.cos(lat) * np.sin(zenith)
+    defined = np.abs(denominator) >= 1e-12
+    cos_azimuth = np.divide(
+        math.sin(lat) * np.cos(zenith) - np.sin(declination),
+        denominator,
+        out=np.zeros_like(denominator),
+        where=defined,
+    )
+    angle = np.degrees(np.arccos(np.clip(cos_azimuth, -1.0, 1.0)))
+    azimuth = np.where(hour_angle > 0, np.mod(angle + 180, 360), np.mod(540 - angle, 360))
+    azimuth = np.where(defined, azimuth, 180.0)
+
+    elevation = 90 - np.degrees(zenith)
+    return elevation + _refraction_array(elevation), azimuth
+
+
+def _refraction_array(elevation: Any) -> Any:
+    """Return the atmospheric refraction correction in degrees for an array."""
+    # Keep tan() away from 0 and 90° in branches that are masked out anyway
+    tan_e = np.tan(np.radians(np.clip(elevation, -89.0, 89.0)))
+    tan_e = np.where(np.abs(tan_e) < 1e-6, 1e-6, tan_e)
+    high = 58.1 / tan_e - 0.07 / tan_e**3 + 0.000086 / tan_e**5
+    low = 1735 + elevation * (
+        -518.2 + elevation * (103.4 + elevation * (-12.79 + elevation * 0.711))
+    )
+    below = -20.772 / tan_e
+    correction = np.select(
+        [elevation > 85, elevation > 5, elevation > -0.575],
+        [0.0, high, low],
+        default=below,
+    )
+    return correction / 3600
@@ -1,19 +1,36 @@
-"""Storage for Solar Window System overrides.
+"""Storage for Solar Window System overrides and the last results.
 
-This module only handles persistent storage of user overrides
-for thresholds and scenarios. Main configuration is stored
-in the Config Entry (via Config Flow).
+This module handles persistent storage of user overrides for thresholds
+and scenarios, and a snapshot of the last calculation results for a warm
+start. Main configuration is stored in the Config Entry (via Config Flow).
+
+Changes are written behind: every change marks the store dirty and
+schedules a delayed save, so a burst of changes (e.g. dragging a
+threshold slider) results in a single write. Pending changes are flushed
+on unload; Home Assistant flushes delayed saves on shutdown.
 """
 
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
 
 from .const import (
     CONF_OVERRIDES,
+    DEFAULT_RESULTS_MAX_AGE,
+    DEFAULT_RESULTS_SAVE_DELAY,
+    DEFAULT_SAVE_DELAY,
+    RESULTS_STORAGE_KEY,
+    RESULTS_STORAGE_VERSION,
     STORAGE_KEY,
     STORAGE_VERSION,
 )
 
+# Order of the values in a compact result row
+RESULT_FIELDS = ("direct", "diffuse", "combined", "shading_recommended")
+
 
 class ConfigStore:
     """Handle storage of override data only.
@@ -24,14 +41,23 @@ class ConfigStore:
     scenarios that are adjusted via dashboard entities.
     """
 
-    def __init__(self, hass: HomeAssistant) -> None:
+    def __init__(self, hass: HomeAssistant, save_delay: float = DEFAULT_SAVE_DELAY) -> None:
         """Initialize the ConfigStore.
 
         Args:
             hass: The Home Assistant instance.
+            save_delay: Seconds to coalesce changes before writing.
         """
         self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
         self.version = STORAGE_VERSION
+        self.save_delay = save_delay
+        self._data_func: Callable[[], dict] | None = None
+        self.writes = 0
+
+    @property
+    def pending_write(self) -> bool:
+        """Return True if changes are waiting to be written."""
+        return self._data_func is not None
 
     async def async_load(self) -> dict:
         """Load overrides from storage.
@@ -51,7 +77,30 @@ class ConfigStore:
         Args:
             overrides: Dictionary of overrides to save.
         """
+        self._data_func = None
         await self._store.async_save(overrides)
+        self.writes += 1
+
+    def async_schedule_save(self, data_func: Callable[[], dict]) -> None:
+        """Mark the store dirty and schedule a delayed, coalesced save.
+
+        Args:
+            data_func: Returns the data to write; called when the save runs,
+                so the latest state is written.
+        """
+        self._data_func = data_func
+        self._store.async_delay_save(self._data_to_save, self.save_delay)
+
+    def _data_to_save(self) -> dict:
+        """Return the pending data and clear the dirty flag."""
+        data_func, self._data_func = self._data_func, None
+        self.writes += 1
+        return data_func() if data_func is not None else {}
+
+    async def async_flush(self) -> None:
+        """Write pending changes immediately."""
+        if self._data_func is not None:
+            await self.async_save(self._data_func())
 
     def _get_empty_overrides(self) -> dict:
         """Return empty overrides structure.
@@ -63,3 +112,107 @@ class ConfigStore:
             "version": self.version,
             CONF_OVERRIDES: {},
         }
+
+
+class ResultStore:
+    """Handle storage of the last calculation results of a config entry.
+
+    Results are stored as compact rows [direct, diffuse, combined,
+    shading] per window, group and global, plus the calculation time.
+    Writes are throttled: the first change after a write schedules the
+    next one, later changes only replace the data that will be written.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        save_delay: float = DEFAULT_RESULTS_SAVE_DELAY,
+        max_age: timedelta = timedelta(minutes=DEFAULT_RESULTS_MAX_AGE),
+    ) -> None:
+        """Initialize the ResultStore.
+
+        Args:
+            hass: The Home Assistant instance.
+            entry_id: ID of the config entry the results belong to.
+            save_delay: Minimum seconds between two writes.
+            max_age: Snapshots older than this are not loaded.
+        """
+        self._store = Store(hass, RESULTS_STORAGE_VERSION, f"{RESULTS_STORAGE_KEY}.{entry_id}")
+        self.save_delay = save_delay
+        self.max_age = max_age
+        self._data_func: Callable[[], dict] | None = None
+        self.writes = 0
+
+    @property
+    def pending_write(self) -> bool:
+        """Return True if results are waiting to be written."""
+        return self._data_func is not None
+
+    async def async_load(self) -> dict | None:
+        """Load the last results.
+
+        Returns:
+            Results keyed by window ID, "group_<id>" and "global", or None
+            if no snapshot exists or it is older than max_age.
+        """
+        data = await self._store.async_load()
+        if not data or "timestamp" not in data:
+            return None
+        timestamp = dt_util.parse_datetime(data["timestamp"])
+        if timestamp is None or dt_util.utcnow() - timestamp > self.max_age:
+            return None
+        return {
+            key: dict(zip(RESULT_FIELDS, row, strict=False))
+            for key, row in data.get("results", {}).items()
+        }
+
+    def async_schedule_save(self, data_func: Callable[[], dict]) -> None:
+        """Schedule a write of the latest results.
+
+        Args:
+            data_func: Returns the results to write; called when the save runs.
+        """
+        if self._data_func is None:
+            self._store.async_delay_save(self._data_to_save, self.save_delay)
+        self._data_func = data_func
+
+    def _data_to_save(self) -> dict:
+        """Return the pending results as a compact snapshot."""
+        data_func, self._data_func = self._data_func, None
+        self.writes += 1
+        return self.compact(data_func() if data_func is not None else {})
+
+    @staticmethod
+    def compact(results: dict, timestamp: datetime | None = None) -> dict:
+        """Convert results to the stored snapshot format.
+
+        Args:
+            results: Results keyed by window ID, "group_<id>" and "global"
+            timestamp: Time of the calculation, defaults to now
+
+        Returns:
+            Snapshot with the timestamp and one row per result
+        """
+        return {
+            "timestamp": (timestamp or dt_util.utcnow()).isoformat(),
+            "results": {
+                key: [
+                    float(values.get("direct", 0)),
+                    float(values.get("diffuse", 0)),
+                    float(values.get("combined", 0)),
+                    bool(values.get("shading_recommended", False)),
+                ]
+                for key, values in results.items()
+            },
+        }
+
+    async def async_remove(self) -> None:
+        """Delete the stored results and drop a pending write."""
+        self._data_func = None
+        await self._store.async_remove()
+
+    async def async_flush(self) -> None:
+        """Write pending results immediately."""
+        if self._data_func is not None:
+            await self._store.async_save(self._data_to_save())
@@ -6,8 +6,6 @@ from homeassistant.components.switch import SwitchEntity, SwitchEntityDescriptio
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     CONF_SCENARIO_FORECAST,
@@ -18,6 +16,7 @@ from .const import (
     LEVEL_WINDOW,
 )
 from .coordinator import SolarCalculationCoordinator
+from .entity import PublishOnChangeEntity
 
 SCENARIO_DESCRIPTIONS = {
     CONF_SCENARIO_INDOOR: SwitchEntityDescription(
@@ -50,54 +49,24 @@ async def async_setup_entry(
     async_add_entities,
 ) -> None:
     """Set up switch entities from config entry."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
-    entities = []
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry_data["coordinator"]
+
+    def create_entities(level: str, entity_id: str) -> list[SolarScenarioSwitch]:
+        """Create the scenario entities of a window, group or global."""
+        return [
+            SolarScenarioSwitch(coordinator, entry, level, entity_id, key, description)
+            for key, description in SCENARIO_DESCRIPTIONS.items()
+        ]
 
     # Global scenario entities
-    for key, description in SCENARIO_DESCRIPTIONS.items():
-        entities.append(
-            SolarScenarioSwitch(
-                coordinator,
-                entry,
-                "global",
-                "global",
-                key,
-                description,
-            )
-        )
+    async_add_entities(create_entities("global", "global"))
+
+    # Window and group scenario entities, also for ones added later
+    entry_data["reconciler"].async_add_platform(async_add_entities, create_entities)
+
 
-    # Group scenario entities
-    for group_id in coordinator.groups:
-        for key, description in SCENARIO_DESCRIPTIONS.items():
-            entities.append(
-                SolarScenarioSwitch(
-                    coordinator,
-                    entry,
-                    LEVEL_GROUP,
-                    group_id,
-                    key,
-                    description,
-                )
-            )
-
-    # Window scenario entities
-    for window_id in coordinator.windows:
-        for key, description in SCENARIO_DESCRIPTIONS.items():
-            entities.append(
-                SolarScenarioSwitch(
-                    coordinator,
-                    entry,
-                    LEVEL_WINDOW,
-                    window_id,
-                    key,
-                    description,
-                )
-            )
-
-    async_add_entities(entities)
-
-
-class SolarScenarioSwitch(CoordinatorEntity, SwitchEntity):
+class SolarScenarioSwitch(PublishOnChangeEntity, SwitchEntity):
     """Switch entity for scenario configuration with inheritance."""
 
     coordinator: SolarCalculationCoordinator
@@ -112,47 +81,11 @@ class SolarScenarioSwitch(CoordinatorEntity, SwitchEntity):
         description: SwitchEntityDescription,
     ) -> None:
         """Initialize the scenario switch."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, level, entity_id)
         self._entry = entry
-        self._level = level
-        self._entity_id = entity_id
         self._scenario_key = scenario_key
         self.entity_description = description
-
-    @property
-    def unique_id(self):
-        """Return unique ID."""
-        return f"{DOMAIN}_{self._level}_{self._entity_id}_{self._scenario_key}"
-
-    @property
-    def device_info(self):
-        """Return device info."""
-        if self._level == "global":
-            return DeviceInfo(
-                identifiers={(DOMAIN, "global")},
-                name="Solar Window System Global",
-                manufacturer="Solar Window System",
-            )
-        elif self._level == LEVEL_GROUP:
-            group_name = self.coordinator.groups.get(self._entity_id, {}).get(
-                "name", self._entity_id
-            )
-            return DeviceInfo(
-                identifiers={(DOMAIN, f"group_{self._entity_id}")},
-                name=f"Gruppe: {group_name}",
-                manufacturer="Solar Window System",
-                via_device=(DOMAIN, "global"),
-            )
-        else:  # window
-            window_name = self.coordinator.windows.get(self._entity_id, {}).get(
-                "name", self._entity_id
-            )
-            return DeviceInfo(
-                identifiers={(DOMAIN, f"window_{self._entity_id}")},
-                name=f"Fenster: {window_name}",
-                manufacturer="Solar Window System",
-                via_device=(DOMAIN, "global"),
-            )
+        self._attr_unique_id = f"{DOMAIN}_{level}_{entity_id}_{scenario_key}"
 
     @property
     def is_on(self):
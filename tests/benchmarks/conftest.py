@@ -0,0 +1,192 @@
+"""Fixtures for the coordinator benchmarks.
+
+The benchmarks only run with SWS_BENCHMARK=1 set. Results are written as
+JSON to SWS_BENCHMARK_OUTPUT (default: benchmark-results.json) so runs
+can be compared across versions.
+"""
+
+import json
+import os
+import platform
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from custom_components.solar_window_system.calculation import HAS_NUMPY
+from custom_components.solar_window_system.const import (
+    CONF_GEOMETRY,
+    CONF_GROUP_ID,
+    CONF_HEIGHT,
+    CONF_PROPERTIES,
+    CONF_SENSORS,
+    CONF_TEMP_INDOOR,
+    CONF_TEMP_OUTDOOR,
+    CONF_THRESHOLD_INDOOR,
+    CONF_USE_TEMP_INDOOR,
+    CONF_USE_TEMP_OUTDOOR,
+    CONF_WIDTH,
+    LEVEL_WINDOW,
+)
+from custom_components.solar_window_system.coordinator import SolarCalculationCoordinator
+
+BENCHMARK_ENABLED = bool(os.environ.get("SWS_BENCHMARK"))
+BENCHMARK_SIZES = [
+    int(size) for size in os.environ.get("SWS_BENCHMARK_SIZES", "10,100,1000,10000").split(",")
+]
+BENCHMARK_REPEATS = int(os.environ.get("SWS_BENCHMARK_REPEATS", "5"))
+
+IRRADIANCE_SENSOR = "sensor.benchmark_irradiance"
+OUTDOOR_SENSOR = "sensor.benchmark_outdoor"
+INDOOR_SENSOR = "sensor.benchmark_indoor"
+
+collect_ignore_glob = [] if BENCHMARK_ENABLED else ["test_*.py"]
+
+
+def generate_config(
+    window_count: int,
+) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any]]:
+    """Generate a synthetic global config, subentries and overrides.
+
+    One group per ten windows (at least one). Every fifth window overrides
+    a threshold and every group has its own indoor sensor, so inheritance
+    and per-window dependencies are exercised.
+
+    Args:
+        window_count: Number of windows
+
+    Returns:
+        Tuple of (global config, subentries, overrides)
+    """
+    group_count = max(1, window_count // 10)
+    config = {
+        CONF_SENSORS: {
+            "irradiance_sensor": IRRADIANCE_SENSOR,
+            CONF_TEMP_OUTDOOR: OUTDOOR_SENSOR,
+            CONF_TEMP_INDOOR: INDOOR_SENSOR,
+        },
+        CONF_USE_TEMP_OUTDOOR: True,
+        CONF_USE_TEMP_INDOOR: True,
+        CONF_PROPERTIES: {"g_value": 0.6, "frame_width": 10},
+    }
+
+    subentries: dict[str, Any] = {}
+    window_overrides: dict[str, Any] = {}
+    for index in range(group_count):
+        subentries[f"group_{index}"] = {
+            "type": "group",
+            "name": f"Group {index}",
+            CONF_SENSORS: {CONF_TEMP_INDOOR: f"{INDOOR_SENSOR}_{index}"},
+        }
+    for index in range(window_count):
+        window: dict[str, Any] = {
+            "type": "window",
+            "name": f"Window {index}",
+            CONF_GROUP_ID: f"group_{index % group_count}",
+            CONF_GEOMETRY: {
+                CONF_WIDTH: 80 + index % 120,
+                CONF_HEIGHT: 100 + index % 80,
+                "azimuth": (index * 37) % 360,
+                "tilt": 90 if index % 7 else 30,
+                "visible_azimuth_start": (index * 37 - 60) % 360,
+                "visible_azimuth_end": (index * 37 + 60) % 360,
+            },
+            CONF_PROPERTIES: {"shading_depth": index % 3 * 50, "window_recess": 20},
+        }
+        subentries[f"window_{index}"] = window
+        if index % 5 == 0:
+            window_overrides[f"window_{index}"] = {CONF_THRESHOLD_INDOOR: 22.0}
+    return config, subentries, {LEVEL_WINDOW: window_overrides}
+
+
+def populate_states(hass: Any, group_count: int) -> None:
+    """Set the sun and sensor states used by the synthetic config."""
+    hass.states.async_set("sun.sun", "above_horizon", {"elevation": 45, "azimuth": 180})
+    hass.states.async_set(IRRADIANCE_SENSOR, "800")
+    hass.states.async_set(OUTDOOR_SENSOR, "28")
+    hass.states.async_set(INDOOR_SENSOR, "25")
+    for index in range(group_count):
+        hass.states.async_set(f"{INDOOR_SENSOR}_{index}", "25")
+
+
+class BenchmarkResults:
+    """Collect timings and write them as JSON."""
+
+    def __init__(self) -> None:
+        """Initialize an empty result list."""
+        self.results: list[dict[str, Any]] = []
+
+    async def measure(
+        self,
+        name: str,
+        windows: int,
+        func: Callable[[], Awaitable[Any] | Any],
+        repeats: int = BENCHMARK_REPEATS,
+        **extra: Any,
+    ) -> dict[str, Any]:
+        """Time func repeatedly and record min/median/max in milliseconds."""
+        durations = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            result = func()
+            if isinstance(result, Awaitable):
+                await result
+            durations.append((time.perf_counter() - start) * 1000)
+
+        entry = {
+            "benchmark": name,
+            "windows": windows,
+            "groups": max(1, windows // 10),
+            "runs": repeats,
+            "min_ms": round(min(durations), 3),
+            "median_ms": round(statistics.median(durations), 3),
+            "max_ms": round(max(durations), 3),
+            **extra,
+        }
+        self.results.append(entry)
+        return entry
+
+    def write(self, path: Path) -> None:
+        """Write all results with environment metadata."""
+        data = {
+            "created": datetime.now(UTC).isoformat(),
+            "python": platform.python_version(),
+            "numpy": HAS_NUMPY,
+            "results": sorted(self.results, key=lambda r: (r["benchmark"], r["windows"])),
+        }
+        path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Run every benchmark taking window_count once per configured size."""
+    if "window_count" in metafunc.fixturenames:
+        metafunc.parametrize(
+            "window_count", BENCHMARK_SIZES, ids=[f"{size}_windows" for size in BENCHMARK_SIZES]
+        )
+
+
+@pytest.fixture
+def synthetic_coordinator(hass, window_count):
+    """Coordinator with a synthetic configuration and populated sensor states."""
+    config, subentries, overrides = generate_config(window_count)
+    populate_states(hass, max(1, window_count // 10))
+    return SolarCalculationCoordinator(hass, config, subentries, overrides)
+
+
+@pytest.fixture
+def synthetic_config(window_count):
+    """Synthetic (config, subentries, overrides) for window_count windows."""
+    return generate_config(window_count)
+
+
+@pytest.fixture(scope="session")
+def benchmark_results():
+    """Session-wide result collector, written to JSON at the end."""
+    results = BenchmarkResults()
+    yield results
+    if results.results:
+        results.write(Path(os.environ.get("SWS_BENCHMARK_OUTPUT", "benchmark-results.json")))
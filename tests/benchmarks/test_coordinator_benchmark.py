@@ -0,0 +1,149 @@
+"""Benchmarks for the coordinator update cycle at 10 to 10,000 windows.
+
+Run with: SWS_BENCHMARK=1 pytest tests/benchmarks
+"""
+
+import importlib
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.solar_window_system import PLATFORMS, async_setup_entry
+from custom_components.solar_window_system.const import (
+    CONF_THRESHOLD_INDOOR,
+    DOMAIN,
+    LEVEL_WINDOW,
+)
+from custom_components.solar_window_system.coordinator import SolarCalculationCoordinator
+from custom_components.solar_window_system.reconcile import EntityReconciler
+
+ENTRY_ID = "benchmark"
+
+
+@pytest.fixture
+def coordinator(synthetic_coordinator):
+    """Coordinator under benchmark."""
+    return synthetic_coordinator
+
+
+async def test_benchmark_coordinator_init(hass, window_count, synthetic_config, benchmark_results):
+    """Benchmark building the coordinator and all derived models."""
+    config, subentries, overrides = synthetic_config
+
+    await benchmark_results.measure(
+        "coordinator_init",
+        window_count,
+        lambda: SolarCalculationCoordinator(hass, config, subentries, overrides),
+    )
+
+
+async def test_benchmark_update_data(coordinator, window_count, benchmark_results):
+    """Benchmark a full update cycle."""
+    result = await benchmark_results.measure(
+        "async_update_data", window_count, coordinator._async_update_data
+    )
+
+    data = await coordinator._async_update_data()
+    assert len(data) >= window_count
+    assert result["median_ms"] > 0
+
+
+async def test_benchmark_get_effective_value(coordinator, window_count, benchmark_results):
+    """Benchmark resolving an inherited threshold for every window."""
+    window_ids = list(coordinator.windows)
+
+    def resolve_all():
+        for window_id in window_ids:
+            coordinator.get_effective_value(LEVEL_WINDOW, window_id, CONF_THRESHOLD_INDOOR)
+
+    await benchmark_results.measure("get_effective_value", window_count, resolve_all)
+
+
+async def test_benchmark_validate_configuration(coordinator, window_count, benchmark_results):
+    """Benchmark the configuration validation."""
+    await benchmark_results.measure(
+        "validate_configuration", window_count, coordinator.validate_configuration
+    )
+
+    assert coordinator.validate_configuration() == []
+
+
+async def test_benchmark_entity_setup(hass, coordinator, window_count, benchmark_results):
+    """Benchmark creating the entities of all platforms."""
+    await coordinator._async_update_data()
+    entities: list = []
+
+    async def setup_all():
+        entities.clear()
+        await _async_setup_platforms(hass, coordinator, entities.extend)
+
+    result = await benchmark_results.measure("entity_setup", window_count, setup_all)
+    result["entities"] = len(entities)
+
+    assert len(entities) > window_count
+
+
+async def test_benchmark_add_window(hass, coordinator, window_count, benchmark_results):
+    """Benchmark adding the entities of one new window to a running installation."""
+    await coordinator._async_update_data()
+    added: list = []
+    reconciler = await _async_setup_platforms(hass, coordinator, added.extend)
+    subentries = dict(coordinator._subentries)
+    window = next(data for data in subentries.values() if data.get("type") == "window")
+
+    async def add_window():
+        added.clear()
+        new_subentries = {**subentries, "new_window": {**window, "name": "New"}}
+        coordinator.update_subentries(new_subentries)
+        reconciler.async_reconcile()
+        # Back to the original windows for the next repeat
+        coordinator.update_subentries(subentries)
+        reconciler.async_reconcile()
+
+    await benchmark_results.measure("add_window", window_count, add_window)
+
+    assert added
+    assert all("new_window" in entity.unique_id for entity in added)
+
+
+async def test_benchmark_entry_setup(hass, window_count, synthetic_config, benchmark_results):
+    """Benchmark the config entry setup that holds up the Home Assistant boot."""
+    config, subentries, _ = synthetic_config
+    entry = MagicMock(
+        entry_id=ENTRY_ID,
+        data=config,
+        subentries={
+            subentry_id: SimpleNamespace(data=data, subentry_type=data["type"], title=data["name"])
+            for subentry_id, data in subentries.items()
+        },
+    )
+    # The first calculation is benchmarked by async_update_data
+    entry.async_create_background_task.side_effect = lambda hass, target, name: target.close()
+    entities: list = []
+
+    async def forward_entry_setups(entry, platforms):
+        for platform in platforms:
+            module = importlib.import_module(f"custom_components.solar_window_system.{platform}")
+            await module.async_setup_entry(hass, entry, entities.extend)
+
+    async def setup_entry():
+        entities.clear()
+        await async_setup_entry(hass, entry)
+
+    with patch.object(hass.config_entries, "async_forward_entry_setups", forward_entry_setups):
+        result = await benchmark_results.measure("entry_setup", window_count, setup_entry)
+    result["entities"] = len(entities)
+
+    assert len(entities) > window_count
+
+
+async def _async_setup_platforms(hass, coordinator, async_add_entities) -> EntityReconciler:
+    """Set up all platforms of a synthetic config entry."""
+    reconciler = EntityReconciler(coordinator)
+    hass.data[DOMAIN] = {ENTRY_ID: {"coordinator": coordinator, "reconciler": reconciler}}
+    entry = SimpleNamespace(entry_id=ENTRY_ID)
+    for platform in PLATFORMS:
+        module = importlib.import_module(f"custom_components.solar_window_system.{platform}")
+        await module.async_setup_entry(hass, entry, async_add_entities)
+    return reconciler
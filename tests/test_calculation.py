@@ -0,0 +1,210 @@
+"""Tests for the batched window calculation engine."""
+
+import pytest
+
+from custom_components.solar_window_system.calculation import (
+    AZIMUTH_HIDDEN,
+    AZIMUTH_PARTIAL,
+    AZIMUTH_VISIBLE,
+    HAS_NUMPY,
+    WindowCalculationEngine,
+    WindowParameters,
+    azimuth_in_range,
+    build_azimuth_bins,
+    compile_window,
+    diffuse_energy,
+    direct_energy,
+    sun_is_visible,
+)
+
+
+@pytest.fixture
+def windows():
+    """Fixture for a mix of windows covering visibility edge cases."""
+    params = {
+        "south": WindowParameters(
+            width=150,
+            height=120,
+            frame_width=10,
+            g_value=0.6,
+            azimuth=180,
+            tilt=90,
+            visible_azimuth_start=150,
+            visible_azimuth_end=210,
+        ),
+        "east": WindowParameters(
+            width=100,
+            height=100,
+            frame_width=5,
+            g_value=0.5,
+            azimuth=90,
+            tilt=90,
+            visible_azimuth_start=60,
+            visible_azimuth_end=120,
+        ),
+        "skylight": WindowParameters(
+            width=80,
+            height=80,
+            frame_width=5,
+            g_value=0.7,
+            azimuth=180,
+            tilt=30,
+        ),
+        "shaded": WindowParameters(
+            width=150,
+            height=120,
+            frame_width=10,
+            azimuth=180,
+            tilt=90,
+            visible_azimuth_start=150,
+            visible_azimuth_end=210,
+            shading_depth=100,
+            window_recess=30,
+        ),
+        "north": WindowParameters(
+            width=100,
+            height=100,
+            azimuth=0,
+            tilt=90,
+            visible_azimuth_start=300.5,
+            visible_azimuth_end=59.5,
+        ),
+    }
+    return {window_id: compile_window(p) for window_id, p in params.items()}
+
+
+def test_scalar_formulas_match_reference_values():
+    """Test the scalar formulas for a south window with the sun due south."""
+    window = compile_window(WindowParameters(width=150, height=120, frame_width=10, g_value=0.6))
+
+    # Effective area = 1.3m * 1.0m = 1.3m², vertical window sees half the sky
+    assert diffuse_energy(100, window) == pytest.approx(100 * 1.3 * 0.5 * 0.6)
+    # Incidence factor for a vertical window = cos(elevation)
+    assert direct_energy(800, 45, 180, window) == pytest.approx(800 * 1.3 * 0.7071068 * 0.6)
+
+
+def test_compile_window_precomputes_constants():
+    """Test compiled windows hold the cycle-independent terms."""
+    compiled = compile_window(
+        WindowParameters(width=150, height=120, frame_width=10, g_value=0.5, tilt=0)
+    )
+
+    assert compiled.area_g == pytest.approx(1.3 * 0.5)
+    assert compiled.cos_tilt == pytest.approx(1.0)
+    assert compiled.sin_tilt == pytest.approx(0.0)
+    assert compiled.diffuse_factor == pytest.approx(1.0)
+    assert compiled.shade_angle == float("-inf")
+
+
+def test_sun_is_visible_respects_shading_angle():
+    """Test the shading angle blocks low sun."""
+    window = compile_window(WindowParameters(shading_depth=100, window_recess=30))
+
+    # atan2(31, 100) = 17.22°
+    assert sun_is_visible(15, 180, window) is False
+    assert sun_is_visible(20, 180, window) is True
+
+
+def test_azimuth_bins_classify_range():
+    """Test bins inside, outside and on the boundary of the visible range."""
+    bins = build_azimuth_bins(150.5, 210)
+
+    assert bins[149] == AZIMUTH_HIDDEN
+    assert bins[150] == AZIMUTH_PARTIAL
+    assert bins[151] == AZIMUTH_VISIBLE
+    assert bins[209] == AZIMUTH_VISIBLE
+    assert bins[210] == AZIMUTH_PARTIAL
+    assert bins[211] == AZIMUTH_HIDDEN
+
+
+def test_sun_is_visible_wraps_across_north():
+    """Test a visible range with start > end wraps across north."""
+    window = compile_window(WindowParameters(visible_azimuth_start=300, visible_azimuth_end=60))
+
+    assert sun_is_visible(30, 350, window) is True
+    assert sun_is_visible(30, 10, window) is True
+    assert sun_is_visible(30, 60, window) is True
+    assert sun_is_visible(30, 60.5, window) is False
+    assert sun_is_visible(30, 180, window) is False
+
+
+@pytest.mark.parametrize(
+    ("start", "end", "visible"),
+    [(300, 360, True), (300, 60, True), (0, 60, False), (10, 355, False)],
+)
+def test_sun_is_visible_at_azimuth_360(start, end, visible):
+    """Test azimuth 360° is compared like the range check, not as bin 0."""
+    window = compile_window(WindowParameters(visible_azimuth_start=start, visible_azimuth_end=end))
+
+    assert sun_is_visible(30, 360, window) is azimuth_in_range(360, start, end) is visible
+    for use_numpy in {False, HAS_NUMPY}:
+        engine = WindowCalculationEngine({"window": window}, use_numpy=use_numpy)
+        assert engine.calculate(30, 360, 600, 200)["window"]["visible"] is visible
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+@pytest.mark.parametrize(
+    ("elevation", "azimuth"),
+    [(45, 180), (15, 180), (30, 95), (60, 250), (5, 140), (20, 10), (20, 300.2), (20, 59.7)],
+)
+def test_engine_matches_scalar_formulas(windows, use_numpy, elevation, azimuth):
+    """Test both engine paths match the per-window reference formulas."""
+    if use_numpy and not HAS_NUMPY:
+        pytest.skip("NumPy not installed")
+
+    engine = WindowCalculationEngine(windows, use_numpy=use_numpy)
+    results = engine.calculate(elevation, azimuth, 600, 200)
+
+    assert list(results) == list(windows)
+    for window_id, window in windows.items():
+        visible = sun_is_visible(elevation, azimuth, window)
+        expected_direct = direct_energy(600, elevation, azimuth, window) if visible else 0
+        expected_diffuse = diffuse_energy(200, window)
+
+        result = results[window_id]
+        assert result["visible"] is visible
+        assert result["direct"] == pytest.approx(expected_direct)
+        assert result["diffuse"] == pytest.approx(expected_diffuse)
+        assert result["combined"] == result["direct"] + result["diffuse"]
+
+
+def test_engine_without_windows_returns_empty():
+    """Test an empty engine returns no results."""
+    engine = WindowCalculationEngine({})
+
+    assert len(engine) == 0
+    assert engine.calculate(45, 180, 600, 200) == {}
+
+
+def test_engine_falls_back_without_numpy(windows, monkeypatch):
+    """Test the engine uses the scalar path when NumPy is unavailable."""
+    from custom_components.solar_window_system import calculation
+
+    monkeypatch.setattr(calculation, "HAS_NUMPY", False)
+    engine = WindowCalculationEngine(windows, use_numpy=True)
+
+    assert engine.use_numpy is False
+    assert engine.calculate(45, 180, 600, 200)["south"]["direct"] > 0
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason="NumPy not installed")
+def test_series_matches_single_steps(windows):
+    """Test the time series path matches per-step calculations on both paths."""
+    elevations = [-5, 5, 30, 45, 60, 20, 10]
+    azimuths = [90, 100, 150, 180, 210, 270, 330]
+    direct = [0, 100, 500, 800, 700, 300, 50]
+    diffuse = [0, 50, 100, 150, 120, 80, 40]
+
+    vectorized = WindowCalculationEngine(windows).calculate_series(
+        elevations, azimuths, direct, diffuse
+    )
+    scalar = WindowCalculationEngine(windows, use_numpy=False).calculate_series(
+        elevations, azimuths, direct, diffuse
+    )
+
+    reference = WindowCalculationEngine(windows, use_numpy=False)
+    for step, args in enumerate(zip(elevations, azimuths, direct, diffuse, strict=True)):
+        for window_id, result in reference.calculate(*args).items():
+            for key in ("direct", "diffuse", "combined"):
+                assert vectorized[window_id][key][step] == pytest.approx(result[key])
+                assert scalar[window_id][key][step] == pytest.approx(result[key])
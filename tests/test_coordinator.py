@@ -1,26 +1,40 @@
 """Tests for SolarCalculationCoordinator with subentries and overrides."""
 
+import asyncio
+from datetime import UTC, datetime, timedelta
 from typing import cast
+from unittest.mock import patch
 
 import pytest
+from homeassistant.core import Event
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from custom_components.solar_window_system.const import (
+    CONF_ADVANCED,
     CONF_GEOMETRY,
     CONF_GROUP_ID,
     CONF_HEIGHT,
+    CONF_INTERNAL_SOLAR_POSITION,
     CONF_PROPERTIES,
     CONF_SENSORS,
     CONF_TEMP_INDOOR,
     CONF_TEMP_OUTDOOR,
+    CONF_UPDATE_MODE,
+    CONF_USE_WEATHER_WARNING,
     CONF_WIDTH,
     DEFAULT_G_VALUE,
+    DEFAULT_UPDATE_INTERVAL,
+    LEVEL_GLOBAL,
     LEVEL_GROUP,
     LEVEL_WINDOW,
+    UPDATE_MODE_PUSH,
 )
 from custom_components.solar_window_system.coordinator import (
     SolarCalculationCoordinator,
 )
+from custom_components.solar_window_system.store import ResultStore
+
+COORDINATOR = "custom_components.solar_window_system.coordinator"
 
 
 @pytest.fixture
@@ -353,6 +367,47 @@ async def test_async_update_night_returns_zero(hass, coordinator):
     assert window_result["direct"] == 0
     assert window_result["diffuse"] == 0
     assert window_result["combined"] == 0
+    coordinator.async_stop_sleep()
+
+
+@pytest.mark.asyncio
+async def test_night_suspends_polling_until_sunrise(hass, coordinator):
+    """Test the zero results are published once and polling resumes at sunrise."""
+    now = datetime(2024, 6, 21, 22, 0, tzinfo=UTC)
+    sunrise = datetime(2024, 6, 22, 2, 45, tzinfo=UTC)
+    hass.states.async_set(
+        "sun.sun", "below_horizon", {"elevation": -10, "next_rising": sunrise.isoformat()}
+    )
+    hass.states.async_set("sensor.solar_irradiance", "800")
+
+    with (
+        patch(f"{COORDINATOR}.dt_util.utcnow", return_value=now),
+        patch(f"{COORDINATOR}.async_track_point_in_utc_time") as mock_track,
+    ):
+        result = await coordinator._async_update_data()
+
+    assert result["global"]["combined"] == 0
+    assert coordinator.sleeping
+    assert coordinator.update_interval is None
+    wake_up, wake_up_at = mock_track.call_args.args[1:]
+    assert wake_up_at == sunrise
+
+    # Input changes do not recalculate while sleeping
+    with patch.object(coordinator._push_debouncer, "async_schedule_call") as mock_schedule:
+        coordinator._async_handle_input_change(
+            Event("state_changed", {"entity_id": "sensor.solar_irradiance"})
+        )
+    mock_schedule.assert_not_called()
+
+    hass.states.async_set("sun.sun", "above_horizon", {"elevation": 1, "azimuth": 60})
+    with patch.object(
+        coordinator, "async_refresh", side_effect=coordinator._async_update_data
+    ) as mock_refresh:
+        await wake_up(sunrise)
+
+    mock_refresh.assert_awaited_once()
+    assert not coordinator.sleeping
+    assert coordinator.update_interval == timedelta(seconds=DEFAULT_UPDATE_INTERVAL)
 
 
 @pytest.mark.asyncio
@@ -387,6 +442,37 @@ async def test_async_update_calculates_energy(hass, coordinator):
     assert window_result["combined"] == window_result["direct"] + window_result["diffuse"]
 
 
+@pytest.mark.asyncio
+async def test_internal_solar_position_ignores_sun_entity(hass, mock_config, mock_subentries):
+    """Test the internal solar position replaces the sun.sun attributes."""
+    hass.config.latitude = 52.52
+    hass.config.longitude = 13.405
+    coordinator = SolarCalculationCoordinator(
+        hass,
+        {**mock_config, CONF_ADVANCED: {CONF_INTERNAL_SOLAR_POSITION: True}},
+        mock_subentries,
+        {},
+    )
+    # Stale sun.sun state must not matter
+    hass.states.async_set("sun.sun", "below_horizon", {"elevation": -10, "azimuth": 0})
+    hass.states.async_set("sensor.solar_irradiance", "800")
+
+    noon = datetime(2024, 6, 21, 11, 13, tzinfo=UTC)
+    with patch(
+        "custom_components.solar_window_system.coordinator.dt_util.utcnow", return_value=noon
+    ):
+        result = await coordinator._async_update_data()
+    assert result["test_window"]["direct"] > 0
+
+    midnight = datetime(2024, 6, 21, 23, 0, tzinfo=UTC)
+    with patch(
+        "custom_components.solar_window_system.coordinator.dt_util.utcnow", return_value=midnight
+    ):
+        result = await coordinator._async_update_data()
+    assert result["test_window"]["combined"] == 0
+    coordinator.async_stop_sleep()
+
+
 @pytest.mark.asyncio
 async def test_aggregation_includes_groups(hass, mock_config):
     """Test that aggregation includes group results."""
@@ -633,3 +719,347 @@ async def test_subentries_extraction(hass, mock_config):
     assert "group_1" in coordinator.groups
     assert "other_key" not in coordinator.windows
     assert "other_key" not in coordinator.groups
+
+
+@pytest.mark.asyncio
+async def test_window_models_use_inherited_properties(hass, mock_config):
+    """Test compiled windows resolve frame width and g-value through groups."""
+    subentries = {
+        "test_group": {
+            "type": "group",
+            "name": "Test Group",
+            "azimuth": 90,
+            CONF_PROPERTIES: {"g_value": 0.5, "frame_width": 0},
+        },
+        "test_window": {
+            "type": "window",
+            "name": "Test Window",
+            CONF_GROUP_ID: "test_group",
+            CONF_GEOMETRY: {CONF_WIDTH: 100, CONF_HEIGHT: 100},
+        },
+    }
+    coordinator = SolarCalculationCoordinator(hass, mock_config, subentries, {})
+
+    model = coordinator.window_models["test_window"]
+    assert model.area_g == pytest.approx(1.0 * 0.5)
+    assert model.azimuth == 90
+
+
+@pytest.mark.asyncio
+async def test_window_models_rebuilt_on_compile(hass, mock_config, mock_subentries):
+    """Test recompiling picks up changed window geometry."""
+    coordinator = SolarCalculationCoordinator(hass, mock_config, mock_subentries, {})
+    old_model = coordinator.window_models["test_window"]
+
+    coordinator.windows["test_window"][CONF_GEOMETRY][CONF_WIDTH] = 300
+    coordinator._compile_windows()
+
+    assert coordinator.window_models["test_window"].area_g > old_model.area_g
+
+
+@pytest.mark.asyncio
+async def test_async_update_reads_each_sensor_once(hass, coordinator):
+    """Test every sensor is read once per cycle and released afterwards."""
+    hass.states.async_set("sun.sun", "above_horizon", {"elevation": 45, "azimuth": 180})
+    hass.states.async_set("sensor.solar_irradiance", "800")
+    hass.states.async_set("sensor.outdoor_temperature", "28")
+
+    original_get = hass.states.get
+    with patch.object(hass.states, "get", side_effect=original_get) as mock_get:
+        await coordinator._async_update_data()
+
+    reads = [call.args[0] for call in mock_get.call_args_list]
+    assert reads.count("sensor.solar_irradiance") == 1
+    assert reads.count("sensor.outdoor_temperature") == 1
+    assert coordinator._snapshot.active is False
+
+
+@pytest.mark.asyncio
+async def test_async_update_records_phase_timings(hass, coordinator):
+    """Test an update cycle records its phases and state lookups."""
+    hass.states.async_set("sun.sun", "above_horizon", {"elevation": 45, "azimuth": 180})
+    hass.states.async_set("sensor.solar_irradiance", "800")
+
+    await coordinator._async_update_data()
+
+    timings = coordinator.performance.statistics()
+    assert {"cycle", "sensor_reads", "energy", "shading", "aggregation"} <= set(timings)
+    # sun.sun plus the two configured sensors
+    assert coordinator.performance.last_counts["state_lookups"] == 3
+
+
+@pytest.mark.asyncio
+async def test_should_shade_respects_weather_warning(hass, mock_config, mock_subentries):
+    """Test an active weather warning (binary sensor 'on') disables shading."""
+    mock_config[CONF_SENSORS]["weather_warning"] = "binary_sensor.weather_warning"
+    mock_config[CONF_USE_WEATHER_WARNING] = True
+    coordinator = SolarCalculationCoordinator(hass, mock_config, mock_subentries, {})
+
+    hass.states.async_set("binary_sensor.weather_warning", "on")
+    with patch.object(coordinator, "_get_indoor_temp", return_value=30.0):
+        assert await coordinator._should_shade("test_window", 1000) is False
+
+    hass.states.async_set("binary_sensor.weather_warning", "off")
+    with patch.object(coordinator, "_get_indoor_temp", return_value=30.0):
+        assert await coordinator._should_shade("test_window", 1000) is True
+    assert coordinator.get_runtime_errors() == []
+
+
+@pytest.mark.asyncio
+async def test_push_mode_subscribes_to_inputs(hass, mock_config, mock_subentries):
+    """Test push mode disables polling and listens to sun and sensor changes."""
+    mock_config[CONF_ADVANCED] = {CONF_UPDATE_MODE: UPDATE_MODE_PUSH}
+    coordinator = SolarCalculationCoordinator(hass, mock_config, mock_subentries, {})
+    assert coordinator.update_interval is None
+
+    with patch(
+        "custom_components.solar_window_system.coordinator.async_track_state_change_event"
+    ) as mock_track:
+        coordinator.async_start_push_updates()
+
+    entity_ids = mock_track.call_args.args[1]
+    assert entity_ids == ["sun.sun", "sensor.outdoor_temperature", "sensor.solar_irradiance"]
+
+    # Each input change is handed to the debouncer, which coalesces bursts
+    with patch.object(coordinator._push_debouncer, "async_schedule_call") as mock_schedule:
+        for _ in range(3):
+            coordinator._async_handle_input_change(
+                Event("state_changed", {"entity_id": "sensor.solar_irradiance"})
+            )
+    assert mock_schedule.call_count == 3
+
+    coordinator.async_stop_push_updates()
+    mock_track.return_value.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_polling_mode_does_not_subscribe(hass, coordinator):
+    """Test the default polling mode keeps the update interval and no listeners."""
+    assert coordinator.update_interval is not None
+
+    with patch(
+        "custom_components.solar_window_system.coordinator.async_track_state_change_event"
+    ) as mock_track:
+        coordinator.async_start_push_updates()
+
+    mock_track.assert_not_called()
+
+
+@pytest.fixture
+def push_coordinator(hass, mock_config, mock_subentries):
+    """Fixture for a push mode coordinator with two windows in one group."""
+    mock_config[CONF_ADVANCED] = {CONF_UPDATE_MODE: UPDATE_MODE_PUSH}
+    window = mock_subentries["test_window"]
+    subentries = {
+        "window_a": {**window, CONF_GROUP_ID: "room", CONF_SENSORS: {CONF_TEMP_INDOOR: "sensor.a"}},
+        "window_b": {**window, CONF_GROUP_ID: "room", CONF_SENSORS: {CONF_TEMP_INDOOR: "sensor.b"}},
+        "room": {"type": "group", "name": "Room", "windows": ["window_a", "window_b"]},
+    }
+    hass.states.async_set("sun.sun", "above_horizon", {"elevation": 45, "azimuth": 180})
+    hass.states.async_set("sensor.solar_irradiance", "800")
+    hass.states.async_set("sensor.a", "20")
+    hass.states.async_set("sensor.b", "20")
+    return SolarCalculationCoordinator(hass, mock_config, subentries, {})
+
+
+@pytest.mark.asyncio
+async def test_push_update_recomputes_only_affected_windows(hass, push_coordinator):
+    """Test an indoor sensor change only recomputes the windows using it."""
+    coordinator = push_coordinator
+    coordinator.data = await coordinator._async_update_data()
+    assert coordinator.data["global"]["shading_recommended"] is False
+
+    hass.states.async_set("sensor.a", "30")
+    coordinator._async_handle_input_change(Event("state_changed", {"entity_id": "sensor.a"}))
+
+    with patch.object(
+        coordinator, "_should_shade", wraps=coordinator._should_shade
+    ) as mock_should_shade:
+        results = await coordinator._async_update_data()
+
+    assert [call.args[0] for call in mock_should_shade.call_args_list] == ["window_a"]
+    assert results["window_a"]["shading_recommended"] is True
+    assert results["window_b"] is coordinator.data["window_b"]
+    assert results["group_room"]["shading_recommended"] is True
+    assert results["global"]["shading_recommended"] is True
+    assert results["global"]["combined"] == coordinator.data["global"]["combined"]
+
+
+@pytest.mark.asyncio
+async def test_push_update_clears_recovered_sensor_errors(hass, push_coordinator):
+    """Test an incremental update drops the errors of a recovered indoor sensor."""
+    coordinator = push_coordinator
+    hass.states.async_set("sensor.a", "unavailable")
+    hass.states.async_set("sensor.b", "unavailable")
+    coordinator.data = await coordinator._async_update_data()
+    assert len(coordinator.get_runtime_errors()) == 2
+
+    hass.states.async_set("sensor.a", "20")
+    coordinator._async_handle_input_change(Event("state_changed", {"entity_id": "sensor.a"}))
+    await coordinator._async_update_data()
+
+    errors = coordinator.get_runtime_errors()
+    assert len(errors) == 1
+    assert "sensor.b" in errors[0]
+
+
+@pytest.mark.asyncio
+async def test_push_update_global_input_recomputes_all(hass, push_coordinator):
+    """Test a change of a global input triggers a full recalculation."""
+    coordinator = push_coordinator
+    coordinator.data = await coordinator._async_update_data()
+
+    coordinator._async_handle_input_change(
+        Event("state_changed", {"entity_id": "sensor.solar_irradiance"})
+    )
+
+    with patch.object(coordinator, "_calculate_results", return_value={}) as mock_full:
+        await coordinator._async_update_data()
+    mock_full.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_window_override_applied_incrementally(hass, push_coordinator):
+    """Test a window override updates that window without a full cycle."""
+    coordinator = push_coordinator
+    hass.states.async_set("sensor.a", "22")
+    coordinator.data = await coordinator._async_update_data()
+    assert coordinator.data["window_a"]["shading_recommended"] is False
+
+    with patch.object(coordinator, "_calculate_results") as mock_full:
+        await coordinator.set_override(LEVEL_WINDOW, "window_a", "threshold_indoor", 21)
+
+    mock_full.assert_not_called()
+    assert coordinator.data["window_a"]["shading_recommended"] is True
+    assert coordinator.data["window_b"]["shading_recommended"] is False
+    assert coordinator.data["global"]["shading_recommended"] is True
+
+
+@pytest.mark.asyncio
+async def test_override_during_update_cycle_is_not_reverted(hass, push_coordinator):
+    """Test an override set while a full cycle is suspended survives the cycle."""
+    coordinator = push_coordinator
+    hass.states.async_set("sensor.a", "22")
+    coordinator.data = await coordinator._async_update_data()
+    assert coordinator.data["window_a"]["shading_recommended"] is False
+
+    # Suspend the full cycle after window_a was evaluated
+    suspended = asyncio.Event()
+    resume = asyncio.Event()
+    should_shade = coordinator._should_shade
+
+    async def slow_should_shade(window_id, combined):
+        result = await should_shade(window_id, combined)
+        if window_id == "window_a" and not suspended.is_set():
+            suspended.set()
+            await resume.wait()
+        return result
+
+    with patch.object(coordinator, "_should_shade", side_effect=slow_should_shade):
+        refresh = asyncio.create_task(coordinator.async_refresh())
+        await suspended.wait()
+        override = asyncio.create_task(
+            coordinator.set_override(LEVEL_WINDOW, "window_a", "threshold_indoor", 21)
+        )
+        await asyncio.sleep(0)
+        resume.set()
+        await asyncio.gather(refresh, override)
+
+    assert coordinator.data["window_a"]["shading_recommended"] is True
+    assert coordinator.data["global"]["shading_recommended"] is True
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("level", "entity_id"), [(LEVEL_GLOBAL, "global"), (LEVEL_GROUP, "room")])
+async def test_override_without_patch_updates_listeners(hass, push_coordinator, level, entity_id):
+    """Test overrides that cannot patch the results still republish effective values."""
+    coordinator = push_coordinator
+    # Night results cannot be patched incrementally
+    coordinator.data = coordinator._get_zero_results()
+
+    with patch.object(coordinator, "async_update_listeners") as mock_update:
+        await coordinator.set_override(level, entity_id, "threshold_indoor", 21)
+
+    mock_update.assert_called_once()
+
+
+def test_group_membership_merges_legacy_windows_list(hass, mock_config, mock_subentries):
+    """Test legacy "windows" entries join the members once, in order, if they exist."""
+    window = mock_subentries["test_window"]
+    subentries = {
+        "window_1": {**window, CONF_GROUP_ID: "room"},
+        "window_2": window,
+        "window_3": window,
+        "room": {
+            "type": "group",
+            "name": "Room",
+            "windows": ["window_3", "window_1", "missing", "window_3", "window_2"],
+        },
+    }
+    coordinator = SolarCalculationCoordinator(hass, mock_config, subentries, {})
+
+    assert coordinator._group_members == {"room": ["window_1", "window_3", "window_2"]}
+    assert coordinator._window_groups == {
+        "window_1": ["room"],
+        "window_3": ["room"],
+        "window_2": ["room"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_aggregation_uses_window_group_id(hass, mock_config, mock_subentries):
+    """Test groups aggregate windows referencing them via group_id."""
+    window = mock_subentries["test_window"]
+    subentries = {
+        "window_1": {**window, CONF_GROUP_ID: "room"},
+        "window_2": {**window, CONF_GROUP_ID: "room"},
+        "window_3": window,
+        # Groups created by the subentry flow have no "windows" list
+        "room": {"type": "group", "name": "Room"},
+    }
+    coordinator = SolarCalculationCoordinator(hass, mock_config, subentries, {})
+    hass.states.async_set("sun.sun", "above_horizon", {"elevation": 45, "azimuth": 180})
+    hass.states.async_set("sensor.solar_irradiance", "800")
+
+    result = await coordinator._async_update_data()
+
+    assert result["group_room"]["combined"] == pytest.approx(
+        result["window_1"]["combined"] + result["window_2"]["combined"]
+    )
+    assert result["global"]["combined"] == pytest.approx(3 * result["window_3"]["combined"])
+    assert coordinator._window_groups == {"window_1": ["room"], "window_2": ["room"]}
+
+
+@pytest.mark.asyncio
+async def test_load_snapshot_seeds_data(hass, coordinator):
+    """Test the last stored results are used until the first calculation."""
+    result_store = ResultStore(hass, "entry")
+    coordinator.set_result_store(result_store)
+    snapshot = ResultStore.compact(
+        {
+            "test_window": {"direct": 1, "diffuse": 2, "combined": 3, "shading_recommended": True},
+            "removed_window": {"direct": 1, "diffuse": 2, "combined": 3},
+        }
+    )
+
+    with patch.object(result_store._store, "async_load", return_value=snapshot):
+        assert await coordinator.async_load_snapshot() is True
+
+    assert coordinator.data["test_window"]["combined"] == 3
+    assert coordinator.data["test_window"]["shading_recommended"] is True
+    assert coordinator.data["global"] == {
+        "direct": 0,
+        "diffuse": 0,
+        "combined": 0,
+        "shading_recommended": False,
+    }
+    assert "removed_window" not in coordinator.data
+    # Incremental updates start from the shading of the snapshot
+    assert coordinator._shading_count == 1
+
+    # Calculated results are written back to the snapshot
+    hass.states.async_set("sun.sun", "below_horizon", {"elevation": -5, "azimuth": 0})
+    with patch.object(result_store._store, "async_delay_save") as mock_delay_save:
+        await coordinator._async_update_data()
+    mock_delay_save.assert_called_once()
+    coordinator.async_stop_sleep()
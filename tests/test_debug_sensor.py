@@ -17,6 +17,11 @@ from custom_components.solar_window_system.diagnostic_sensor import (
     RuntimeDebugSensor,
     async_setup_entry,
 )
+from custom_components.solar_window_system.performance import (
+    COUNTER_STATE_LOOKUPS,
+    PHASE_ENERGY,
+    PerformanceMonitor,
+)
 
 
 @pytest.fixture
@@ -142,6 +147,23 @@ class TestRuntimeDebugSensor:
         assert attrs["errors"] == ["Error 1"]
         assert "last_update" in attrs
 
+    def test_extra_state_attributes_timings(self, mock_coordinator):
+        """Test runtime sensor exposes phase timings and cycle counters."""
+        monitor = PerformanceMonitor()
+        monitor.start_cycle()
+        with monitor.phase(PHASE_ENERGY):
+            pass
+        monitor.count(COUNTER_STATE_LOOKUPS, 4)
+        monitor.finish_cycle()
+        mock_coordinator.performance = monitor
+        mock_coordinator.get_runtime_errors.return_value = []
+
+        attrs = RuntimeDebugSensor(mock_coordinator).extra_state_attributes
+
+        assert set(attrs["timings"][PHASE_ENERGY]) == {"last", "mean", "p95", "max", "samples"}
+        assert attrs["state_lookups"] == 4
+        assert attrs["service_calls"] == 0
+
 
 @pytest.mark.asyncio
 async def test_async_setup_entry(mock_hass, mock_coordinator):
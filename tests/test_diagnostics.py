@@ -0,0 +1,67 @@
+"""Tests for the config entry diagnostics."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.solar_window_system.const import CONF_SENSORS, DOMAIN
+from custom_components.solar_window_system.coordinator import SolarCalculationCoordinator
+from custom_components.solar_window_system.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from custom_components.solar_window_system.store import ConfigStore
+
+CONFIG = {"name": "Haus Müller", CONF_SENSORS: {"irradiance_sensor": "sensor.irradiance"}}
+
+
+@pytest.mark.asyncio
+async def test_diagnostics(hass):
+    """Test diagnostics contain redacted config, counts and statistics."""
+    subentries = {
+        "window_1": {"type": "window", "name": "Annas Zimmer", "geometry": {"width": 100}},
+        "group_1": {"type": "group", "name": "Süd"},
+    }
+    coordinator = SolarCalculationCoordinator(hass, CONFIG, subentries, {})
+    entry = SimpleNamespace(
+        entry_id="entry",
+        data=CONFIG,
+        subentries={
+            sub_id: SimpleNamespace(subentry_type=data["type"], data=data)
+            for sub_id, data in subentries.items()
+        },
+    )
+    hass.data[DOMAIN] = {entry.entry_id: {"coordinator": coordinator, "store": ConfigStore(hass)}}
+    hass.states.async_set("sun.sun", "above_horizon", {"elevation": 45, "azimuth": 180})
+    hass.states.async_set("sensor.irradiance", "800")
+    await coordinator._async_update_data()
+    coordinator.get_effective_value("window", "window_1", "threshold_indoor")
+
+    registry_entries = [SimpleNamespace(domain="sensor")] * 3 + [SimpleNamespace(domain="switch")]
+    with (
+        patch("custom_components.solar_window_system.diagnostics.er.async_get", MagicMock()),
+        patch(
+            "custom_components.solar_window_system.diagnostics.er.async_entries_for_config_entry",
+            return_value=registry_entries,
+        ),
+    ):
+        diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diagnostics["config"]["name"] == "**REDACTED**"
+    assert diagnostics["config"][CONF_SENSORS] == CONFIG[CONF_SENSORS]
+    assert all(sub["name"] == "**REDACTED**" for sub in diagnostics["subentries"])
+    assert diagnostics["counts"] == {
+        "windows": 1,
+        "groups": 1,
+        "entities": {"sensor": 3, "switch": 1},
+    }
+    assert diagnostics["coordinator"]["cycles"] == 1
+    assert "cycle" in diagnostics["timings"]
+    assert diagnostics["caches"]["inheritance_table"]["hit_rate"] == 1.0
+    assert diagnostics["caches"]["sensor_snapshot"]["hits"] >= 1
+    assert diagnostics["storage"] == {
+        "pending_write": False,
+        "writes": 0,
+        "snapshot_pending_write": False,
+        "snapshot_writes": 0,
+    }
@@ -0,0 +1,129 @@
+"""Tests for the entity base classes: static naming and change-only publishing."""
+
+from unittest.mock import patch
+
+import pytest
+from homeassistant.helpers.entity import Entity
+
+from custom_components.solar_window_system.binary_sensor import ShadingRecommendationBinarySensor
+from custom_components.solar_window_system.const import (
+    CONF_ADVANCED,
+    CONF_DEADBAND_ABSOLUTE,
+    CONF_DEADBAND_RELATIVE,
+    ENERGY_TYPE_COMBINED,
+    ENERGY_TYPE_DIRECT,
+    LEVEL_WINDOW,
+)
+from custom_components.solar_window_system.coordinator import SolarCalculationCoordinator
+from custom_components.solar_window_system.entity import PublishPolicy
+from custom_components.solar_window_system.sensor import SolarEnergySensor
+
+
+@pytest.mark.parametrize(
+    ("previous", "value", "expected"),
+    [
+        (100.0, 100.0, False),
+        (100.0, 104.0, False),  # within 5 W
+        (100.0, 106.0, True),
+        (1000.0, 1040.0, False),  # within 5 %
+        (1000.0, 1060.0, True),
+        (3.0, 0.0, True),  # zero is always published
+        (0.0, 1.0, True),
+        (None, 1.0, True),
+    ],
+)
+def test_policy_deadband(previous, value, expected):
+    """Test a change must exceed both the absolute and the relative deadband."""
+    policy = PublishPolicy(precision=1, absolute=5, relative=5)
+    assert policy.exceeds(previous, value) is expected
+
+
+def test_policy_rounding():
+    """Test values are rounded to the configured precision."""
+    assert PublishPolicy(precision=1).round(123.456) == 123.5
+    assert PublishPolicy(precision=0).round(123.456) == 123
+    assert PublishPolicy(precision=None).round(123.456) == 123.456
+    assert PublishPolicy().round(None) is None
+
+
+@pytest.mark.asyncio
+async def test_sensor_skips_writes_within_deadband(hass):
+    """Test coordinator updates only write the state when the value visibly changed."""
+    coordinator = SolarCalculationCoordinator(
+        hass,
+        {CONF_ADVANCED: {CONF_DEADBAND_ABSOLUTE: 5, CONF_DEADBAND_RELATIVE: 0}},
+        {"window": {"type": "window", "name": "Window"}},
+        {},
+    )
+    sensor = SolarEnergySensor(coordinator, LEVEL_WINDOW, "window", ENERGY_TYPE_COMBINED)
+
+    with patch.object(Entity, "async_write_ha_state") as mock_write:
+        for combined in (100.0, 100.02, 103.0, 104.9, 106.0, 0.0):
+            coordinator.data = {"window": {ENERGY_TYPE_COMBINED: combined}}
+            sensor._handle_coordinator_update()
+
+    # 100.0 (first), 106.0 (> 5 W from 100.0) and 0.0
+    assert mock_write.call_count == 3
+    assert sensor.native_value == 0.0
+
+
+@pytest.mark.asyncio
+async def test_entities_share_device_info(hass):
+    """Test entities of one window share a DeviceInfo that is rebuilt on rename."""
+    coordinator = SolarCalculationCoordinator(
+        hass, {}, {"window": {"type": "window", "name": "Window"}}, {}
+    )
+    direct = SolarEnergySensor(coordinator, LEVEL_WINDOW, "window", ENERGY_TYPE_DIRECT)
+    combined = SolarEnergySensor(coordinator, LEVEL_WINDOW, "window", ENERGY_TYPE_COMBINED)
+
+    assert direct.device_info is combined.device_info
+    assert direct.device_info["name"] == "Fenster: Window"  # type: ignore[index]
+    assert direct.name == "Window Direkte Energie"
+
+    coordinator.windows["window"]["name"] = "Kitchen"
+    coordinator._rebuild_models()
+    coordinator.data = {"window": {ENERGY_TYPE_DIRECT: 100.0}}
+
+    with patch.object(Entity, "async_write_ha_state") as mock_write:
+        direct._handle_coordinator_update()
+        # The state is written again to publish the new name
+        direct._handle_coordinator_update()
+        direct._handle_coordinator_update()
+
+    assert mock_write.call_count == 1
+    assert direct.name == "Kitchen Direkte Energie"
+    assert direct.device_info["name"] == "Fenster: Kitchen"  # type: ignore[index]
+    assert combined.name == "Window Kombinierte Energie"  # refreshed on its next update
+
+
+@pytest.mark.asyncio
+async def test_naming_version_unchanged_without_rename(hass):
+    """Test adding windows or recomputing does not invalidate existing names."""
+    coordinator = SolarCalculationCoordinator(
+        hass, {}, {"window": {"type": "window", "name": "Window"}}, {}
+    )
+    device_info = coordinator.get_device_info(LEVEL_WINDOW, "window")
+
+    coordinator.windows["other"] = {"type": "window", "name": "Other"}
+    coordinator._rebuild_models()
+
+    assert coordinator.naming_version == 0
+    assert coordinator.get_device_info(LEVEL_WINDOW, "window") is device_info
+
+
+@pytest.mark.asyncio
+async def test_binary_sensor_icon_follows_written_state(hass):
+    """Test the shading icon is set when the state is written."""
+    coordinator = SolarCalculationCoordinator(
+        hass, {}, {"window": {"type": "window", "name": "Window"}}, {}
+    )
+    sensor = ShadingRecommendationBinarySensor(coordinator, LEVEL_WINDOW, "window")
+
+    with patch.object(Entity, "async_write_ha_state"):
+        coordinator.data = {"window": {"shading_recommended": True}}
+        sensor._handle_coordinator_update()
+        assert sensor.icon == "mdi:blinds-closed"
+
+        coordinator.data = {"window": {"shading_recommended": False}}
+        sensor._handle_coordinator_update()
+        assert sensor.icon == "mdi:blinds-open"
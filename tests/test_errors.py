@@ -0,0 +1,79 @@
+"""Tests for the runtime error collector."""
+
+from unittest.mock import patch
+
+from custom_components.solar_window_system.errors import (
+    RuntimeErrorCode,
+    RuntimeErrorCollector,
+    RuntimeIssue,
+)
+
+
+def test_duplicates_are_stored_once_and_counted():
+    """Test a shared failing sensor is stored once but every occurrence counted."""
+    collector = RuntimeErrorCollector()
+
+    for _ in range(100):
+        collector.add(RuntimeErrorCode.SENSOR_STATE, "sensor.indoor", "unavailable")
+    collector.add(RuntimeErrorCode.SENSOR_NOT_FOUND, "sensor.missing")
+
+    assert len(collector) == 2
+    assert collector.counts[RuntimeErrorCode.SENSOR_STATE] == 100
+    assert collector.counts[RuntimeErrorCode.SENSOR_NOT_FOUND] == 1
+
+
+def test_messages_are_rendered_lazily():
+    """Test messages are only rendered when read."""
+    collector = RuntimeErrorCollector()
+    collector.add(RuntimeErrorCode.SENSOR_INVALID_VALUE, "sensor.temp", "abc", "Wohnzimmer")
+
+    with patch.object(RuntimeIssue, "render", return_value="rendered") as mock_render:
+        messages = collector.messages()
+        assert len(messages) == 1
+        mock_render.assert_not_called()
+
+        assert list(messages) == ["rendered"]
+        mock_render.assert_called_once()
+
+
+def test_messages_render_german_text():
+    """Test the rendered messages match the previous free-text format."""
+    collector = RuntimeErrorCollector()
+    collector.add(RuntimeErrorCode.SENSOR_NOT_FOUND, "sensor.a")
+    collector.add(RuntimeErrorCode.SENSOR_STATE, "sensor.b", "unknown", "Küche")
+    collector.add(RuntimeErrorCode.SENSOR_INVALID_VALUE, "sensor.c", "on")
+    collector.add(RuntimeErrorCode.MESSAGE, detail="Freitext")
+
+    assert collector.messages() == [
+        "Sensor 'sensor.a' nicht gefunden",
+        "Sensor 'sensor.b': Status 'unknown' (Küche)",
+        "Sensor 'sensor.c': Ungültiger Wert 'on'",
+        "Freitext",
+    ]
+
+
+def test_clear_resets_errors_and_counters():
+    """Test clear drops errors and counters, earlier views stay intact."""
+    collector = RuntimeErrorCollector()
+    collector.add(RuntimeErrorCode.SENSOR_NOT_FOUND, "sensor.a")
+    messages = collector.messages()
+
+    collector.clear()
+
+    assert len(collector) == 0
+    assert not collector.counts
+    assert collector.messages() == []
+    assert messages == ["Sensor 'sensor.a' nicht gefunden"]
+
+
+def test_discard_entities_drops_their_errors_and_counters():
+    """Test discarding entities removes their errors and adjusts the counters."""
+    collector = RuntimeErrorCollector()
+    collector.add(RuntimeErrorCode.SENSOR_NOT_FOUND, "sensor.a")
+    collector.add(RuntimeErrorCode.SENSOR_NOT_FOUND, "sensor.a")
+    collector.add(RuntimeErrorCode.SENSOR_NOT_FOUND, "sensor.b")
+
+    collector.discard_entities({"sensor.a"})
+
+    assert collector.messages() == ["Sensor 'sensor.b' nicht gefunden"]
+    assert collector.counts == {RuntimeErrorCode.SENSOR_NOT_FOUND: 1}
@@ -0,0 +1,71 @@
+"""Tests for the weather forecast cache."""
+
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from custom_components.solar_window_system.forecast import ForecastCache
+
+WEATHER = "weather.home"
+
+
+@pytest.fixture
+def weather_hass(hass):
+    """Fixture for hass with a stable weather state and a forecast service."""
+    states = {WEATHER: SimpleNamespace(state="sunny", last_updated=1)}
+    hass.states.get = states.get
+    hass.services.async_call = AsyncMock(
+        return_value={WEATHER: {"forecast": [{"temperature": 31.0}]}}
+    )
+    hass.test_states = states
+    return hass
+
+
+@pytest.mark.asyncio
+async def test_forecast_fetched_once_within_ttl(weather_hass):
+    """Test repeated lookups within the TTL are served from the cache."""
+    cache = ForecastCache(weather_hass, timedelta(minutes=30))
+
+    for _ in range(5):
+        assert await cache.async_get(WEATHER) == [{"temperature": 31.0}]
+
+    assert weather_hass.services.async_call.await_count == 1
+    assert (cache.hits, cache.misses) == (4, 1)
+
+
+@pytest.mark.asyncio
+async def test_forecast_refetched_after_ttl(weather_hass):
+    """Test an expired entry triggers a new service call."""
+    cache = ForecastCache(weather_hass, timedelta(minutes=30))
+
+    with patch("custom_components.solar_window_system.forecast.monotonic", return_value=0):
+        await cache.async_get(WEATHER)
+    with patch("custom_components.solar_window_system.forecast.monotonic", return_value=1801):
+        await cache.async_get(WEATHER)
+
+    assert weather_hass.services.async_call.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_forecast_refetched_on_weather_update(weather_hass):
+    """Test a new weather entity state invalidates the cached forecast."""
+    cache = ForecastCache(weather_hass, timedelta(minutes=30))
+
+    await cache.async_get(WEATHER)
+    weather_hass.test_states[WEATHER] = SimpleNamespace(state="cloudy", last_updated=2)
+    await cache.async_get(WEATHER)
+
+    assert weather_hass.services.async_call.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_forecast_failure_is_cached(weather_hass):
+    """Test a failing service call is not repeated within the TTL."""
+    weather_hass.services.async_call.side_effect = RuntimeError("no forecast")
+    cache = ForecastCache(weather_hass, timedelta(minutes=30))
+
+    assert await cache.async_get(WEATHER) is None
+    assert await cache.async_get(WEATHER) is None
+    assert weather_hass.services.async_call.await_count == 1
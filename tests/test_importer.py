@@ -0,0 +1,180 @@
+"""Tests for the bulk window import."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.exceptions import ServiceValidationError
+
+from custom_components.solar_window_system.const import (
+    CONF_GEOMETRY,
+    CONF_GROUP_ID,
+    CONF_PROPERTIES,
+    DOMAIN,
+    SERVICE_IMPORT_WINDOWS,
+)
+from custom_components.solar_window_system.importer import (
+    IMPORT_FORMAT_CSV,
+    IMPORT_FORMAT_YAML,
+    WindowImportError,
+    build_windows,
+    parse_table,
+)
+from custom_components.solar_window_system.services import async_setup_services
+
+CSV_TABLE = """name;group;width;height;azimuth;g_value
+Küche;Erdgeschoss;120;140;180;0,6
+Bad;;80;100;90;
+"""
+
+
+def test_parse_csv_with_semicolons_and_decimal_comma():
+    """Test semicolon separated CSV with German decimals becomes window data."""
+    rows = parse_table(CSV_TABLE, IMPORT_FORMAT_CSV)
+    windows = build_windows(rows, {"Erdgeschoss": "group_1"}, set())
+
+    assert windows[0] == {
+        "name": "Küche",
+        CONF_GEOMETRY: {
+            "width": 120.0,
+            "height": 140.0,
+            "azimuth": 180.0,
+            "tilt": 90,
+            "visible_azimuth_start": 150,
+            "visible_azimuth_end": 210,
+        },
+        CONF_GROUP_ID: "group_1",
+        CONF_PROPERTIES: {"g_value": 0.6},
+    }
+    # Empty cells are missing values
+    assert CONF_GROUP_ID not in windows[1]
+    assert CONF_PROPERTIES not in windows[1]
+
+
+def test_parse_yaml_list():
+    """Test a YAML list of windows is parsed."""
+    rows = parse_table(
+        "- name: Wohnzimmer\n  width: 200\n  height: 220\n  tilt: 45\n", IMPORT_FORMAT_YAML
+    )
+    windows = build_windows(rows, {}, set())
+
+    assert windows[0]["name"] == "Wohnzimmer"
+    assert windows[0][CONF_GEOMETRY]["tilt"] == 45.0
+
+
+@pytest.mark.parametrize("table", ["name: Einzelnes Fenster", "- [1, 2]", "- name: [unclosed"])
+def test_parse_yaml_rejects_other_content(table):
+    """Test YAML that is not a list of windows is rejected."""
+    with pytest.raises(WindowImportError):
+        parse_table(table, IMPORT_FORMAT_YAML)
+
+
+def test_build_windows_reports_all_errors():
+    """Test every invalid row is reported and nothing is returned."""
+    rows = [
+        {"name": "Küche", "width": "120", "height": "140"},
+        {"name": "Bad", "width": "5", "height": "100"},  # width below 10 cm
+        {"name": "Flur", "width": "80", "height": "100", "group": "Keller"},
+        {"name": "Küche", "width": "80", "height": "100"},  # duplicate in table
+        {"name": "Büro", "width": "80", "height": "100"},  # already exists
+        {"name": "Gast", "width": "80", "height": "100", "color": "rot"},
+    ]
+
+    with pytest.raises(WindowImportError) as err:
+        build_windows(rows, {}, {"Büro"})
+
+    assert [error.split(":")[0] for error in err.value.errors] == [
+        "Zeile 2",
+        "Zeile 3",
+        "Zeile 4",
+        "Zeile 5",
+        "Zeile 6",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_import_service_creates_all_subentries():
+    """Test the service validates the table and adds one subentry per window."""
+    entry = SimpleNamespace(
+        subentries={
+            "group_1": SimpleNamespace(
+                subentry_id="group_1", subentry_type="group", title="Erdgeschoss"
+            ),
+        }
+    )
+    hass = MagicMock()
+    hass.data = {DOMAIN: {"entry": {"coordinator": SimpleNamespace(config_entry=entry)}}}
+    async_setup_services(hass)
+    handler = next(
+        call.args[2]
+        for call in hass.services.async_register.call_args_list
+        if call.args[1] == SERVICE_IMPORT_WINDOWS
+    )
+
+    response = await handler(
+        SimpleNamespace(data={"table": CSV_TABLE, "format": IMPORT_FORMAT_CSV})
+    )
+
+    assert response == {"created": ["Küche", "Bad"]}
+    added = [call.args[1] for call in hass.config_entries.async_add_subentry.call_args_list]
+    assert [subentry.title for subentry in added] == ["Küche", "Bad"]
+    assert added[0].data[CONF_GROUP_ID] == "group_1"
+
+    hass.config_entries.async_add_subentry.reset_mock()
+    with pytest.raises(ServiceValidationError):
+        await handler(SimpleNamespace(data={"table": "name\n", "format": IMPORT_FORMAT_CSV}))
+    hass.config_entries.async_add_subentry.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_import_service_rejects_unique_id_collision():
+    """Test a name matching the unique ID of an existing window creates nothing."""
+    entry = SimpleNamespace(
+        subentries={
+            "window_1": SimpleNamespace(
+                subentry_id="window_1", subentry_type="window", title="Alt", unique_id="Bad"
+            ),
+        }
+    )
+    hass = MagicMock()
+    hass.data = {DOMAIN: {"entry": {"coordinator": SimpleNamespace(config_entry=entry)}}}
+    async_setup_services(hass)
+    handler = next(
+        call.args[2]
+        for call in hass.services.async_register.call_args_list
+        if call.args[1] == SERVICE_IMPORT_WINDOWS
+    )
+
+    with pytest.raises(ServiceValidationError, match="Zeile 2"):
+        await handler(SimpleNamespace(data={"table": CSV_TABLE, "format": IMPORT_FORMAT_CSV}))
+    hass.config_entries.async_add_subentry.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_import_service_rejects_ambiguous_group_name():
+    """Test a group name shared by two groups must be given as group ID."""
+    entry = SimpleNamespace(
+        subentries={
+            group_id: SimpleNamespace(
+                subentry_id=group_id, subentry_type="group", title="Erdgeschoss"
+            )
+            for group_id in ("group_1", "group_2")
+        }
+    )
+    hass = MagicMock()
+    hass.data = {DOMAIN: {"entry": {"coordinator": SimpleNamespace(config_entry=entry)}}}
+    async_setup_services(hass)
+    handler = next(
+        call.args[2]
+        for call in hass.services.async_register.call_args_list
+        if call.args[1] == SERVICE_IMPORT_WINDOWS
+    )
+
+    with pytest.raises(ServiceValidationError, match="Gruppe 'Erdgeschoss' ist mehrdeutig"):
+        await handler(SimpleNamespace(data={"table": CSV_TABLE, "format": IMPORT_FORMAT_CSV}))
+    hass.config_entries.async_add_subentry.assert_not_called()
+
+    table = CSV_TABLE.replace("Erdgeschoss", "group_2")
+    await handler(SimpleNamespace(data={"table": table, "format": IMPORT_FORMAT_CSV}))
+    added = hass.config_entries.async_add_subentry.call_args_list[0].args[1]
+    assert added.data[CONF_GROUP_ID] == "group_2"
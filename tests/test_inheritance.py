@@ -5,6 +5,7 @@ hierarchy correctly:
 - _get_azimuth(): Window geometry → Group → None (with debug logging)
 - _get_indoor_temp(): Window → Group → Global → None (with debug logging)
 - _get_window_property(): Window → Group → Global (merging)
+- get_effective_value(): materialized Window → Group → Defaults table
 """
 
 import logging
@@ -19,9 +20,14 @@ from custom_components.solar_window_system.const import (
     CONF_GEOMETRY,
     CONF_GROUP_ID,
     CONF_PROPERTIES,
+    CONF_SCENARIO_INDOOR,
     CONF_SENSORS,
     CONF_TEMP_INDOOR,
+    CONF_THRESHOLD_INDOOR,
     DEFAULT_G_VALUE,
+    DEFAULT_INSIDE_TEMP,
+    LEVEL_GROUP,
+    LEVEL_WINDOW,
 )
 from custom_components.solar_window_system.coordinator import SolarCalculationCoordinator
 
@@ -384,3 +390,79 @@ class TestCoordinatorEdgeCases:
         # g_value should fall back to global
         g_result = coordinator._get_window_property("window_empty_group", CONF_G_VALUE)
         assert g_result == 0.6, "Should fall back to global for properties"
+
+
+# ============================================================================
+# Test Class: Materialized Threshold/Scenario Table (get_effective_value)
+# ============================================================================
+
+
+class TestEffectiveValueTable:
+    """Test that the materialized table follows override changes."""
+
+    def test_table_materialized_for_all_levels(self, coordinator):
+        """Every window, group and global has a resolved row."""
+        assert coordinator.get_effective_values(LEVEL_WINDOW, "window_standalone") == {
+            **coordinator.get_effective_values("global", "global"),
+        }
+        assert (
+            coordinator.get_effective_value(LEVEL_GROUP, "south_group", CONF_THRESHOLD_INDOOR)
+            == DEFAULT_INSIDE_TEMP
+        )
+
+    @pytest.mark.asyncio
+    async def test_group_override_propagates_to_windows(self, coordinator):
+        """A group override refreshes the rows of the group's windows."""
+        await coordinator.set_override(LEVEL_GROUP, "south_group", CONF_THRESHOLD_INDOOR, 27.0)
+
+        assert (
+            coordinator.get_effective_value(
+                LEVEL_WINDOW, "window_inherits_group", CONF_THRESHOLD_INDOOR
+            )
+            == 27.0
+        )
+        # Windows of other groups are untouched
+        assert (
+            coordinator.get_effective_value(
+                LEVEL_WINDOW, "window_inherits_temp_global", CONF_THRESHOLD_INDOOR
+            )
+            == DEFAULT_INSIDE_TEMP
+        )
+
+    @pytest.mark.asyncio
+    async def test_window_override_wins_and_clear_restores_group(self, coordinator):
+        """Clearing a window override falls back to the group value."""
+        await coordinator.set_override(LEVEL_GROUP, "south_group", CONF_SCENARIO_INDOOR, False)
+        await coordinator.set_override(LEVEL_WINDOW, "window_with_all", CONF_SCENARIO_INDOOR, True)
+
+        assert coordinator.get_effective_value(
+            LEVEL_WINDOW, "window_with_all", CONF_SCENARIO_INDOOR
+        )
+
+        await coordinator.clear_overrides(LEVEL_WINDOW, "window_with_all")
+
+        assert (
+            coordinator.get_effective_value(LEVEL_WINDOW, "window_with_all", CONF_SCENARIO_INDOOR)
+            is False
+        )
+
+    def test_rebuild_picks_up_new_group_membership(self, coordinator):
+        """A subentry change moving a window into a group rebuilds its row."""
+        coordinator._overrides[LEVEL_GROUP] = {"west_group": {CONF_THRESHOLD_INDOOR: 30.0}}
+        coordinator.windows["window_standalone"][CONF_GROUP_ID] = "west_group"
+
+        coordinator._rebuild_models()
+
+        assert (
+            coordinator.get_effective_value(
+                LEVEL_WINDOW, "window_standalone", CONF_THRESHOLD_INDOOR
+            )
+            == 30.0
+        )
+
+    def test_non_table_properties_resolved_on_demand(self, coordinator):
+        """Properties outside the table still walk the inheritance chain."""
+        assert (
+            coordinator.get_effective_value(LEVEL_WINDOW, "window_inherits_group", CONF_G_VALUE)
+            == 0.7
+        )
@@ -0,0 +1,49 @@
+"""Tests for the config entry setup."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.solar_window_system import async_remove_entry, async_setup_entry
+from custom_components.solar_window_system.const import DOMAIN, RESULTS_STORAGE_KEY
+from custom_components.solar_window_system.coordinator import SolarCalculationCoordinator
+
+
+@pytest.mark.asyncio
+async def test_setup_defers_first_refresh_until_started(hass):
+    """Test platforms are set up at once and the calculation waits for the start."""
+    entry = MagicMock(entry_id="entry", data={}, subentries={})
+
+    with (
+        patch.object(hass.config_entries, "async_forward_entry_setups", AsyncMock()) as forward,
+        patch("custom_components.solar_window_system.async_at_started") as mock_at_started,
+        patch.object(SolarCalculationCoordinator, "async_refresh", AsyncMock()) as mock_refresh,
+        patch.object(SolarCalculationCoordinator, "validate_configuration") as mock_validate,
+    ):
+        assert await async_setup_entry(hass, entry)
+
+        forward.assert_awaited_once()
+        mock_refresh.assert_not_awaited()
+        mock_validate.assert_not_called()
+
+        # Home Assistant has started
+        at_start = mock_at_started.call_args.args[1]
+        at_start(hass)
+        await entry.async_create_background_task.call_args.args[1]
+
+    mock_validate.assert_called_once()
+    mock_refresh.assert_awaited_once()
+    assert hass.data[DOMAIN]["entry"]["coordinator"].data is None
+
+
+@pytest.mark.asyncio
+async def test_remove_entry_deletes_stored_results(hass):
+    """Test the results snapshot of a removed entry is deleted from storage."""
+    entry = MagicMock(entry_id="entry")
+
+    with patch("custom_components.solar_window_system.store.Store") as mock_store:
+        mock_store.return_value.async_remove = AsyncMock()
+        await async_remove_entry(hass, entry)
+
+    assert mock_store.call_args.args[2] == f"{RESULTS_STORAGE_KEY}.entry"
+    mock_store.return_value.async_remove.assert_awaited_once()
@@ -0,0 +1,118 @@
+"""Tests for the update cycle timing instrumentation."""
+
+import asyncio
+from unittest.mock import patch
+
+from custom_components.solar_window_system.performance import (
+    COUNTER_SERVICE_CALLS,
+    PHASE_CYCLE,
+    PHASE_ENERGY,
+    PHASE_FORECAST,
+    PHASE_LISTENERS,
+    PHASE_SHADING,
+    PerformanceMonitor,
+)
+
+CLOCK = "custom_components.solar_window_system.performance.perf_counter"
+
+
+def test_nested_phases_are_exclusive():
+    """Test time of a nested phase is not counted for the outer phase."""
+    monitor = PerformanceMonitor()
+    # cycle start, shading start, forecast start, forecast end, shading end, cycle end
+    with patch(CLOCK, side_effect=[0.0, 1.0, 2.0, 5.0, 6.0, 7.0]):
+        monitor.start_cycle()
+        with monitor.phase(PHASE_SHADING), monitor.phase(PHASE_FORECAST):
+            pass
+        monitor.finish_cycle()
+
+    stats = monitor.statistics()
+    assert stats[PHASE_FORECAST]["last"] == 3000
+    assert stats[PHASE_SHADING]["last"] == 2000
+    assert stats[PHASE_CYCLE]["last"] == 7000
+    assert monitor.cycles == 1
+
+
+def test_ring_buffer_statistics():
+    """Test only the last samples are kept and p95/mean/max are computed."""
+    monitor = PerformanceMonitor(samples=20)
+    for duration in range(1, 31):
+        monitor.record(PHASE_LISTENERS, duration / 1000)
+
+    stats = monitor.statistics()[PHASE_LISTENERS]
+    # Samples 11..30 ms remain
+    assert stats["samples"] == 20
+    assert stats["last"] == 30
+    assert stats["max"] == 30
+    assert stats["mean"] == 20.5
+    assert stats["p95"] == 29
+
+
+def test_counters_are_per_cycle():
+    """Test counters reset with every cycle and phases outside a cycle are recorded."""
+    monitor = PerformanceMonitor()
+    monitor.start_cycle()
+    monitor.count(COUNTER_SERVICE_CALLS, 2)
+    monitor.finish_cycle()
+    assert monitor.last_counts == {COUNTER_SERVICE_CALLS: 2}
+
+    monitor.start_cycle()
+    monitor.finish_cycle()
+    assert monitor.last_counts == {}
+
+    with monitor.phase(PHASE_LISTENERS):
+        pass
+    assert monitor.statistics()[PHASE_LISTENERS]["samples"] == 1
+
+
+async def test_interleaved_tasks_keep_their_own_phases():
+    """Test a cycle started by one task does not break the phases of another."""
+    monitor = PerformanceMonitor()
+    in_phase = asyncio.Event()
+    cycle_started = asyncio.Event()
+
+    async def override_recalculation():
+        with monitor.phase(PHASE_SHADING):
+            in_phase.set()
+            await cycle_started.wait()
+
+    async def update_cycle():
+        await in_phase.wait()
+        monitor.start_cycle()
+        cycle_started.set()
+        with monitor.phase(PHASE_ENERGY):
+            await asyncio.sleep(0)
+        monitor.finish_cycle()
+
+    await asyncio.gather(override_recalculation(), update_cycle())
+
+    stats = monitor.statistics()
+    assert stats[PHASE_ENERGY]["samples"] == 1
+    assert monitor.cycles == 1
+
+
+async def test_override_during_cycle_is_not_added_to_the_cycle():
+    """Test phases and counters of an interleaved override stay out of the cycle."""
+    monitor = PerformanceMonitor()
+    cycle_started = asyncio.Event()
+    override_done = asyncio.Event()
+
+    async def update_cycle():
+        monitor.start_cycle()
+        cycle_started.set()
+        await override_done.wait()
+        monitor.finish_cycle()
+
+    async def override_recalculation():
+        await cycle_started.wait()
+        with monitor.phase(PHASE_SHADING):
+            monitor.count(COUNTER_SERVICE_CALLS)
+        override_done.set()
+
+    await asyncio.gather(update_cycle(), override_recalculation())
+
+    stats = monitor.statistics()
+    # Recorded on its own, not as part of the cycle
+    assert stats[PHASE_SHADING]["samples"] == 1
+    assert monitor.last_counts == {}
+    assert monitor.cycles == 1
@@ -0,0 +1,107 @@
+"""Tests for the day-ahead heat gain profile."""
+
+from datetime import UTC, date, datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from custom_components.solar_window_system.calculation import (
+    HAS_NUMPY,
+    WindowCalculationEngine,
+    WindowParameters,
+    compile_window,
+)
+from custom_components.solar_window_system.const import (
+    CONF_GEOMETRY,
+    CONF_HEIGHT,
+    CONF_SENSORS,
+    CONF_USE_WEATHER_CONDITION,
+    CONF_WEATHER_CONDITION,
+    CONF_WIDTH,
+)
+from custom_components.solar_window_system.coordinator import SolarCalculationCoordinator
+from custom_components.solar_window_system.profile import (
+    clear_sky_irradiance,
+    compute_day_profile,
+)
+
+pytestmark = pytest.mark.skipif(not HAS_NUMPY, reason="NumPy not installed")
+
+BERLIN = (52.52, 13.405)
+MIDSUMMER = datetime(2024, 6, 21, tzinfo=UTC)
+
+
+def test_clear_sky_irradiance():
+    """Test the clear-sky model is zero at night and dimmed by clouds."""
+    direct, diffuse = clear_sky_irradiance([-10.0, 0.0, 60.0])
+    assert direct[0] == diffuse[0] == direct[1] == diffuse[1] == 0
+    # Haurwitz: about 900 W/m² global irradiance at 60° elevation
+    assert direct[2] + diffuse[2] == pytest.approx(900, abs=10)
+
+    cloudy_direct, cloudy_diffuse = clear_sky_irradiance([60.0], cloud_coverage=100)
+    assert cloudy_direct[0] + cloudy_diffuse[0] == pytest.approx(0.25 * 900, abs=5)
+    assert cloudy_diffuse[0] > cloudy_direct[0]
+
+
+def test_day_profile_follows_sun_path():
+    """Test a south window peaks around solar noon and is dark at night."""
+    engine = WindowCalculationEngine(
+        {
+            "south": compile_window(
+                WindowParameters(
+                    width=150,
+                    height=120,
+                    visible_azimuth_start=90,
+                    visible_azimuth_end=270,
+                )
+            )
+        }
+    )
+
+    profile = compute_day_profile(engine, *BERLIN, MIDSUMMER, timedelta(minutes=5))
+
+    series = profile.windows["south"]
+    assert len(series["combined"]) == 288
+    assert series["combined"][0] == 0
+    # Peak within an hour of solar noon (11:13 UTC)
+    peak = series["direct"].index(max(series["direct"]))
+    assert abs(peak * 5 - (11 * 60 + 13)) <= 60
+    assert profile.as_dict()["interval"] == 300
+
+
+@pytest.mark.asyncio
+async def test_coordinator_profile_cached_until_forecast_changes(hass):
+    """Test the profile is computed once per day and again on forecast change."""
+    hass.config.latitude, hass.config.longitude = BERLIN
+    hass.async_add_executor_job = AsyncMock(side_effect=lambda func, *args: func(*args))
+    coordinator = SolarCalculationCoordinator(
+        hass,
+        {
+            CONF_SENSORS: {CONF_WEATHER_CONDITION: "weather.home"},
+            CONF_USE_WEATHER_CONDITION: True,
+        },
+        {
+            "window": {
+                "type": "window",
+                "name": "Window",
+                CONF_GEOMETRY: {CONF_WIDTH: 100, CONF_HEIGHT: 100, "azimuth": 180},
+            }
+        },
+        {},
+    )
+    forecast = [{"datetime": "2024-06-21T12:00:00+00:00", "cloud_coverage": 20}]
+    coordinator._forecast_cache.async_get = AsyncMock(return_value=forecast)
+
+    with patch(
+        "custom_components.solar_window_system.coordinator.dt_util.now", return_value=MIDSUMMER
+    ):
+        first = await coordinator.async_get_day_profile()
+        assert await coordinator.async_get_day_profile(date(2024, 6, 21)) is first
+        assert first.cloud_coverage == 20
+        assert hass.async_add_executor_job.await_count == 1
+
+        forecast[0]["cloud_coverage"] = 90
+        second = await coordinator.async_get_day_profile()
+
+    assert hass.async_add_executor_job.await_count == 2
+    assert max(second.windows["window"]["combined"]) < max(first.windows["window"]["combined"])
@@ -0,0 +1,273 @@
+"""Tests for differential entity add/remove on subentry changes."""
+
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.solar_window_system import (
+    _async_reconcile_subentries,
+    _async_update_listener,
+    async_on_subentry_removed,
+)
+from custom_components.solar_window_system.config_flow import WindowSubentryFlowHandler
+from custom_components.solar_window_system.const import (
+    CONF_GEOMETRY,
+    CONF_HEIGHT,
+    CONF_WIDTH,
+    DOMAIN,
+    LEVEL_GROUP,
+    LEVEL_WINDOW,
+)
+from custom_components.solar_window_system.coordinator import SolarCalculationCoordinator
+from custom_components.solar_window_system.reconcile import (
+    EntityReconciler,
+    async_remove_subentry_entities,
+)
+
+RECONCILE = "custom_components.solar_window_system.reconcile"
+
+
+def _subentries(**names):
+    """Build window subentries data from window ID -> name."""
+    return {window_id: {"type": "window", "name": name} for window_id, name in names.items()}
+
+
+@contextmanager
+def _patch_registries(entity_registry, device_registry, registry_entries):
+    """Patch the entity and device registries used by the cleanup."""
+    with (
+        patch(f"{RECONCILE}.er.async_get", return_value=entity_registry),
+        patch(f"{RECONCILE}.er.async_entries_for_config_entry", return_value=registry_entries),
+        patch(f"{RECONCILE}.dr.async_get", return_value=device_registry),
+        patch("custom_components.solar_window_system.dr.async_get", return_value=device_registry),
+    ):
+        yield
+
+
+def _factory(level, entity_id):
+    """Create one fake entity per window or group."""
+    return [SimpleNamespace(key=(level, entity_id))]
+
+
+@pytest.fixture
+def coordinator(hass):
+    """Coordinator with two windows and a group."""
+    return SolarCalculationCoordinator(
+        hass,
+        {},
+        {
+            **_subentries(w1="Window 1", w2="Window 2"),
+            "g1": {"type": "group", "name": "Group"},
+        },
+        {},
+    )
+
+
+def test_add_platform_creates_entities_of_all_subentries(coordinator):
+    """Test a platform gets the entities of all windows and groups, windows first."""
+    reconciler = EntityReconciler(coordinator)
+    added: list = []
+
+    reconciler.async_add_platform(added.extend, _factory)
+
+    assert [entity.key for entity in added] == [
+        (LEVEL_WINDOW, "w1"),
+        (LEVEL_WINDOW, "w2"),
+        (LEVEL_GROUP, "g1"),
+    ]
+
+
+def test_reconcile_adds_only_new_subentries(coordinator):
+    """Test only entities of new windows are created on every platform."""
+    reconciler = EntityReconciler(coordinator)
+    sensors: list = []
+    switches: list = []
+    reconciler.async_add_platform(sensors.extend, _factory)
+    reconciler.async_add_platform(switches.extend, _factory)
+    sensors.clear()
+    switches.clear()
+
+    coordinator.update_subentries(_subentries(w1="Window 1", w3="Window 3"))
+    added, removed = reconciler.async_reconcile()
+
+    assert added == {(LEVEL_WINDOW, "w3")}
+    assert removed == {(LEVEL_WINDOW, "w2"), (LEVEL_GROUP, "g1")}
+    assert [entity.key for entity in sensors] == [(LEVEL_WINDOW, "w3")]
+    assert [entity.key for entity in switches] == [(LEVEL_WINDOW, "w3")]
+
+    # Nothing changed since the last reconciliation
+    sensors.clear()
+    assert reconciler.async_reconcile() == (set(), set())
+    assert sensors == []
+
+
+@pytest.mark.asyncio
+async def test_reconcile_subentries_without_reload(hass, coordinator):
+    """Test reconciling adds, removes and renames entities without reloading platforms."""
+    reconciler = EntityReconciler(coordinator)
+    added: list = []
+    reconciler.async_add_platform(added.extend, _factory)
+    added.clear()
+    hass.data[DOMAIN] = {"entry": {"coordinator": coordinator, "reconciler": reconciler}}
+
+    entry = SimpleNamespace(
+        entry_id="entry",
+        subentries={
+            "w1": SimpleNamespace(data={}, subentry_type="window", title="Kitchen"),
+            "w3": SimpleNamespace(data={}, subentry_type="window", title="Window 3"),
+        },
+    )
+    registry_entries = [
+        SimpleNamespace(entity_id=f"sensor.{key}", unique_id=f"{DOMAIN}_{key}", device_id="d")
+        for key in ("window_w1_direct", "window_w2_direct", "window_w22_direct", "group_g1_direct")
+    ]
+    entity_registry = MagicMock()
+    device_registry = MagicMock()
+    hass.config_entries = MagicMock()
+
+    with (
+        _patch_registries(entity_registry, device_registry, registry_entries),
+        patch.object(coordinator, "async_request_refresh", AsyncMock()) as mock_refresh,
+    ):
+        await _async_reconcile_subentries(hass, entry)
+
+    assert [entity.key for entity in added] == [(LEVEL_WINDOW, "w3")]
+    removed = {call.args[0] for call in entity_registry.async_remove.call_args_list}
+    assert removed == {"sensor.window_w2_direct", "sensor.group_g1_direct"}
+    device_registry.async_update_device.assert_called_once()
+    assert device_registry.async_update_device.call_args.kwargs["name"] == "Fenster: Kitchen"
+    hass.config_entries.async_unload_platforms.assert_not_called()
+    mock_refresh.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_window_reconfigure_keeps_entities(hass, coordinator):
+    """Test reconfiguring a window renames it in place instead of reloading the entry."""
+    reconciler = EntityReconciler(coordinator)
+    added: list = []
+    reconciler.async_add_platform(added.extend, _factory)
+    added.clear()
+    hass.data[DOMAIN] = {"entry": {"coordinator": coordinator, "reconciler": reconciler}}
+    entry = SimpleNamespace(
+        entry_id="entry",
+        subentries={
+            "w1": SimpleNamespace(data={}, subentry_type="window", title="Window 1"),
+            "w2": SimpleNamespace(data={}, subentry_type="window", title="Window 2"),
+            "g1": SimpleNamespace(data={}, subentry_type="group", title="Group"),
+        },
+    )
+
+    def update_and_abort(entry, subentry, *, title, data):
+        """Apply the update like Home Assistant does."""
+        subentry.title = title
+        subentry.data = data
+        return {"type": "abort", "reason": "reconfigure_successful"}
+
+    flow = WindowSubentryFlowHandler()
+    flow.hass = hass
+    with (
+        patch.object(flow, "_get_entry", return_value=entry),
+        patch.object(flow, "_get_reconfigure_subentry", return_value=entry.subentries["w1"]),
+        patch.object(flow, "async_update_and_abort", side_effect=update_and_abort),
+        patch.object(flow, "async_update_reload_and_abort") as mock_reload,
+    ):
+        await flow.async_step_reconfigure(
+            {"name": "Kitchen", CONF_GEOMETRY: {CONF_WIDTH: 100, CONF_HEIGHT: 120}}
+        )
+    mock_reload.assert_not_called()
+
+    entity_registry = MagicMock()
+    device_registry = MagicMock()
+    hass.config_entries = MagicMock()
+    with (
+        _patch_registries(entity_registry, device_registry, []),
+        patch.object(coordinator, "async_request_refresh", AsyncMock()),
+    ):
+        await _async_reconcile_subentries(hass, entry)
+
+    # No entity is recreated or removed, only the device is renamed
+    assert added == []
+    entity_registry.async_remove.assert_not_called()
+    assert device_registry.async_update_device.call_args.kwargs["name"] == "Fenster: Kitchen"
+    hass.config_entries.async_reload.assert_not_called()
+    hass.config_entries.async_unload_platforms.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_subentry_removal_updates_known_subentries(hass, coordinator):
+    """Test a removed subentry is forgotten, so the next reconcile does not remove it again."""
+    reconciler = EntityReconciler(coordinator)
+    hass.data[DOMAIN] = {"entry": {"coordinator": coordinator, "reconciler": reconciler}}
+    # The entry may still list the subentry while it is being removed
+    entry = SimpleNamespace(
+        entry_id="entry",
+        subentries={
+            window_id: SimpleNamespace(data={}, subentry_type="window", title=window_id)
+            for window_id in ("w1", "w2")
+        },
+    )
+    entity_registry = MagicMock()
+
+    with (
+        _patch_registries(entity_registry, MagicMock(), []),
+        patch.object(coordinator, "async_request_refresh", AsyncMock()),
+    ):
+        await async_on_subentry_removed(hass, entry, "w2", "window")
+
+    assert "w2" not in coordinator.windows
+    assert reconciler.known == {(LEVEL_WINDOW, "w1")}
+
+    del entry.subentries["w2"]
+    assert reconciler.async_reconcile() == (set(), set())
+
+
+@pytest.mark.asyncio
+async def test_update_listener_coalesces_changes(hass, coordinator):
+    """Test config entry updates only trigger the debounced reconciliation."""
+    debouncer = MagicMock(async_call=AsyncMock())
+    hass.data[DOMAIN] = {"entry": {"coordinator": coordinator, "reconcile_debouncer": debouncer}}
+    entry = SimpleNamespace(entry_id="entry", subentries={})
+
+    with patch.object(coordinator, "update_subentries") as mock_update:
+        for _ in range(3):
+            await _async_update_listener(hass, entry)
+
+    assert debouncer.async_call.await_count == 3
+    mock_update.assert_not_called()
+
+
+def test_cleanup_matches_whole_subentry_ids(hass):
+    """Test all removed subentries are cleaned up in one pass without prefix collisions."""
+    unique_ids = {
+        "sensor.a": "window_w_1_direct",
+        "sensor.b": "window_w_1_shading_recommended",
+        "sensor.c": "window_w_10_direct",  # kept, shares the "window_w_1" prefix
+        "sensor.d": "window_w_1_x_direct",  # kept window "w_1_x"
+        "sensor.e": "group_g_direct",
+        "sensor.f": "global_global_direct",
+    }
+    registry_entries = [
+        SimpleNamespace(entity_id=entity_id, unique_id=f"{DOMAIN}_{unique_id}", device_id="d")
+        for entity_id, unique_id in unique_ids.items()
+    ]
+    entity_registry = MagicMock()
+    device_registry = MagicMock()
+
+    with _patch_registries(entity_registry, device_registry, registry_entries):
+        removed = async_remove_subentry_entities(
+            hass,
+            "entry",
+            [(LEVEL_WINDOW, "w_1"), (LEVEL_GROUP, "g")],
+            [(LEVEL_WINDOW, "w_10"), (LEVEL_WINDOW, "w_1_x")],
+        )
+
+    assert removed == 3
+    assert {call.args[0] for call in entity_registry.async_remove.call_args_list} == {
+        "sensor.a",
+        "sensor.b",
+        "sensor.e",
+    }
+    assert device_registry.async_get_device.call_count == 2
+    assert device_registry.async_remove_device.call_count == 2
@@ -0,0 +1,95 @@
+"""Tests for the NOAA solar position calculation."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from custom_components.solar_window_system.calculation import HAS_NUMPY
+from custom_components.solar_window_system.solar_position import (
+    next_sunrise,
+    solar_position,
+    solar_position_array,
+)
+
+BERLIN = (52.52, 13.405)
+
+
+def test_solar_noon_summer_solstice():
+    """Test the sun stands due south at its maximum height at solar noon."""
+    elevation, azimuth = solar_position(datetime(2024, 6, 21, 11, 13, tzinfo=UTC), *BERLIN)
+
+    # 90 - 52.52 + 23.44 = 60.92
+    assert elevation == pytest.approx(60.9, abs=0.1)
+    assert azimuth == pytest.approx(180, abs=3)
+
+
+def test_winter_solstice_is_low():
+    """Test the noon sun is low in winter."""
+    elevation, _ = solar_position(datetime(2024, 12, 21, 11, 6, tzinfo=UTC), *BERLIN)
+
+    # 90 - 52.52 - 23.44 = 14.04 (plus refraction)
+    assert elevation == pytest.approx(14.1, abs=0.1)
+
+
+@pytest.mark.parametrize(
+    ("hour", "east"),
+    [(6, True), (16, False)],
+)
+def test_morning_east_afternoon_west(hour, east):
+    """Test the sun is in the east in the morning and in the west later."""
+    elevation, azimuth = solar_position(datetime(2024, 6, 21, hour, tzinfo=UTC), *BERLIN)
+
+    assert elevation > 0
+    assert (azimuth < 180) is east
+
+
+def test_night_is_below_horizon():
+    """Test the sun is below the horizon at midnight."""
+    elevation, _ = solar_position(datetime(2024, 3, 20, 23, tzinfo=UTC), *BERLIN)
+
+    assert elevation < 0
+
+
+@pytest.mark.parametrize(
+    ("start", "expected"),
+    [
+        # Berlin sunrise around 04:45 CEST on the summer solstice
+        (datetime(2024, 6, 20, 23, tzinfo=UTC), datetime(2024, 6, 21, 2, 45, tzinfo=UTC)),
+        # Already up: sunrise is now
+        (datetime(2024, 6, 21, 11, tzinfo=UTC), datetime(2024, 6, 21, 11, tzinfo=UTC)),
+    ],
+)
+def test_next_sunrise(start, expected):
+    """Test the next sunrise is found to within a minute."""
+    sunrise = next_sunrise(start, *BERLIN)
+
+    assert sunrise is not None
+    assert abs(sunrise - expected) < timedelta(minutes=1)
+    assert solar_position(sunrise, *BERLIN)[0] > 0
+
+
+def test_next_sunrise_polar_night():
+    """Test no sunrise is found during the polar night."""
+    assert next_sunrise(datetime(2024, 12, 21, tzinfo=UTC), 78.22, 15.65) is None
+
+
+def test_southern_hemisphere_noon_faces_north():
+    """Test the noon sun stands in the north south of the tropics."""
+    # Sydney, solar noon around 01:55 UTC
+    _, azimuth = solar_position(datetime(2024, 6, 21, 1, 58, tzinfo=UTC), -33.87, 151.21)
+
+    assert azimuth == pytest.approx(0, abs=3) or azimuth == pytest.approx(360, abs=3)
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason="NumPy not installed")
+def test_array_matches_scalar():
+    """Test the vectorized time series matches the scalar calculation."""
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    times = [start + timedelta(hours=7 * i, minutes=13) for i in range(1300)]
+
+    elevations, azimuths = solar_position_array([t.timestamp() for t in times], *BERLIN)
+
+    for when, elevation, azimuth in zip(times, elevations, azimuths, strict=True):
+        expected_elevation, expected_azimuth = solar_position(when, *BERLIN)
+        assert elevation == pytest.approx(expected_elevation, abs=1e-9)
+        assert azimuth == pytest.approx(expected_azimuth, abs=1e-9)
@@ -1,8 +1,10 @@
-"""Tests for the ConfigStore class."""
+"""Tests for the ConfigStore and ResultStore classes."""
 
+from datetime import timedelta
 from unittest.mock import patch
 
 import pytest
+from homeassistant.util import dt as dt_util
 
 from custom_components.solar_window_system.const import (
     CONF_GLOBAL,
@@ -12,6 +14,7 @@ from custom_components.solar_window_system.const import (
     CONF_WINDOWS,
     STORAGE_VERSION,
 )
+from custom_components.solar_window_system.store import ResultStore
 
 
 async def test_store_initialization(store):
@@ -57,3 +60,81 @@ async def test_save_and_load_config(hass, store):
             loaded_config[CONF_GLOBAL][CONF_SENSORS][CONF_IRRADIANCE_SENSOR]
             == "sensor.test_irradiance"
         )
+
+
+@pytest.mark.asyncio
+async def test_schedule_save_coalesces_changes(hass, store):
+    """Test repeated changes schedule one delayed save with the latest data."""
+    data = {"value": 1}
+
+    with patch.object(store._store, "async_delay_save") as mock_delay_save:
+        for value in range(5):
+            data["value"] = value
+            store.async_schedule_save(lambda: dict(data))
+
+    assert store.pending_write is True
+    data_func, delay = mock_delay_save.call_args.args
+    assert delay == store.save_delay
+
+    # The delayed save writes the latest state and clears the dirty flag
+    assert data_func() == {"value": 4}
+    assert store.pending_write is False
+    assert store.writes == 1
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_pending_changes(hass, store):
+    """Test flush writes pending changes immediately and only once."""
+    with (
+        patch.object(store._store, "async_delay_save"),
+        patch.object(store._store, "async_save") as mock_save,
+    ):
+        store.async_schedule_save(lambda: {"overrides": {"window": {}}})
+        await store.async_flush()
+        await store.async_flush()
+
+    mock_save.assert_called_once_with({"overrides": {"window": {}}})
+    assert store.pending_write is False
+
+
+RESULTS = {
+    "window": {"direct": 500.0, "diffuse": 200.0, "combined": 700.0, "shading_recommended": True},
+    "global": {"direct": 500.0, "diffuse": 200.0, "combined": 700.0, "shading_recommended": True},
+}
+
+
+@pytest.mark.asyncio
+async def test_result_store_round_trip(hass):
+    """Test results survive the compact snapshot format."""
+    result_store = ResultStore(hass, "entry")
+
+    with patch.object(result_store._store, "async_load", return_value=ResultStore.compact(RESULTS)):
+        assert await result_store.async_load() == RESULTS
+
+
+@pytest.mark.asyncio
+async def test_result_store_ignores_old_snapshots(hass):
+    """Test snapshots older than the maximum age are not used."""
+    result_store = ResultStore(hass, "entry", max_age=timedelta(minutes=60))
+    snapshot = ResultStore.compact(RESULTS, dt_util.utcnow() - timedelta(minutes=61))
+
+    with patch.object(result_store._store, "async_load", return_value=snapshot):
+        assert await result_store.async_load() is None
+    with patch.object(result_store._store, "async_load", return_value=None):
+        assert await result_store.async_load() is None
+
+
+@pytest.mark.asyncio
+async def test_result_store_throttles_writes(hass):
+    """Test updates between two writes do not postpone the pending write."""
+    result_store = ResultStore(hass, "entry")
+
+    with patch.object(result_store._store, "async_delay_save") as mock_delay_save:
+        for _ in range(3):
+            result_store.async_schedule_save(lambda: RESULTS)
+
+    mock_delay_save.assert_called_once()
+    data_func, delay = mock_delay_save.call_args.args
+    assert delay == result_store.save_delay
+    assert data_func()["results"]["window"] == [500.0, 200.0, 700.0, True]
+    assert result_store.pending_write is False
@@ -1,7 +1,7 @@
 """Tests for subentry removal and entity cleanup."""
 
 from types import MappingProxyType
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.config_entries import ConfigEntry
@@ -21,26 +21,34 @@ from custom_components.solar_window_system.const import (
 from custom_components.solar_window_system.coordinator import (
     SolarCalculationCoordinator,
 )
+from custom_components.solar_window_system.reconcile import EntityReconciler
 
 
 @pytest.fixture
 def mock_hass_data(hass):
     """Fixture for mock hass.data setup."""
 
-    # Create mock coordinator
-    coordinator = MagicMock(spec=SolarCalculationCoordinator)
-    coordinator.groups = {
-        "test_group": {
-            "name": "Test Group",
-            "azimuth": 180,
-        }
-    }
-    coordinator.windows = {}
+    # Coordinator with one group and one window
+    coordinator = SolarCalculationCoordinator(
+        hass,
+        {},
+        {
+            "test_group": {"type": "group", "name": "Test Group", "azimuth": 180},
+            "test_window": {
+                "type": "window",
+                "name": "Test Window",
+                "geometry": {"azimuth": 180},
+            },
+        },
+        {},
+    )
+    coordinator.async_request_refresh = AsyncMock()
 
     # Setup hass.data
     hass.data[DOMAIN] = {
         "test_entry_id": {
             "coordinator": coordinator,
+            "reconciler": EntityReconciler(coordinator),
         }
     }
 
@@ -137,15 +145,7 @@ async def test_async_on_subentry_removes_window_entities(mock_hass_data):
     subentry_id = "test_window"
     subentry_type = "window"
 
-    # Setup coordinator with window data
     coordinator = hass.data[DOMAIN][entry_id]["coordinator"]
-    coordinator.windows = {
-        "test_window": {
-            "name": "Test Window",
-            "geometry": {"azimuth": 180},
-        }
-    }
-    coordinator.groups = {}
 
     # Create and register a real config entry in Home Assistant
     entry = ConfigEntry(